@@ -1,6 +1,8 @@
 """The VirtualPoolCare integration."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 from pathlib import Path
 
@@ -8,18 +10,29 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.components.frontend import add_extra_js_url
-from homeassistant.components.http import StaticPathConfig
 
-from .const import DOMAIN, SCAN_INTERVAL_HOURS
+from .const import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DOMAIN,
+    SCAN_INTERVAL_HOURS,
+    SIGNAL_ENTRY_UNLOADED,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    VALIDATION_RESULTS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+# Frontend card (bundled with lit), served under a content-hashed URL
+CARD_FILE = "pool-readings-bar-card.js"
+
 # Support both YAML and UI configuration
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -27,16 +40,26 @@ CONFIG_SCHEMA = vol.Schema(
             vol.Required("email"): cv.string,
             vol.Required("password"): cv.string,
             vol.Optional("update_interval_hours", default=6): cv.positive_int,
+            vol.Optional(
+                "max_concurrent_requests", default=DEFAULT_MAX_CONCURRENT_REQUESTS
+            ): cv.positive_int,
         })
     }, 
     extra=vol.ALLOW_EXTRA
 )
 
+FORCE_UPDATE_SCHEMA = vol.Schema({
+    vol.Optional("entry_id"): cv.string,
+    vol.Optional("device_serial"): cv.string,
+})
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the VirtualPoolCare component."""
-    # Register the frontend card
+    # Register the frontend card and the websocket commands it uses
     await _async_register_frontend_card(hass)
+    from .websocket_api import async_register_websocket_commands
+    async_register_websocket_commands(hass)
     
     # Handle YAML configuration
     if DOMAIN in config:
@@ -47,19 +70,58 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
     
     # Register force update service
-    async def handle_force_update_service(call):
+    async def handle_force_update_service(call: ServiceCall) -> ServiceResponse:
         """Handle the force update service call."""
-        coordinators = []
-        if DOMAIN in hass.data:
-            coordinators = list(hass.data[DOMAIN].values())
-        for coordinator in coordinators:
-            await coordinator.async_refresh()
+        entry_id = call.data.get("entry_id")
+        device_serial = call.data.get("device_serial")
+        
+        targets = []
+        for coordinator_entry_id, coordinator in hass.data.get(DOMAIN, {}).items():
+            if entry_id is not None and coordinator_entry_id != entry_id:
+                continue
+            if device_serial is not None and device_serial not in (coordinator.data or {}):
+                continue
+            targets.append((coordinator_entry_id, coordinator))
+        
+        # A target that matches nothing is most likely a typo; don't silently refresh nothing
+        if not targets and entry_id is not None and entry_id not in hass.data.get(DOMAIN, {}):
+            raise ServiceValidationError(f"Unknown VirtualPoolCare config entry: {entry_id}")
+        if not targets and device_serial is not None:
+            raise ServiceValidationError(f"Unknown VirtualPoolCare device: {device_serial}")
+        
+        # Refresh every targeted coordinator at the same time
+        results = await asyncio.gather(*(
+            coordinator.async_force_refresh(device_serial) for _, coordinator in targets
+        ))
         _LOGGER.info("VirtualPoolCare: Force update triggered via service call.")
+        return {
+            "refreshes": [
+                {"entry_id": coordinator_entry_id, **result}
+                for (coordinator_entry_id, _), result in zip(targets, results)
+            ]
+        }
 
     hass.services.async_register(
         DOMAIN,
         "force_update",
         handle_force_update_service,
+        schema=FORCE_UPDATE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    
+    # Register refresh pools service (drops the cached pools list)
+    async def handle_refresh_pools_service(call):
+        """Handle the refresh pools service call."""
+        # Refresh every coordinator at the same time, like force_update
+        await asyncio.gather(*(
+            coordinator.async_invalidate_pools() for coordinator in hass.data.get(DOMAIN, {}).values()
+        ))
+        _LOGGER.info("VirtualPoolCare: Pools list refresh triggered via service call.")
+
+    hass.services.async_register(
+        DOMAIN,
+        "refresh_pools",
+        handle_refresh_pools_service,
     )
     
     return True
@@ -71,23 +133,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     email = entry.data["email"]
     password = entry.data["password"]
     interval_hrs = entry.data.get("update_interval_hours", SCAN_INTERVAL_HOURS)
+    max_concurrent_requests = entry.data.get("max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS)
     
     from datetime import timedelta
-    from .sensor import VirtualPoolCareDataUpdateCoordinator
+    from .coordinator import VirtualPoolCareDataUpdateCoordinator
     
     update_interval = timedelta(hours=interval_hrs)
+    validation = hass.data.get(VALIDATION_RESULTS, {}).pop(entry.unique_id, None) or {}
     
     coordinator = VirtualPoolCareDataUpdateCoordinator(
         hass, 
         name=DOMAIN, 
         update_interval=update_interval,
         email=email,
-        password=password
+        password=password,
+        entry_id=entry.entry_id,
+        max_concurrent_requests=max_concurrent_requests,
+        # Reuse the login and pools list of the config flow that just created this entry
+        api=validation.get("api"),
     )
     
-    # THIS is where async_config_entry_first_refresh should be called
-    # The config entry is still in SETUP_IN_PROGRESS state here
-    await coordinator.async_config_entry_first_refresh()
+    # Restore the cached pools list so the first refresh can skip fetching it,
+    # and the last-known measurements so entities can be created right away
+    await coordinator.async_load_cache()
+    
+    if not coordinator.data and validation.get("data"):
+        # The config flow fetched every pool's measurements moments ago
+        coordinator.async_set_validation_data(validation["data"])
+    
+    if not coordinator.data:
+        # Nothing restored: fetch before creating entities
+        # The config entry is still in SETUP_IN_PROGRESS state here
+        await coordinator.async_config_entry_first_refresh()
     
     # Store coordinator for the sensor platform to use
     hass.data.setdefault(DOMAIN, {})
@@ -95,38 +172,68 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     # Forward setup to sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    
+    if coordinator.data_restored:
+        # Entities show the restored snapshot; replace it with live data without delaying startup
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh after restoring snapshot"
+        )
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        hass.data[DOMAIN].pop(entry.entry_id)
+        # Websocket subscriptions to the coordinator end; the card subscribes again
+        async_dispatcher_send(hass, SIGNAL_ENTRY_UNLOADED, entry.entry_id)
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted cache when a config entry is deleted."""
+    from homeassistant.helpers.storage import Store
+    
+    await Store(hass, STORAGE_VERSION, STORAGE_KEY.format(entry.entry_id)).async_remove()
 
 
 async def _async_register_frontend_card(hass: HomeAssistant) -> None:
     """Register the frontend card."""
     try:
-        # Get the path to our frontend file
-        frontend_path = Path(__file__).parent / "frontend"
-        card_file = frontend_path / "pool-readings-bar-card.js"
+        # Imported here so loading the integration does not pull in the frontend
+        from homeassistant.components.frontend import add_extra_js_url
+        from homeassistant.components.http import StaticPathConfig
+        
+        # The card is bundled with lit into a single file (scripts/build_frontend.py)
+        frontend_dir = Path(__file__).parent / "frontend"
+        card_path = str(frontend_dir / CARD_FILE)
+        frontend_url = await hass.async_add_executor_job(_frontend_url, frontend_dir)
         
-        if card_file.exists():
-            # Register the static path for our frontend files using the new async method
+        if frontend_url:
             await hass.http.async_register_static_paths([
-                StaticPathConfig(
-                    f"/{DOMAIN}", 
-                    str(frontend_path), 
-                    cache_headers=False
-                )
+                # The URL changes with the card's content, so browsers may cache it for long
+                StaticPathConfig(frontend_url, str(frontend_dir), cache_headers=True),
+                # The card's previous URL, for dashboards that added it as a resource by hand
+                StaticPathConfig(f"/{DOMAIN}/{CARD_FILE}", card_path, cache_headers=False),
             ])
             
             # Add the card to frontend automatically
-            card_url = f"/{DOMAIN}/pool-readings-bar-card.js"
+            card_url = f"{frontend_url}/{CARD_FILE}"
             add_extra_js_url(hass, card_url)
             
             _LOGGER.debug("VirtualPoolCare frontend card registered at %s", card_url)
         else:
-            _LOGGER.warning("VirtualPoolCare frontend card file not found at %s", card_file)
+            _LOGGER.warning("VirtualPoolCare frontend card file not found at %s", card_path)
             
     except Exception as e:
-        _LOGGER.error("Failed to register VirtualPoolCare frontend card: %s", e)
\ No newline at end of file
+        _LOGGER.error("Failed to register VirtualPoolCare frontend card: %s", e)
+
+
+def _frontend_url(frontend_dir: Path) -> str | None:
+    """Return the URL of the frontend directory with a hash of the card, or None if it is missing."""
+    try:
+        content = (frontend_dir / CARD_FILE).read_bytes()
+    except FileNotFoundError:
+        return None
+    return f"/{DOMAIN}/frontend-{hashlib.sha256(content).hexdigest()[:12]}"
@@ -10,9 +10,11 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
-from .virtualpoolcare_core import VirtualPoolCareAPI
+from .const import DEFAULT_MAX_CONCURRENT_REQUESTS, DOMAIN, VALIDATION_RESULTS
+from .virtualpoolcare_async import AsyncVirtualPoolCareAPI
+from .virtualpoolcare_core import VirtualPoolCareAuthError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,6 +23,9 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Required("email"): str,
         vol.Required("password"): str,
         vol.Optional("update_interval_hours", default=6): vol.All(vol.Coerce(int), vol.Range(min=1, max=24)),
+        vol.Optional(
+            "max_concurrent_requests", default=DEFAULT_MAX_CONCURRENT_REQUESTS
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
     }
 )
 
@@ -31,21 +36,24 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
     # Test the connection
-    api = VirtualPoolCareAPI(data["email"], data["password"])
+    api = AsyncVirtualPoolCareAPI(
+        data["email"],
+        data["password"],
+        session=async_get_clientsession(hass),
+        max_concurrent_requests=data.get("max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS),
+    )
     
     try:
-        # Test authentication by trying to fetch data
-        result = await hass.async_add_executor_job(api.fetch_data)
-        if not result:
-            raise InvalidAuth
+        # Test authentication by logging in and listing the pools
+        device_serial, data = await api.async_get_first_device()
         
         # Get device serial for unique ID
-        device_serial = result.get("blue_device_serial", "unknown")
-        if device_serial == "unknown":
+        if not device_serial:
             _LOGGER.warning("No device serial found in API response")
+            device_serial = "unknown"
         
-    except InvalidAuth:
-        raise
+    except VirtualPoolCareAuthError as exc:
+        raise InvalidAuth from exc
     except Exception as exc:
         _LOGGER.exception("Unexpected exception during validation")
         raise CannotConnect from exc
@@ -53,7 +61,9 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     # Return info that you want to store in the config entry.
     return {
         "title": f"VirtualPoolCare Pool ({device_serial})",
-        "device_serial": device_serial
+        "device_serial": device_serial,
+        "api": api,
+        "data": data,
     }
 
 
@@ -83,6 +93,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 await self.async_set_unique_id(info["device_serial"])
                 self._abort_if_unique_id_configured()
                 
+                # Let the new entry start from this login, pools list and any measurements
+                self.hass.data.setdefault(VALIDATION_RESULTS, {})[info["device_serial"]] = {
+                    "api": info["api"],
+                    "data": info["data"],
+                }
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
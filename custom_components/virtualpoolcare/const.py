@@ -1,4 +1,26 @@
 """Constants for the VirtualPoolCare integration."""
 
 DOMAIN = "virtualpoolcare"
-SCAN_INTERVAL_HOURS = 6
\ No newline at end of file
+SCAN_INTERVAL_HOURS = 6
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# force_update calls made while a forced refresh runs, or within this many
+# seconds of its start, share that refresh instead of starting another one
+FORCE_UPDATE_COALESCE_SECONDS = 10
+
+# Sensors are not polled; their data_freshness (fresh/old/stale) is checked
+# this often and the state written only when it changed
+FRESHNESS_CHECK_INTERVAL_SECONDS = 10 * 60
+
+# Persistent cache (pool index) kept in HA storage, one file per config entry
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.{{}}"
+STORAGE_SAVE_DELAY_SECONDS = 10
+
+# API client (with its login and pools list) and any measurements obtained
+# while validating a new config entry, keyed by unique ID, for that entry's
+# coordinator to reuse
+VALIDATION_RESULTS = f"{DOMAIN}_validation_results"
+
+# Dispatcher signal sent with the entry ID when a config entry is unloaded
+SIGNAL_ENTRY_UNLOADED = f"{DOMAIN}_entry_unloaded"
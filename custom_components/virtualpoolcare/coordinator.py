@@ -0,0 +1,264 @@
+"""Data update coordinator for the VirtualPoolCare integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    FORCE_UPDATE_COALESCE_SECONDS,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY_SECONDS,
+    STORAGE_VERSION,
+)
+from .measurements import PoolMeasurements
+from .virtualpoolcare_async import AsyncVirtualPoolCareAPI
+from .virtualpoolcare_core import PollScheduler, RollingStatistics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class VirtualPoolCareDataUpdateCoordinator(DataUpdateCoordinator):
+    """Manages fetching data from virtualpoolcare.io every X hours.
+
+    Data is a dict of PoolMeasurements per Blue device, keyed by blue_device_serial.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        update_interval: timedelta,
+        email: str,
+        password: str,
+        entry_id: str | None = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        api: AsyncVirtualPoolCareAPI | None = None,
+    ):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=name,
+            update_interval=update_interval,
+            # Unchanged responses return the same parsed objects; don't wake listeners
+            always_update=False,
+        )
+        # A client from the config flow already holds credentials and pools
+        self.api = api or AsyncVirtualPoolCareAPI(
+            email,
+            password,
+            session=async_get_clientsession(hass),
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        # YAML setups have no config entry; they share a single storage file
+        self.entry_id = entry_id or "yaml"
+        self.store = Store(hass, STORAGE_VERSION, STORAGE_KEY.format(self.entry_id))
+        self._saved_cache_version = None
+        # Epoch time the current data was fetched, and whether it was restored
+        # from the snapshot saved by a previous run rather than fetched live
+        self.data_fetched_at: float | None = None
+        self.data_restored = False
+        # 24h/7d mean, min, max and rate of change per reading
+        self.rolling = RollingStatistics()
+        # Polls follow the devices' measurement cadence, up to update_interval
+        self.scheduler = PollScheduler(update_interval.total_seconds())
+        # Sensor state writes skipped because their measurement was unchanged
+        self.suppressed_writes = 0
+        # Forced refreshes by target (None = all devices): (task, started at)
+        self._forced_refreshes: dict[str | None, tuple[asyncio.Task, float]] = {}
+
+    async def async_load_cache(self) -> None:
+        """Restore the pool index and the last-known data saved by a previous run."""
+        stored = await self.store.async_load() or {}
+        self.api.pool_index.restore(stored.get("pool_index"))
+        self.rolling.restore(stored.get("rolling"))
+        self._saved_cache_version = self._cache_version()
+        self._restore_snapshot(stored.get("snapshot"))
+
+    @callback
+    def _restore_snapshot(self, snapshot: dict | None) -> None:
+        """Use the persisted measurements as data until the first live refresh."""
+        if not snapshot or snapshot.get("fetched_at") is None:
+            return
+        data = {}
+        for device_serial, response in (snapshot.get("devices") or {}).items():
+            measurements = PoolMeasurements.from_response(response)
+            if measurements:
+                data[device_serial] = measurements
+        if not data:
+            return
+        self.data = data
+        self.data_fetched_at = snapshot["fetched_at"]
+        self.data_restored = True
+        _LOGGER.debug(
+            "Restored VirtualPoolCare data for %d devices fetched at %s",
+            len(data), self.data_fetched_at
+        )
+
+    @callback
+    def async_set_validation_data(self, data: dict) -> None:
+        """Use the measurements fetched by the config flow in place of a first refresh."""
+        self._async_data_fetched(data)
+        self._async_schedule_next_poll(data)
+        self.async_set_updated_data(data)
+
+    async def async_invalidate_pools(self) -> None:
+        """Forget the cached pools list and refresh with a freshly fetched one."""
+        self.api.pool_index.invalidate()
+        await self.async_refresh()
+
+    @callback
+    def _async_save_cache(self, data_changed: bool = False) -> None:
+        """
+        Schedule a save of the cache if it changed since the last save.
+
+        Args:
+            data_changed: Live data differing from the snapshot was just fetched
+        """
+        version = self._cache_version()
+        if version == self._saved_cache_version and not data_changed:
+            return
+        self._saved_cache_version = version
+        self.store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY_SECONDS)
+
+    @callback
+    def _cache_version(self) -> tuple:
+        """Return the versions of the persisted pool index and rolling statistics."""
+        return (self.api.pool_index.version, self.rolling.version)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Return the data persisted to HA storage."""
+        stored = {
+            "pool_index": self.api.pool_index.as_dict(),
+            "rolling": self.rolling.as_dict(),
+        }
+        if self.data and self.data_fetched_at is not None:
+            stored["snapshot"] = {
+                "fetched_at": self.data_fetched_at,
+                "devices": {
+                    device_serial: measurements.as_response()
+                    for device_serial, measurements in self.data.items()
+                },
+            }
+        return stored
+
+    @callback
+    def _async_data_fetched(self, data: dict) -> None:
+        """Mark `data` as live and add it to the rolling statistics.
+
+        Wakes listeners if it replaces an identical restored snapshot. The
+        snapshot is only saved again when the data changed or stops being
+        restored, not on every poll returning the same measurements.
+        """
+        self.data_fetched_at = time.time()
+        self.rolling.observe(data)
+        # Unchanged devices keep their parsed objects, so this compares by identity
+        self._async_save_cache(data_changed=self.data_restored or data != self.data)
+        if self.data_restored:
+            self.data_restored = False
+            # Changed data notifies listeners anyway, but entities showing an
+            # identical snapshot still need to drop their cached-data attributes
+            if data == self.data:
+                self.async_update_listeners()
+
+    async def async_refresh_device(self, device_serial: str) -> bool:
+        """Fetch one device's measurements and update it in the coordinator data."""
+        try:
+            measurements = await self.api.async_fetch_device_data(device_serial)
+        except Exception as err:
+            _LOGGER.warning("Error refreshing VirtualPoolCare device %s: %s", device_serial, err)
+            return False
+        if measurements is None:
+            return False
+
+        data = dict(self.data or {})
+        data[device_serial] = measurements
+        # Update the rolling statistics before listeners see the new data
+        self._async_data_fetched(data)
+        if data != self.data:
+            self.async_set_updated_data(data)
+        return True
+
+    async def async_force_refresh(self, device_serial: str | None = None) -> dict:
+        """
+        Refresh now, sharing a forced refresh that is running or just started.
+
+        Args:
+            device_serial: Only refresh this device (defaults to all devices)
+
+        Returns:
+            dict: success, coalesced, duration_ms and per-pool timings
+        """
+        for key in {None, device_serial}:
+            task, started = self._forced_refreshes.get(key, (None, 0.0))
+            if task is not None and (
+                not task.done() or time.monotonic() - started < FORCE_UPDATE_COALESCE_SECONDS
+            ):
+                result = await asyncio.shield(task)
+                return {**result, "coalesced": True}
+
+        task = self.hass.async_create_task(self._async_forced_refresh(device_serial))
+        self._forced_refreshes[device_serial] = (task, time.monotonic())
+        return await asyncio.shield(task)
+
+    async def _async_forced_refresh(self, device_serial: str | None) -> dict:
+        """Run a forced refresh and time it."""
+        start = time.perf_counter()
+        if device_serial is None:
+            await self.async_refresh()
+            success = self.last_update_success
+        else:
+            success = await self.async_refresh_device(device_serial)
+        return {
+            "success": success,
+            "coalesced": False,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+            "pools": self.api.pool_timings(None if device_serial is None else [device_serial]),
+        }
+
+    @callback
+    def async_diagnostics(self) -> dict:
+        """Return cache, dedup, scheduling, error-handling, statistics and refresh timing counters for diagnostics."""
+        return {
+            "last_update_success": self.last_update_success,
+            "update_interval_seconds": self.update_interval.total_seconds() if self.update_interval else None,
+            "devices": sorted(self.data or {}),
+            "data_fetched_at": self.data_fetched_at,
+            "data_restored": self.data_restored,
+            "credential_cache": self.api.credential_cache.stats(),
+            "pool_index": self.api.pool_index.stats(),
+            "response_fingerprints": self.api.response_fingerprints.stats(),
+            "poll_scheduler": self.scheduler.stats(),
+            "circuit_breaker": self.api.circuit_breaker.stats(),
+            "rolling_statistics": self.rolling.stats(),
+            "retried_requests": self.api.retried_requests,
+            "suppressed_writes": self.suppressed_writes,
+            "refresh_stats": self.api.refresh_stats.stats(),
+        }
+
+    async def _async_update_data(self) -> dict:
+        """Fetch data from virtualpoolcare.io on the event loop."""
+        try:
+            data = await self.api.async_fetch_all_data()
+        except Exception as err:
+            self._async_save_cache()
+            raise UpdateFailed(f"Error fetching VirtualPoolCare data: {err}") from err
+
+        self._async_data_fetched(data)
+        self._async_schedule_next_poll(data)
+        return data
+
+    @callback
+    def _async_schedule_next_poll(self, data: dict) -> None:
+        """Set the update interval from the devices' measurement cadence."""
+        self.scheduler.observe(data)
+        self.update_interval = timedelta(seconds=self.scheduler.next_interval())
+        _LOGGER.debug("Next VirtualPoolCare poll in %s", self.update_interval)
@@ -1,19 +1,8 @@
-import {
-  LitElement,
-  html,
-  css,
-} from "https://unpkg.com/lit-element@2.4.0/lit-element.js?module";
-
-class PoolReadingsBarCard extends LitElement {
-  static get properties() {
-    return {
-      hass: {},
-      config: {},
-    };
-  }
-
-  static get styles() {
-    return css`
+/*! lit 3.1.3 | Copyright 2017 Google LLC | SPDX-License-Identifier: BSD-3-Clause */
+const __css_tag=(()=>{let NODE_MODE=!1,global=globalThis,supportsAdoptingStyleSheets=global.ShadowRoot&&(global.ShadyCSS===void 0||global.ShadyCSS.nativeShadow)&&`adoptedStyleSheets`in Document.prototype&&`replace`in CSSStyleSheet.prototype,constructionToken=Symbol(),cssTagCache=/* @__PURE__ */ new WeakMap;class CSSResult{_$cssResult$=!0;constructor(cssText,strings,safeToken){if(safeToken!==constructionToken)throw Error("CSSResult is not constructable. Use `unsafeCSS` or `css` instead.");this.cssText=cssText,this._strings=strings}get styleSheet(){let styleSheet=this._styleSheet,strings=this._strings;if(supportsAdoptingStyleSheets&&styleSheet===void 0){let cacheable=strings!==void 0&&strings.length===1;cacheable&&(styleSheet=cssTagCache.get(strings)),styleSheet===void 0&&((this._styleSheet=styleSheet=new CSSStyleSheet).replaceSync(this.cssText),cacheable&&cssTagCache.set(strings,styleSheet))}return styleSheet}toString(){return this.cssText}}let textFromCSSResult=value=>{if(value._$cssResult$===!0)return value.cssText;if(typeof value==`number`)return value;throw Error(`Value passed to 'css' function must be a 'css' function result: ${value}. Use 'unsafeCSS' to pass non-literal values, but take care to ensure page security.`)},unsafeCSS=value=>new CSSResult(typeof value==`string`?value:String(value),void 0,constructionToken),css=(strings,...values)=>new CSSResult(strings.length===1?strings[0]:values.reduce((acc,v,idx)=>acc+textFromCSSResult(v)+strings[idx+1],strings[0]),strings,constructionToken),adoptStyles=(renderRoot,styles)=>{if(supportsAdoptingStyleSheets)renderRoot.adoptedStyleSheets=styles.map(s=>s instanceof CSSStyleSheet?s:s.styleSheet);else for(let s of styles){let style=document.createElement(`style`),nonce=global.litNonce;nonce!==void 0&&style.setAttribute(`nonce`,nonce),style.textContent=s.cssText,renderRoot.appendChild(style)}},cssResultFromStyleSheet=sheet=>{let cssText=``;for(let rule of sheet.cssRules)cssText+=rule.cssText;return unsafeCSS(cssText)};return{supportsAdoptingStyleSheets,CSSResult,unsafeCSS,css,adoptStyles,getCompatibleStyle:supportsAdoptingStyleSheets?s=>s:s=>s instanceof CSSStyleSheet?cssResultFromStyleSheet(s):s}})(),__reactive_element=(()=>{let{getCompatibleStyle,adoptStyles}=__css_tag,{is,defineProperty,getOwnPropertyDescriptor,getOwnPropertyNames,getOwnPropertySymbols,getPrototypeOf}=Object,NODE_MODE=!1,global=globalThis,DEV_MODE=!1,issueWarning,trustedTypes=global.trustedTypes,emptyStringForBooleanAttribute=trustedTypes?trustedTypes.emptyScript:``,polyfillSupport=global.reactiveElementPolyfillSupport,debugLogEvent,JSCompiler_renameProperty=(prop,_obj)=>prop,defaultConverter={toAttribute(value,type){switch(type){case Boolean:value=value?emptyStringForBooleanAttribute:null;break;case Object:case Array:value=value==null?value:JSON.stringify(value);break}return value},fromAttribute(value,type){let fromValue=value;switch(type){case Boolean:fromValue=value!==null;break;case Number:fromValue=value===null?null:Number(value);break;case Object:case Array:try{fromValue=JSON.parse(value)}catch{fromValue=null}break}return fromValue}},notEqual=(value,old)=>!is(value,old),defaultPropertyDeclaration={attribute:!0,type:String,converter:defaultConverter,reflect:!1,hasChanged:notEqual};Symbol.metadata??=Symbol(`metadata`),global.litPropertyMetadata??=/* @__PURE__ */ new WeakMap;class ReactiveElement extends HTMLElement{static addInitializer(initializer){this.__prepare(),(this._initializers??=[]).push(initializer)}static elementStyles=[];static get observedAttributes(){return this.finalize(),this.__attributeToPropertyMap&&[...this.__attributeToPropertyMap.keys()]}__instanceProperties=void 0;static createProperty(name,options=defaultPropertyDeclaration){if(options.state&&(options.attribute=!1),this.__prepare(),this.elementProperties.set(name,options),!options.noAccessor){let key=Symbol(),descriptor=this.getPropertyDescriptor(name,key,options);descriptor!==void 0&&defineProperty(this.prototype,name,descriptor)}}static getPropertyDescriptor(name,key,options){let{get,set}=getOwnPropertyDescriptor(this.prototype,name)??{get(){return this[key]},set(v){this[key]=v}};return{get(){return get?.call(this)},set(value){let oldValue=get?.call(this);set.call(this,value),this.requestUpdate(name,oldValue,options)},configurable:!0,enumerable:!0}}static getPropertyOptions(name){return this.elementProperties.get(name)??defaultPropertyDeclaration}static __prepare(){if(this.hasOwnProperty(JSCompiler_renameProperty(`elementProperties`,this)))return;let superCtor=getPrototypeOf(this);superCtor.finalize(),superCtor._initializers!==void 0&&(this._initializers=[...superCtor._initializers]),this.elementProperties=new Map(superCtor.elementProperties)}static finalize(){if(this.hasOwnProperty(JSCompiler_renameProperty(`finalized`,this)))return;if(this.finalized=!0,this.__prepare(),this.hasOwnProperty(JSCompiler_renameProperty(`properties`,this))){let props=this.properties,propKeys=[...getOwnPropertyNames(props),...getOwnPropertySymbols(props)];for(let p of propKeys)this.createProperty(p,props[p])}let metadata=this[Symbol.metadata];if(metadata!==null){let properties=litPropertyMetadata.get(metadata);if(properties!==void 0)for(let[p,options]of properties)this.elementProperties.set(p,options)}this.__attributeToPropertyMap=/* @__PURE__ */ new Map;for(let[p,options]of this.elementProperties){let attr=this.__attributeNameForProperty(p,options);attr!==void 0&&this.__attributeToPropertyMap.set(attr,p)}this.elementStyles=this.finalizeStyles(this.styles)}static shadowRootOptions={mode:`open`};static finalizeStyles(styles){let elementStyles=[];if(Array.isArray(styles)){let set=new Set(styles.flat(1/0).reverse());for(let s of set)elementStyles.unshift(getCompatibleStyle(s))}else styles!==void 0&&elementStyles.push(getCompatibleStyle(styles));return elementStyles}static __attributeNameForProperty(name,options){let attribute=options.attribute;return attribute===!1?void 0:typeof attribute==`string`?attribute:typeof name==`string`?name.toLowerCase():void 0}isUpdatePending=!1;hasUpdated=!1;__reflectingProperty=null;constructor(){super(),this.__initialize()}__initialize(){this.__updatePromise=new Promise(res=>this.enableUpdating=res),this._$changedProperties=/* @__PURE__ */ new Map,this.__saveInstanceProperties(),this.requestUpdate(),this.constructor._initializers?.forEach(i=>i(this))}addController(controller){(this.__controllers??=/* @__PURE__ */ new Set).add(controller),this.renderRoot!==void 0&&this.isConnected&&controller.hostConnected?.()}removeController(controller){this.__controllers?.delete(controller)}__saveInstanceProperties(){let instanceProperties=/* @__PURE__ */ new Map,elementProperties=this.constructor.elementProperties;for(let p of elementProperties.keys())this.hasOwnProperty(p)&&(instanceProperties.set(p,this[p]),delete this[p]);instanceProperties.size>0&&(this.__instanceProperties=instanceProperties)}createRenderRoot(){let renderRoot=this.shadowRoot??this.attachShadow(this.constructor.shadowRootOptions);return adoptStyles(renderRoot,this.constructor.elementStyles),renderRoot}connectedCallback(){this.renderRoot??=this.createRenderRoot(),this.enableUpdating(!0),this.__controllers?.forEach(c=>c.hostConnected?.())}enableUpdating(_requestedUpdate){}disconnectedCallback(){this.__controllers?.forEach(c=>c.hostDisconnected?.())}attributeChangedCallback(name,_old,value){this._$attributeToProperty(name,value)}__propertyToAttribute(name,value){let options=this.constructor.elementProperties.get(name),attr=this.constructor.__attributeNameForProperty(name,options);if(attr!==void 0&&options.reflect===!0){let attrValue=(options.converter?.toAttribute===void 0?defaultConverter:options.converter).toAttribute(value,options.type);this.__reflectingProperty=name,attrValue==null?this.removeAttribute(attr):this.setAttribute(attr,attrValue),this.__reflectingProperty=null}}_$attributeToProperty(name,value){let ctor=this.constructor,propName=ctor.__attributeToPropertyMap.get(name);if(propName!==void 0&&this.__reflectingProperty!==propName){let options=ctor.getPropertyOptions(propName),converter=typeof options.converter==`function`?{fromAttribute:options.converter}:options.converter?.fromAttribute===void 0?defaultConverter:options.converter;this.__reflectingProperty=propName,this[propName]=converter.fromAttribute(value,options.type),this.__reflectingProperty=null}}requestUpdate(name,oldValue,options){if(name!==void 0){options??=this.constructor.getPropertyOptions(name);let hasChanged=options.hasChanged??notEqual,newValue=this[name];if(hasChanged(newValue,oldValue))this._$changeProperty(name,oldValue,options);else return}this.isUpdatePending===!1&&(this.__updatePromise=this.__enqueueUpdate())}_$changeProperty(name,oldValue,options){this._$changedProperties.has(name)||this._$changedProperties.set(name,oldValue),options.reflect===!0&&this.__reflectingProperty!==name&&(this.__reflectingProperties??=/* @__PURE__ */ new Set).add(name)}async __enqueueUpdate(){this.isUpdatePending=!0;try{await this.__updatePromise}catch(e){Promise.reject(e)}let result=this.scheduleUpdate();return result!=null&&await result,!this.isUpdatePending}scheduleUpdate(){return this.performUpdate()}performUpdate(){if(!this.isUpdatePending)return;if(!this.hasUpdated){if(this.renderRoot??=this.createRenderRoot(),this.__instanceProperties){for(let[p,value]of this.__instanceProperties)this[p]=value;this.__instanceProperties=void 0}let elementProperties=this.constructor.elementProperties;if(elementProperties.size>0)for(let[p,options]of elementProperties)options.wrapped===!0&&!this._$changedProperties.has(p)&&this[p]!==void 0&&this._$changeProperty(p,this[p],options)}let shouldUpdate=!1,changedProperties=this._$changedProperties;try{shouldUpdate=this.shouldUpdate(changedProperties),shouldUpdate?(this.willUpdate(changedProperties),this.__controllers?.forEach(c=>c.hostUpdate?.()),this.update(changedProperties)):this.__markUpdated()}catch(e){throw shouldUpdate=!1,this.__markUpdated(),e}shouldUpdate&&this._$didUpdate(changedProperties)}willUpdate(_changedProperties){}_$didUpdate(changedProperties){this.__controllers?.forEach(c=>c.hostUpdated?.()),this.hasUpdated||(this.hasUpdated=!0,this.firstUpdated(changedProperties)),this.updated(changedProperties)}__markUpdated(){this._$changedProperties=/* @__PURE__ */ new Map,this.isUpdatePending=!1}get updateComplete(){return this.getUpdateComplete()}getUpdateComplete(){return this.__updatePromise}shouldUpdate(_changedProperties){return!0}update(_changedProperties){this.__reflectingProperties&&=this.__reflectingProperties.forEach(p=>this.__propertyToAttribute(p,this[p])),this.__markUpdated()}updated(_changedProperties){}firstUpdated(_changedProperties){}}return ReactiveElement[JSCompiler_renameProperty(`elementProperties`,ReactiveElement)]=/* @__PURE__ */ new Map,ReactiveElement[JSCompiler_renameProperty(`finalized`,ReactiveElement)]=/* @__PURE__ */ new Map,polyfillSupport?.({ReactiveElement}),(global.reactiveElementVersions??=[]).push(`2.0.4`),{...__css_tag,defaultConverter,notEqual,ReactiveElement}})(),__lit_html=(()=>{let DEV_MODE=!1,ENABLE_EXTRA_SECURITY_HOOKS=!1,ENABLE_SHADYDOM_NOPATCH=!1,NODE_MODE=!1,global=globalThis,debugLogEvent,debugLogRenderId=0,issueWarning,wrap=node=>node,trustedTypes=global.trustedTypes,policy=trustedTypes?trustedTypes.createPolicy(`lit-html`,{createHTML:s=>s}):void 0,identityFunction=value=>value,noopSanitizer=(_node,_name,_type)=>identityFunction,setSanitizer=newSanitizer=>{},_testOnlyClearSanitizerFactoryDoNotCallOrElse=()=>{sanitizerFactoryInternal=noopSanitizer},createSanitizer=(node,name,type)=>sanitizerFactoryInternal(node,name,type),boundAttributeSuffix=`$lit$`,marker=`lit$${Math.random().toFixed(9).slice(2)}$`,markerMatch=`?`+marker,nodeMarker=`<${markerMatch}>`,d=document,createMarker=()=>d.createComment(``),isPrimitive=value=>value===null||typeof value!=`object`&&typeof value!=`function`,isArray=Array.isArray,isIterable=value=>isArray(value)||typeof value?.[Symbol.iterator]==`function`,SPACE_CHAR=`[ 	
+\f\r]`,ATTR_VALUE_CHAR=`[^ 	
+\f\r"'\`<>=]`,NAME_CHAR=`[^\\s"'>=/]`,textEndRegex=/<(?:(!--|\/[^a-zA-Z])|(\/?[a-zA-Z][^>\s]*)|(\/?$))/g,COMMENT_START=1,TAG_NAME=2,DYNAMIC_TAG_NAME=3,commentEndRegex=/-->/g,comment2EndRegex=/>/g,tagEndRegex=RegExp(`>|${SPACE_CHAR}(?:([^\\s"'>=/]+)(${SPACE_CHAR}*=${SPACE_CHAR}*(?:[^ 	
+"'\`<>=]|("|')|))|$)`,`g`),ENTIRE_MATCH=0,ATTRIBUTE_NAME=1,SPACES_AND_EQUALS=2,QUOTE_CHAR=3,singleQuoteAttrEndRegex=/'/g,doubleQuoteAttrEndRegex=/"/g,rawTextElement=/^(?:script|style|textarea|title)$/i,HTML_RESULT=1,SVG_RESULT=2,ATTRIBUTE_PART=1,CHILD_PART=2,PROPERTY_PART=3,BOOLEAN_ATTRIBUTE_PART=4,EVENT_PART=5,ELEMENT_PART=6,COMMENT_PART=7,tag=type=>(strings,...values)=>({_$litType$:type,strings,values}),html=tag(1),svg=tag(2),noChange=Symbol.for(`lit-noChange`),nothing=Symbol.for(`lit-nothing`),templateCache=/* @__PURE__ */ new WeakMap,walker=d.createTreeWalker(d,129),sanitizerFactoryInternal=noopSanitizer;function trustFromTemplateString(tsa,stringFromTSA){if(!Array.isArray(tsa)||!tsa.hasOwnProperty(`raw`)){let message=`invalid template strings array`;throw Error(`invalid template strings array`)}return policy===void 0?stringFromTSA:policy.createHTML(stringFromTSA)}let getTemplateHtml=(strings,type)=>{let l=strings.length-1,attrNames=[],html=type===2?`<svg>`:``,rawTextEndRegex,regex=textEndRegex;for(let i=0;i<l;i++){let s=strings[i],attrNameEndIndex=-1,attrName,lastIndex=0,match;for(;lastIndex<s.length&&(regex.lastIndex=lastIndex,match=regex.exec(s),match!==null);)lastIndex=regex.lastIndex,regex===textEndRegex?match[1]===`!--`?regex=commentEndRegex:match[1]===void 0?match[2]===void 0?match[3]!==void 0&&(regex=tagEndRegex):(rawTextElement.test(match[2])&&(rawTextEndRegex=RegExp(`</${match[2]}`,`g`)),regex=tagEndRegex):regex=comment2EndRegex:regex===tagEndRegex?match[0]===`>`?(regex=rawTextEndRegex??textEndRegex,attrNameEndIndex=-1):match[1]===void 0?attrNameEndIndex=-2:(attrNameEndIndex=regex.lastIndex-match[2].length,attrName=match[1],regex=match[3]===void 0?tagEndRegex:match[3]===`"`?doubleQuoteAttrEndRegex:singleQuoteAttrEndRegex):regex===doubleQuoteAttrEndRegex||regex===singleQuoteAttrEndRegex?regex=tagEndRegex:regex===commentEndRegex||regex===comment2EndRegex?regex=textEndRegex:(regex=tagEndRegex,rawTextEndRegex=void 0);let end=regex===tagEndRegex&&strings[i+1].startsWith(`/>`)?` `:``;html+=regex===textEndRegex?s+nodeMarker:attrNameEndIndex>=0?(attrNames.push(attrName),s.slice(0,attrNameEndIndex)+boundAttributeSuffix+s.slice(attrNameEndIndex))+marker+end:s+marker+(attrNameEndIndex===-2?i:end)}return[trustFromTemplateString(strings,html+(strings[l]||`<?>`)+(type===2?`</svg>`:``)),attrNames]};class Template{el;parts=[];constructor({strings,_$litType$:type},options){let node,nodeIndex=0,attrNameIndex=0,partCount=strings.length-1,parts=this.parts,[html,attrNames]=getTemplateHtml(strings,type);if(this.el=Template.createElement(html,options),walker.currentNode=this.el.content,type===2){let svgElement=this.el.content.firstChild;svgElement.replaceWith(...svgElement.childNodes)}for(;(node=walker.nextNode())!==null&&parts.length<partCount;){if(node.nodeType===1){if(node.hasAttributes())for(let name of node.getAttributeNames())if(name.endsWith(boundAttributeSuffix)){let realName=attrNames[attrNameIndex++],statics=node.getAttribute(name).split(marker),m=/([.?@])?(.*)/.exec(realName);parts.push({type:1,index:nodeIndex,name:m[2],strings:statics,ctor:m[1]===`.`?PropertyPart:m[1]===`?`?BooleanAttributePart:m[1]===`@`?EventPart:AttributePart}),node.removeAttribute(name)}else name.startsWith(marker)&&(parts.push({type:6,index:nodeIndex}),node.removeAttribute(name));if(rawTextElement.test(node.tagName)){let strings=node.textContent.split(marker),lastIndex=strings.length-1;if(lastIndex>0){node.textContent=trustedTypes?trustedTypes.emptyScript:``;for(let i=0;i<lastIndex;i++)node.append(strings[i],createMarker()),walker.nextNode(),parts.push({type:2,index:++nodeIndex});node.append(strings[lastIndex],createMarker())}}}else if(node.nodeType===8)if(node.data===markerMatch)parts.push({type:2,index:nodeIndex});else{let i=-1;for(;(i=node.data.indexOf(marker,i+1))!==-1;)parts.push({type:7,index:nodeIndex}),i+=marker.length-1}nodeIndex++}}static createElement(html,_options){let el=d.createElement(`template`);return el.innerHTML=html,el}}function resolveDirective(part,value,parent=part,attributeIndex){if(value===noChange)return value;let currentDirective=attributeIndex===void 0?parent.__directive:parent.__directives?.[attributeIndex],nextDirectiveConstructor=isPrimitive(value)?void 0:value._$litDirective$;return currentDirective?.constructor!==nextDirectiveConstructor&&(currentDirective?._$notifyDirectiveConnectionChanged?.(!1),nextDirectiveConstructor===void 0?currentDirective=void 0:(currentDirective=new nextDirectiveConstructor(part),currentDirective._$initialize(part,parent,attributeIndex)),attributeIndex===void 0?parent.__directive=currentDirective:(parent.__directives??=[])[attributeIndex]=currentDirective),currentDirective!==void 0&&(value=resolveDirective(part,currentDirective._$resolve(part,value.values),currentDirective,attributeIndex)),value}class TemplateInstance{_$parts=[];_$parent;_$disconnectableChildren=void 0;constructor(template,parent){this._$template=template,this._$parent=parent}get parentNode(){return this._$parent.parentNode}get _$isConnected(){return this._$parent._$isConnected}_clone(options){let{el:{content},parts}=this._$template,fragment=(options?.creationScope??d).importNode(content,!0);walker.currentNode=fragment;let node=walker.nextNode(),nodeIndex=0,partIndex=0,templatePart=parts[0];for(;templatePart!==void 0;){if(nodeIndex===templatePart.index){let part;templatePart.type===2?part=new ChildPart(node,node.nextSibling,this,options):templatePart.type===1?part=new templatePart.ctor(node,templatePart.name,templatePart.strings,this,options):templatePart.type===6&&(part=new ElementPart(node,this,options)),this._$parts.push(part),templatePart=parts[++partIndex]}nodeIndex!==templatePart?.index&&(node=walker.nextNode(),nodeIndex++)}return walker.currentNode=d,fragment}_update(values){let i=0;for(let part of this._$parts)part!==void 0&&(part.strings===void 0?part._$setValue(values[i]):(part._$setValue(values,part,i),i+=part.strings.length-2)),i++}}class ChildPart{type=2;_$committedValue=nothing;__directive;_$startNode;_$endNode;_$parent;get _$isConnected(){return this._$parent?._$isConnected??this.__isConnected}_$disconnectableChildren=void 0;constructor(startNode,endNode,parent,options){this._$startNode=startNode,this._$endNode=endNode,this._$parent=parent,this.options=options,this.__isConnected=options?.isConnected??!0}get parentNode(){let parentNode=wrap(this._$startNode).parentNode,parent=this._$parent;return parent!==void 0&&parentNode?.nodeType===11&&(parentNode=parent.parentNode),parentNode}get startNode(){return this._$startNode}get endNode(){return this._$endNode}_$setValue(value,directiveParent=this){value=resolveDirective(this,value,directiveParent),isPrimitive(value)?value===nothing||value==null||value===``?(this._$committedValue!==nothing&&this._$clear(),this._$committedValue=nothing):value!==this._$committedValue&&value!==noChange&&this._commitText(value):value._$litType$===void 0?value.nodeType===void 0?isIterable(value)?this._commitIterable(value):this._commitText(value):this._commitNode(value):this._commitTemplateResult(value)}_insert(node){return wrap(wrap(this._$startNode).parentNode).insertBefore(node,this._$endNode)}_commitNode(value){this._$committedValue!==value&&(this._$clear(),this._$committedValue=this._insert(value))}_commitText(value){if(this._$committedValue!==nothing&&isPrimitive(this._$committedValue)){let node=wrap(this._$startNode).nextSibling;node.data=value}else this._commitNode(d.createTextNode(value));this._$committedValue=value}_commitTemplateResult(result){let{values,_$litType$:type}=result,template=typeof type==`number`?this._$getTemplate(result):(type.el===void 0&&(type.el=Template.createElement(trustFromTemplateString(type.h,type.h[0]),this.options)),type);if(this._$committedValue?._$template===template)this._$committedValue._update(values);else{let instance=new TemplateInstance(template,this),fragment=instance._clone(this.options);instance._update(values),this._commitNode(fragment),this._$committedValue=instance}}_$getTemplate(result){let template=templateCache.get(result.strings);return template===void 0&&templateCache.set(result.strings,template=new Template(result)),template}_commitIterable(value){isArray(this._$committedValue)||(this._$committedValue=[],this._$clear());let itemParts=this._$committedValue,partIndex=0,itemPart;for(let item of value)partIndex===itemParts.length?itemParts.push(itemPart=new ChildPart(this._insert(createMarker()),this._insert(createMarker()),this,this.options)):itemPart=itemParts[partIndex],itemPart._$setValue(item),partIndex++;partIndex<itemParts.length&&(this._$clear(itemPart&&wrap(itemPart._$endNode).nextSibling,partIndex),itemParts.length=partIndex)}_$clear(start=wrap(this._$startNode).nextSibling,from){for(this._$notifyConnectionChanged?.(!1,!0,from);start&&start!==this._$endNode;){let n=wrap(start).nextSibling;wrap(start).remove(),start=n}}setConnected(isConnected){this._$parent===void 0&&(this.__isConnected=isConnected,this._$notifyConnectionChanged?.(isConnected))}}class AttributePart{type=1;_$committedValue=nothing;__directives;_$parent;_$disconnectableChildren=void 0;get tagName(){return this.element.tagName}get _$isConnected(){return this._$parent._$isConnected}constructor(element,name,strings,parent,options){this.element=element,this.name=name,this._$parent=parent,this.options=options,strings.length>2||strings[0]!==``||strings[1]!==``?(this._$committedValue=Array(strings.length-1).fill(/* @__PURE__ */ new String),this.strings=strings):this._$committedValue=nothing}_$setValue(value,directiveParent=this,valueIndex,noCommit){let strings=this.strings,change=!1;if(strings===void 0)value=resolveDirective(this,value,directiveParent,0),change=!isPrimitive(value)||value!==this._$committedValue&&value!==noChange,change&&(this._$committedValue=value);else{let values=value;value=strings[0];let i,v;for(i=0;i<strings.length-1;i++)v=resolveDirective(this,values[valueIndex+i],directiveParent,i),v===noChange&&(v=this._$committedValue[i]),change||=!isPrimitive(v)||v!==this._$committedValue[i],v===nothing?value=nothing:value!==nothing&&(value+=(v??``)+strings[i+1]),this._$committedValue[i]=v}change&&!noCommit&&this._commitValue(value)}_commitValue(value){value===nothing?wrap(this.element).removeAttribute(this.name):wrap(this.element).setAttribute(this.name,value??``)}}class PropertyPart extends AttributePart{type=3;_commitValue(value){this.element[this.name]=value===nothing?void 0:value}}class BooleanAttributePart extends AttributePart{type=4;_commitValue(value){wrap(this.element).toggleAttribute(this.name,!!value&&value!==nothing)}}class EventPart extends AttributePart{type=5;constructor(element,name,strings,parent,options){super(element,name,strings,parent,options)}_$setValue(newListener,directiveParent=this){if(newListener=resolveDirective(this,newListener,directiveParent,0)??nothing,newListener===noChange)return;let oldListener=this._$committedValue,shouldRemoveListener=newListener===nothing&&oldListener!==nothing||newListener.capture!==oldListener.capture||newListener.once!==oldListener.once||newListener.passive!==oldListener.passive,shouldAddListener=newListener!==nothing&&(oldListener===nothing||shouldRemoveListener);shouldRemoveListener&&this.element.removeEventListener(this.name,this,oldListener),shouldAddListener&&this.element.addEventListener(this.name,this,newListener),this._$committedValue=newListener}handleEvent(event){typeof this._$committedValue==`function`?this._$committedValue.call(this.options?.host??this.element,event):this._$committedValue.handleEvent(event)}}class ElementPart{__directive;_$parent;_$disconnectableChildren;constructor(element,parent,options){this.element=element,this.type=6,this._$disconnectableChildren=void 0,this._$parent=parent,this.options=options}get _$isConnected(){return this._$parent._$isConnected}_$setValue(value){resolveDirective(this,value)}}let _$LH={_boundAttributeSuffix:boundAttributeSuffix,_marker:marker,_markerMatch:markerMatch,_HTML_RESULT:1,_getTemplateHtml:getTemplateHtml,_TemplateInstance:TemplateInstance,_isIterable:isIterable,_resolveDirective:resolveDirective,_ChildPart:ChildPart,_AttributePart:AttributePart,_BooleanAttributePart:BooleanAttributePart,_EventPart:EventPart,_PropertyPart:PropertyPart,_ElementPart:ElementPart},polyfillSupport=global.litHtmlPolyfillSupport;polyfillSupport?.(Template,ChildPart),(global.litHtmlVersions??=[]).push(`3.1.3`);let render=(value,container,options)=>{let renderId=0,partOwnerNode=options?.renderBefore??container,part=partOwnerNode._$litPart$;if(part===void 0){let endNode=options?.renderBefore??null;partOwnerNode._$litPart$=part=new ChildPart(container.insertBefore(createMarker(),endNode),endNode,void 0,options??{})}return part._$setValue(value),part};return{html,svg,noChange,nothing,_$LH,render}})(),{LitElement,html,css}=(()=>{let{ReactiveElement}=__reactive_element,{render,noChange}=__lit_html,JSCompiler_renameProperty=(prop,_obj)=>prop,DEV_MODE=!1,issueWarning;class LitElement extends ReactiveElement{static _$litElement$=!0;renderOptions={host:this};__childPart=void 0;createRenderRoot(){let renderRoot=super.createRenderRoot();return this.renderOptions.renderBefore??=renderRoot.firstChild,renderRoot}update(changedProperties){let value=this.render();this.hasUpdated||(this.renderOptions.isConnected=this.isConnected),super.update(changedProperties),this.__childPart=render(value,this.renderRoot,this.renderOptions)}connectedCallback(){super.connectedCallback(),this.__childPart?.setConnected(!0)}disconnectedCallback(){super.disconnectedCallback(),this.__childPart?.setConnected(!1)}render(){return noChange}}LitElement[JSCompiler_renameProperty(`finalized`,LitElement)]=!0,globalThis.litElementHydrateSupport?.({LitElement});let polyfillSupport=globalThis.litElementPolyfillSupport;polyfillSupport?.({LitElement});let _$LE={_$attributeToProperty:(el,name,value)=>{el._$attributeToProperty(name,value)},_$changedProperties:el=>el._$changedProperties};return(globalThis.litElementVersions??=[]).push(`4.0.5`),{...__reactive_element,...__lit_html,LitElement,_$LE}})(),READINGS=[`temperature`,`ph`,`orp`,`salinity`],READING_ENTITY_PATTERN=/^sensor\.virtualpoolcare_([^_]+)_(temperature|ph|orp|salinity)$/,RESUBSCRIBE_DELAY_MS=5e3;class PoolReadingsBarCard extends LitElement{static get properties(){return{hass:{},config:{},_readings:{}}}static get styles(){return css`
       :host {
         display: block;
         padding: 20px;
@@ -156,333 +145,20 @@ class PoolReadingsBarCard extends LitElement {
       .thermometer-icon {
         fill: currentColor;
       }
-    `;
-  }
-
-  setConfig(config) {
-    this.config = {
-      device_serial: config.device_serial || null, // Make optional
-      title: config.title || "Latest measurement",
-      show_timestamp: config.show_timestamp !== false,
-      ...config,
-    };
-    
-    // No error thrown if device_serial is missing - we'll auto-detect
-  }
-
-  findVirtualPoolCareEntities() {
-    // Look for any entities that contain virtualpoolcare and our reading types
-    const allEntities = Object.keys(this.hass.states);
-    const poolEntities = allEntities.filter(id => 
-      id.includes('virtualpoolcare') && 
-      (id.includes('temperature') || id.includes('ph') || id.includes('orp') || id.includes('salinity'))
-    );
-    
-    console.log("All entities containing 'virtualpoolcare':", allEntities.filter(id => id.includes('virtualpoolcare')));
-    console.log("Pool reading entities found:", poolEntities);
-    
-    // Auto-detect device serial from first entity if not configured
-    if (!this.config.device_serial && poolEntities.length > 0) {
-      const match = poolEntities[0].match(/sensor\.virtualpoolcare_([^_]+)_/);
-      if (match) {
-        this.config.device_serial = match[1];
-        console.log("Auto-detected device serial:", this.config.device_serial);
-      }
-    }
-    
-    return poolEntities;
-  }
-
-  getSensorValue(readingName) {
-    // Auto-detect entities if no device serial configured
-    if (!this.config.device_serial) {
-      this.findVirtualPoolCareEntities();
-    }
-    
-    // First try the expected pattern with configured/detected device serial
-    if (this.config.device_serial) {
-      const entityId = `sensor.virtualpoolcare_${this.config.device_serial}_${readingName}`;
-      let entity = this.hass.states[entityId];
-      
-      if (entity) {
-        console.log(`Found entity with expected pattern: ${entityId}`);
-        return parseFloat(entity.state);
-      }
-      
-      // Try lowercase serial
-      const entityIdLower = `sensor.virtualpoolcare_${this.config.device_serial.toLowerCase()}_${readingName}`;
-      entity = this.hass.states[entityIdLower];
-      
-      if (entity) {
-        console.log(`Found entity with lowercase serial: ${entityIdLower}`);
-        return parseFloat(entity.state);
-      }
-    }
-    
-    // Fallback: search for any entity containing both virtualpoolcare and the reading name
-    const allEntities = Object.keys(this.hass.states);
-    const matchingEntity = allEntities.find(id => 
-      id.includes('virtualpoolcare') && 
-      id.includes(readingName) &&
-      id.startsWith('sensor.')
-    );
-    
-    if (matchingEntity) {
-      console.log(`Found entity by search: ${matchingEntity} for reading: ${readingName}`);
-      return parseFloat(this.hass.states[matchingEntity].state);
-    }
-    
-    console.log(`No entity found for reading: ${readingName}`);
-    return null;
-  }
-
-  getSensorAttributes(readingName) {
-    // Auto-detect entities if no device serial configured
-    if (!this.config.device_serial) {
-      this.findVirtualPoolCareEntities();
-    }
-    
-    // Same logic as getSensorValue but return attributes
-    if (this.config.device_serial) {
-      const entityId = `sensor.virtualpoolcare_${this.config.device_serial}_${readingName}`;
-      let entity = this.hass.states[entityId];
-      
-      if (entity) {
-        return entity.attributes;
-      }
-      
-      // Try lowercase serial
-      const entityIdLower = `sensor.virtualpoolcare_${this.config.device_serial.toLowerCase()}_${readingName}`;
-      entity = this.hass.states[entityIdLower];
-      
-      if (entity) {
-        return entity.attributes;
-      }
-    }
-    
-    // Fallback: search for any entity
-    const allEntities = Object.keys(this.hass.states);
-    const matchingEntity = allEntities.find(id => 
-      id.includes('virtualpoolcare') && 
-      id.includes(readingName) &&
-      id.startsWith('sensor.')
-    );
-    
-    if (matchingEntity) {
-      return this.hass.states[matchingEntity].attributes;
-    }
-    
-    return {};
-  }
-
-  getReadingConfig(readingName) {
-    const attributes = this.getSensorAttributes(readingName);
-    
-    return {
-      gauge_min: attributes.gauge_min,
-      gauge_max: attributes.gauge_max,
-      ok_min: attributes.ok_min,
-      ok_max: attributes.ok_max,
-      warning_low: attributes.warning_low,
-      warning_high: attributes.warning_high,
-      expired: attributes.expired || false,
-      timestamp: attributes.timestamp,
-      last_measurement: attributes.last_measurement,
-      data_freshness: attributes.data_freshness
-    };
-  }
-
-  createSegments(config) {
-    if (config.gauge_min === undefined || config.gauge_max === undefined) {
-      return [];
-    }
-
-    const { gauge_min, gauge_max, ok_min, ok_max, warning_low, warning_high } = config;
-    const totalRange = gauge_max - gauge_min;
-    const segments = [];
-
-    // Red zone (below warning_low)
-    if (warning_low > gauge_min) {
-      segments.push({
-        start: gauge_min,
-        end: warning_low,
-        color: "#f44336",
-        width: ((warning_low - gauge_min) / totalRange) * 100
-      });
-    }
-
-    // Orange zone (warning_low to ok_min)
-    if (ok_min > warning_low) {
-      segments.push({
-        start: warning_low,
-        end: ok_min,
-        color: "#ff9800",
-        width: ((ok_min - warning_low) / totalRange) * 100
-      });
-    }
-
-    // Blue zone (ok_min to ok_max) - matching the official design
-    segments.push({
-      start: ok_min,
-      end: ok_max,
-      color: "#2196f3",
-      width: ((ok_max - ok_min) / totalRange) * 100
-    });
-
-    // Orange zone (ok_max to warning_high)
-    if (warning_high > ok_max) {
-      segments.push({
-        start: ok_max,
-        end: warning_high,
-        color: "#ff9800",
-        width: ((warning_high - ok_max) / totalRange) * 100
-      });
-    }
-
-    // Red zone (above warning_high)
-    if (gauge_max > warning_high) {
-      segments.push({
-        start: warning_high,
-        end: gauge_max,
-        color: "#f44336",
-        width: ((gauge_max - warning_high) / totalRange) * 100
-      });
-    }
-
-    return segments;
-  }
-
-  getValuePosition(value, config) {
-    if (value === null || value === undefined || config.gauge_min === undefined || config.gauge_max === undefined) {
-      return null;
-    }
-    const range = config.gauge_max - config.gauge_min;
-    const position = ((value - config.gauge_min) / range) * 100;
-    return Math.max(0, Math.min(100, position));
-  }
-
-  getBubbleClass(readingName, value, config) {
-    // Match bubble colors to the official design
-    // Check if value is out of range first
-    if (value !== null && config.gauge_min !== undefined && config.gauge_max !== undefined) {
-      if (value < config.gauge_min || value > config.gauge_max) {
-        return 'red-bubble';
-      }
-    }
-
-    if (value === null || config.ok_min === undefined) {
-      return 'default-bubble';
-    }
-
-    // Return color based on which range the value falls into
-    if (value < config.warning_low) {
-      return 'red-bubble';
-    } else if (value < config.ok_min) {
-      return 'orange-bubble';
-    } else if (value <= config.ok_max) {
-      return 'blue-bubble';
-    } else if (value <= config.warning_high) {
-      return 'orange-bubble';
-    } else {
-      return 'red-bubble';
-    }
-  }
-
-  getUnitOfMeasurement(readingName) {
-    const unitMapping = {
-      "temperature": "°C",
-      "ph": "",
-      "orp": "mV", 
-      "salinity": "g/l"
-    };
-    return unitMapping[readingName] || "";
-  }
-
-  getReadingLabel(readingName) {
-    const labelMapping = {
-      "temperature": "Temperature",
-      "ph": "pH",
-      "orp": "ORP",
-      "salinity": "Salinity"
-    };
-    return labelMapping[readingName] || readingName;
-  }
-
-  formatTimestamp(timestamp) {
-    if (!timestamp) return '';
-    
-    try {
-      const date = new Date(timestamp);
-      const now = new Date();
-      const diffMs = now - date;
-      const diffHours = Math.floor(diffMs / (1000 * 60 * 60));
-      const diffMins = Math.floor(diffMs / (1000 * 60));
-      
-      const locale = this.hass?.locale?.language || navigator.language || 'en-US';
-      
-      if (diffMins < 60) {
-        return `${diffMins} minutes ago`;
-      } else if (diffHours < 24) {
-        return `${diffHours} hours ago`;
-      } else {
-        return date.toLocaleDateString(locale, { 
-          weekday: 'long', 
-          year: 'numeric', 
-          month: 'long', 
-          day: 'numeric',
-          hour: 'numeric',
-          minute: '2-digit'
-        });
-      }
-    } catch (e) {
-      return timestamp;
-    }
-  }
-
-  formatNumberForDisplay(value) {
-    const num = parseFloat(value);
-    if (isNaN(num)) {
-      return ''; // Return empty string if not a valid number
-    }
-    // Round to 2 decimal places
-    return Math.round(num * 100) / 100;
-  }
-
-  renderReading(readingName) {
-    const value = this.getSensorValue(readingName);
-    const config = this.getReadingConfig(readingName);
-    
-    if (!config || config.gauge_min === undefined || config.gauge_max === undefined) {
-      return html`
+    `}setConfig(config){this.config={device_serial:config.device_serial||null,title:config.title||`Latest measurement`,show_timestamp:config.show_timestamp!==!1,...config},this._entityIds=null,this._resolvedWith=void 0,this._unsubscribeReadings(),this._subscriptionFailed=!1}connectedCallback(){super.connectedCallback(),this.hass&&this.config&&this._subscribeReadings()}disconnectedCallback(){super.disconnectedCallback(),this._unsubscribeReadings()}updated(changedProps){this.isConnected&&this._subscribeReadings()}_subscribeReadings(){if(this._subscription||this._subscriptionFailed||!this.hass||!this.hass.connection)return;let message={type:`virtualpoolcare/subscribe_readings`};this.config.device_serial&&(message.device_serial=this.config.device_serial);let subscription=this.hass.connection.subscribeMessage(event=>this._applyReadings(event),message);this._subscription=subscription,subscription.catch(()=>{this._subscription===subscription&&(this._subscription=null,this._subscriptionFailed=!0,this._readings=null)})}_unsubscribeReadings(){clearTimeout(this._resubscribeTimer),this._resubscribeTimer=null,this._subscription&&=(this._subscription.then(unsubscribe=>unsubscribe()).catch(()=>{}),null),this._readings=null}_applyReadings(event){if(event.unloaded){this._unsubscribeReadings(),this._resubscribeTimer=setTimeout(()=>{this._resubscribeTimer=null,this.isConnected&&this._subscribeReadings()},5e3);return}let readings=event.full||!this._readings?{}:{...this._readings};for(let[name,fields]of Object.entries(event.readings||{})){let reading={...readings[name]};for(let[field,value]of Object.entries(fields))value===null?delete reading[field]:reading[field]=value;readings[name]=reading}for(let name of event.removed||[])delete readings[name];this._readings=readings}shouldUpdate(changedProps){if(changedProps.has(`config`)||changedProps.has(`_readings`)||!this.hass)return!0;let oldHass=changedProps.get(`hass`);if(!oldHass||oldHass.locale!==this.hass.locale)return!0;if(this._readings)return this.config.show_timestamp&&this.formatTimestamp(this.getLatestTimestamp())!==this._timestampText;let oldIds=this._entityIds,entityIds=this.resolveEntityIds();return entityIds!==oldIds||Object.values(entityIds.ids).some(id=>oldHass.states[id]!==this.hass.states[id])?!0:this.config.show_timestamp&&this.formatTimestamp(this.getLatestTimestamp())!==this._timestampText}resolveEntityIds(){if(this._entityIds&&this._entityIds.complete)return this._entityIds;let registry=this.hass.entities||Object.keys(this.hass.states).length;if(this._entityIds&&this._resolvedWith===registry)return this._entityIds;this._resolvedWith=registry;let found={},serial=this.config.device_serial;if(serial)for(let reading of READINGS)for(let candidate of[serial,serial.toLowerCase()]){let entityId=`sensor.virtualpoolcare_${candidate}_${reading}`;if(this.hass.states[entityId]){found[reading]=entityId;break}}if(Object.keys(found).length<READINGS.length)for(let entityId of Object.keys(this.hass.states)){let match=READING_ENTITY_PATTERN.exec(entityId);!match||found[match[2]]||(serial||=match[1],match[1].toLowerCase()===serial.toLowerCase()&&(found[match[2]]=entityId))}let complete=Object.keys(found).length===READINGS.length,previous=this._entityIds;return previous&&Object.keys(previous.ids).length===Object.keys(found).length&&READINGS.every(reading=>previous.ids[reading]===found[reading])?(previous.complete=complete,previous):(this._entityIds={ids:found,complete},this._entityIds)}getEntity(readingName){let entityId=this.resolveEntityIds().ids[readingName];return entityId?this.hass.states[entityId]:void 0}getSensorValue(readingName){if(this._readings){let reading=this._readings[readingName];return reading&&reading.value!==void 0?parseFloat(reading.value):null}let entity=this.getEntity(readingName);return entity?parseFloat(entity.state):null}getSensorAttributes(readingName){if(this._readings)return this._readings[readingName]||{};let entity=this.getEntity(readingName);return entity?entity.attributes:{}}hasReadings(){return this._readings?Object.keys(this._readings).length>0:Object.keys(this.resolveEntityIds().ids).length>0}getReadingConfig(readingName){let attributes=this.getSensorAttributes(readingName);return{gauge_min:attributes.gauge_min,gauge_max:attributes.gauge_max,ok_min:attributes.ok_min,ok_max:attributes.ok_max,warning_low:attributes.warning_low,warning_high:attributes.warning_high,expired:attributes.expired||!1,timestamp:attributes.timestamp,last_measurement:attributes.last_measurement,data_freshness:attributes.data_freshness}}createSegments(config){if(config.gauge_min===void 0||config.gauge_max===void 0)return[];let{gauge_min,gauge_max,ok_min,ok_max,warning_low,warning_high}=config,totalRange=gauge_max-gauge_min,segments=[];return warning_low>gauge_min&&segments.push({start:gauge_min,end:warning_low,color:`#f44336`,width:(warning_low-gauge_min)/totalRange*100}),ok_min>warning_low&&segments.push({start:warning_low,end:ok_min,color:`#ff9800`,width:(ok_min-warning_low)/totalRange*100}),segments.push({start:ok_min,end:ok_max,color:`#2196f3`,width:(ok_max-ok_min)/totalRange*100}),warning_high>ok_max&&segments.push({start:ok_max,end:warning_high,color:`#ff9800`,width:(warning_high-ok_max)/totalRange*100}),gauge_max>warning_high&&segments.push({start:warning_high,end:gauge_max,color:`#f44336`,width:(gauge_max-warning_high)/totalRange*100}),segments}getValuePosition(value,config){if(value==null||config.gauge_min===void 0||config.gauge_max===void 0)return null;let range=config.gauge_max-config.gauge_min,position=(value-config.gauge_min)/range*100;return Math.max(0,Math.min(100,position))}getBubbleClass(readingName,value,config){return value!==null&&config.gauge_min!==void 0&&config.gauge_max!==void 0&&(value<config.gauge_min||value>config.gauge_max)?`red-bubble`:value===null||config.ok_min===void 0?`default-bubble`:value<config.warning_low?`red-bubble`:value<config.ok_min?`orange-bubble`:value<=config.ok_max?`blue-bubble`:value<=config.warning_high?`orange-bubble`:`red-bubble`}getUnitOfMeasurement(readingName){return{temperature:`°C`,ph:``,orp:`mV`,salinity:`g/l`}[readingName]||``}getReadingLabel(readingName){return{temperature:`Temperature`,ph:`pH`,orp:`ORP`,salinity:`Salinity`}[readingName]||readingName}formatTimestamp(timestamp){if(!timestamp)return``;try{let date=new Date(timestamp),diffMs=/* @__PURE__ */ new Date-date,diffHours=Math.floor(diffMs/(1e3*60*60)),diffMins=Math.floor(diffMs/(1e3*60)),locale=this.hass?.locale?.language||navigator.language||`en-US`;return diffMins<60?`${diffMins} minutes ago`:diffHours<24?`${diffHours} hours ago`:date.toLocaleDateString(locale,{weekday:`long`,year:`numeric`,month:`long`,day:`numeric`,hour:`numeric`,minute:`2-digit`})}catch{return timestamp}}formatNumberForDisplay(value){let num=parseFloat(value);return isNaN(num)?``:Math.round(num*100)/100}renderReading(readingName){let value=this.getSensorValue(readingName),config=this.getReadingConfig(readingName);if(!config||config.gauge_min===void 0||config.gauge_max===void 0)return html`
         <div class="reading-row">
           <div class="reading-label">${this.getReadingLabel(readingName)}</div>
           <div class="bar-container">
             <div style="color: var(--secondary-text-color); font-size: 0.9em;">No data available</div>
           </div>
         </div>
-      `;
-    }
-
-    const segments = this.createSegments(config);
-    const position = this.getValuePosition(value, config);
-    const unit = this.getUnitOfMeasurement(readingName);
-    const bubbleClass = this.getBubbleClass(readingName, value, config);
-
-    // Calculate positions for threshold labels
-    // TODO: consider options if labels may overlap - either stagger or suppress some
-    const totalRange = config.gauge_max - config.gauge_min;
-    const warningLowPos = ((config.warning_low - config.gauge_min) / totalRange) * 100;
-    const okMinPos = ((config.ok_min - config.gauge_min) / totalRange) * 100;
-    const okMaxPos = ((config.ok_max - config.gauge_min) / totalRange) * 100;
-    const warningHighPos = ((config.warning_high - config.gauge_min) / totalRange) * 100;
-
-    return html`
+      `;let segments=this.createSegments(config),position=this.getValuePosition(value,config),unit=this.getUnitOfMeasurement(readingName),bubbleClass=this.getBubbleClass(readingName,value,config),totalRange=config.gauge_max-config.gauge_min,warningLowPos=(config.warning_low-config.gauge_min)/totalRange*100,okMinPos=(config.ok_min-config.gauge_min)/totalRange*100,okMaxPos=(config.ok_max-config.gauge_min)/totalRange*100,warningHighPos=(config.warning_high-config.gauge_min)/totalRange*100;return html`
       <div class="reading-row">
         <div class="reading-label">${this.getReadingLabel(readingName)}</div>
         
         <div class="bar-container">
           <div class="bar-track">
-            ${segments.map(segment => html`
+            ${segments.map(segment=>html`
               <div
                 class="bar-segment"
                 style="width: ${segment.width}%; background-color: ${segment.color};"
@@ -490,14 +166,14 @@ class PoolReadingsBarCard extends LitElement {
             `)}
           </div>
           
-          ${position !== null && value !== null ? html`
+          ${position!==null&&value!==null?html`
             <div
               class="value-bubble ${bubbleClass}"
               style="left: ${position}%;"
             >
               ${this.formatNumberForDisplay(value)}${unit}
             </div>
-          ` : ''}
+          `:``}
           
           <div class="scale-labels">
             <span style="position: absolute; left: ${warningLowPos}%; transform: translateX(-50%);">${this.formatNumberForDisplay(config.warning_low)}</span>
@@ -507,34 +183,7 @@ class PoolReadingsBarCard extends LitElement {
           </div>
         </div>
       </div>
-    `;
-  }
-
-  getLatestTimestamp() {
-    const readings = ['temperature', 'ph', 'orp', 'salinity'];
-    let latestTimestamp = null;
-    
-    for (const reading of readings) {
-      const attributes = this.getSensorAttributes(reading);
-      const timestamp = attributes.timestamp || attributes.last_measurement;
-      if (timestamp && (!latestTimestamp || new Date(timestamp) > new Date(latestTimestamp))) {
-        latestTimestamp = timestamp;
-      }
-    }
-    
-    return latestTimestamp;
-  }
-
-  render() {
-    if (!this.hass || !this.config) {
-      return html`<div>Loading...</div>`;
-    }
-
-    // Debug: Show what entities we're working with
-    const availableEntities = this.findVirtualPoolCareEntities();
-    
-    if (availableEntities.length === 0) {
-      return html`
+    `}getLatestTimestamp(){let latestTimestamp=null;for(let reading of READINGS){let attributes=this.getSensorAttributes(reading),timestamp=attributes.timestamp||attributes.last_measurement;timestamp&&(!latestTimestamp||new Date(timestamp)>new Date(latestTimestamp))&&(latestTimestamp=timestamp)}return latestTimestamp}render(){if(!this.hass||!this.config)return html`<div>Loading...</div>`;if(!this.hasReadings())return html`
         <div class="card-header">
           <div class="header-text">
             <div class="header-title">${this.config.title}</div>
@@ -543,49 +192,20 @@ class PoolReadingsBarCard extends LitElement {
         <div class="no-data">
           No VirtualPoolCare sensor entities found. Make sure your VirtualPoolCare integration is set up and working.
         </div>
-      `;
-    }
-
-    const latestTimestamp = this.getLatestTimestamp();
-    const readings = ['temperature', 'ph', 'orp', 'salinity'];
-
-    return html`
+      `;let latestTimestamp=this.getLatestTimestamp();return this._timestampText=this.formatTimestamp(latestTimestamp),html`
       <div class="card-header">
         <svg class="header-icon thermometer-icon" viewBox="0 0 24 24">
           <path d="M15 13V5a3 3 0 0 0-6 0v8a5 5 0 1 0 6 0zm-3 4a2 2 0 1 1 0-4 2 2 0 0 1 0 4z"/>
         </svg>
         <div class="header-text">
           <div class="header-title">${this.config.title}</div>
-          ${this.config.show_timestamp && latestTimestamp ? html`
+          ${this.config.show_timestamp&&latestTimestamp?html`
             <div class="header-subtitle">
-              ${this.formatTimestamp(latestTimestamp)}
+              ${this._timestampText}
             </div>
-          ` : ''}
+          `:``}
         </div>
       </div>
       
-      ${readings.map(reading => this.renderReading(reading))}
-    `;
-  }
-
-  getCardSize() {
-    return 3;
-  }
-}
-
-customElements.define("pool-readings-bar-card", PoolReadingsBarCard);
-
-console.info(
-  `%c  POOL-READINGS-BAR-CARD  %c  Loaded automatically with integration  `,
-  "color: orange; font-weight: bold; background: black",
-  "color: white; font-weight: bold; background: dimgray"
-);
-
-// Register with Home Assistant's card registry
-window.customCards = window.customCards || [];
-window.customCards.push({
-  type: "pool-readings-bar-card",
-  name: "Pool Readings Bar Card",
-  description: "VirtualPoolCare pool water quality display (auto-loaded)",
-  preview: true,
-});
\ No newline at end of file
+      ${READINGS.map(reading=>this.renderReading(reading))}
+    `}getCardSize(){return 3}}customElements.get(`pool-readings-bar-card`)||(customElements.define(`pool-readings-bar-card`,PoolReadingsBarCard),console.info(`%c  POOL-READINGS-BAR-CARD  %c  Loaded automatically with integration  `,`color: orange; font-weight: bold; background: black`,`color: white; font-weight: bold; background: dimgray`),window.customCards=window.customCards||[],window.customCards.push({type:`pool-readings-bar-card`,name:`Pool Readings Bar Card`,description:`VirtualPoolCare pool water quality display (auto-loaded)`,preview:!0}));
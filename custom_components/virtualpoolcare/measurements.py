@@ -0,0 +1,267 @@
+"""Parsed VirtualPoolCare measurements without Home Assistant dependencies.
+
+A lastMeasurements response is parsed once into compact records: numbers
+are coerced and timestamps parsed to datetimes at parse time, so consumers
+read attributes instead of rebuilding `f"{name}_gauge_min"` style keys.
+`PoolMeasurements.as_dict()` still produces the legacy flat dict, and
+`PoolMeasurements.as_response()` the API format (used for persisted snapshots).
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from functools import lru_cache
+
+_LOGGER = logging.getLogger(__name__)
+
+# Gauge and threshold fields of a reading, in legacy dict order
+THRESHOLD_FIELDS = ("gauge_min", "gauge_max", "ok_min", "ok_max", "warning_low", "warning_high")
+
+# Suffixes of the legacy flat dict keys that describe a reading rather than name one
+LEGACY_SUFFIXES = (
+    "_timestamp", "_expired", "_trend", "_gauge_min", "_gauge_max",
+    "_ok_min", "_ok_max", "_warning_low", "_warning_high", "_priority",
+)
+LEGACY_METADATA_KEYS = frozenset(("blue_device_serial", "last_measurement_timestamp"))
+
+
+@lru_cache(maxsize=256)
+def parse_timestamp(value: str | None) -> datetime | None:
+    """Parse an API timestamp such as "2024-01-01T12:00:00.000Z" to an aware UTC datetime.
+
+    Every reading of one response usually shares the same timestamp, so
+    results are cached.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        _LOGGER.debug("Could not parse measurement timestamp %s", value)
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=256)
+def format_timestamp(value: datetime | None) -> str | None:
+    """Format a datetime the way the API does ("2024-01-01T12:00:00.000Z")."""
+    if value is None:
+        return None
+    value = value.astimezone(timezone.utc)
+    return f"{value:%Y-%m-%dT%H:%M:%S}.{value.microsecond // 1000:03d}Z"
+
+
+def _to_number(value):
+    """Coerce numeric strings to float; other values are returned unchanged."""
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _to_int(value) -> int | None:
+    """Coerce a priority to int, or None if it is missing or not a number."""
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class Measurement:
+    """One reading (e.g. ph) of a Blue device, with its gauge and thresholds."""
+
+    __slots__ = (
+        "name", "value", "timestamp", "expired", "trend", "priority",
+        "gauge_min", "gauge_max", "ok_min", "ok_max", "warning_low", "warning_high",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        value,
+        timestamp: datetime | None = None,
+        expired: bool = False,
+        trend: str | None = None,
+        priority: int | None = None,
+        gauge_min: float | None = None,
+        gauge_max: float | None = None,
+        ok_min: float | None = None,
+        ok_max: float | None = None,
+        warning_low: float | None = None,
+        warning_high: float | None = None,
+    ):
+        self.name = name
+        self.value = value
+        self.timestamp = timestamp
+        self.expired = expired
+        self.trend = trend
+        self.priority = priority
+        self.gauge_min = gauge_min
+        self.gauge_max = gauge_max
+        self.ok_min = ok_min
+        self.ok_max = ok_max
+        self.warning_low = warning_low
+        self.warning_high = warning_high
+
+    @classmethod
+    def from_api(cls, measurement: dict) -> Measurement | None:
+        """Build a Measurement from one entry of the response's `data` list.
+
+        Returns None for entries without a name or value.
+        """
+        name = measurement.get("name")
+        value = measurement.get("value")
+        if not name or value is None:
+            return None
+
+        trend = measurement.get("trend")
+        return cls(
+            name,
+            _to_number(value),
+            timestamp=parse_timestamp(measurement.get("timestamp")),
+            expired=bool(measurement.get("expired", False)),
+            trend=trend if trend and trend != "undefined" else None,
+            priority=_to_int(measurement.get("priority")),
+            gauge_min=_to_number(measurement.get("gauge_min")),
+            gauge_max=_to_number(measurement.get("gauge_max")),
+            ok_min=_to_number(measurement.get("ok_min")),
+            ok_max=_to_number(measurement.get("ok_max")),
+            warning_low=_to_number(measurement.get("warning_low")),
+            warning_high=_to_number(measurement.get("warning_high")),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __repr__(self):
+        return f"Measurement({self.name}={self.value!r}, timestamp={format_timestamp(self.timestamp)})"
+
+    def as_api(self) -> dict:
+        """Return this reading as an entry of a lastMeasurements `data` list."""
+        measurement = {
+            "name": self.name,
+            "value": self.value,
+            "timestamp": format_timestamp(self.timestamp),
+            "expired": self.expired,
+            "priority": self.priority,
+        }
+        for field in THRESHOLD_FIELDS:
+            measurement[field] = getattr(self, field)
+        if self.trend:
+            measurement["trend"] = self.trend
+        return measurement
+
+    def add_to_legacy_dict(self, sensor_data: dict) -> None:
+        """Add this reading's `{name}_...` keys to a legacy flat sensor dict."""
+        name = self.name
+        sensor_data[name] = self.value
+        sensor_data[f"{name}_timestamp"] = format_timestamp(self.timestamp)
+        sensor_data[f"{name}_expired"] = self.expired
+        for field in THRESHOLD_FIELDS:
+            sensor_data[f"{name}_{field}"] = getattr(self, field)
+        sensor_data[f"{name}_priority"] = self.priority
+        if self.trend:
+            sensor_data[f"{name}_trend"] = self.trend
+
+
+class PoolMeasurements:
+    """The latest readings of one Blue device, keyed by reading name."""
+
+    __slots__ = ("device_serial", "last_measurement", "measurements")
+
+    def __init__(
+        self,
+        device_serial: str | None,
+        last_measurement: datetime | None = None,
+        measurements: dict[str, Measurement] | None = None,
+    ):
+        self.device_serial = device_serial
+        self.last_measurement = last_measurement
+        self.measurements = measurements if measurements is not None else {}
+
+    @classmethod
+    def from_response(cls, measurements_response: dict) -> PoolMeasurements | None:
+        """
+        Parse a lastMeasurements response.
+
+        Args:
+            measurements_response: Raw API response from lastMeasurements
+
+        Returns:
+            PoolMeasurements, or None if the response status is not OK
+        """
+        if measurements_response.get("status") != "OK":
+            _LOGGER.warning("Measurements response status not OK: %s", measurements_response.get("status"))
+            return None
+
+        measurements = {}
+        for entry in measurements_response.get("data", []):
+            measurement = Measurement.from_api(entry)
+            if measurement is not None:
+                measurements[measurement.name] = measurement
+
+        return cls(
+            measurements_response.get("blue_device_serial"),
+            parse_timestamp(measurements_response.get("last_blue_measure_timestamp")),
+            measurements,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, PoolMeasurements):
+            return NotImplemented
+        return (
+            self.device_serial == other.device_serial
+            and self.last_measurement == other.last_measurement
+            and self.measurements == other.measurements
+        )
+
+    def __repr__(self):
+        return f"PoolMeasurements({self.device_serial}, {list(self.measurements)})"
+
+    def __bool__(self):
+        return bool(self.measurements)
+
+    def get(self, name: str) -> Measurement | None:
+        """Return the reading called `name`, if present."""
+        return self.measurements.get(name)
+
+    def sensor_keys(self) -> set:
+        """Return the names of the readings that become sensors."""
+        return set(self.measurements)
+
+    def as_dict(self) -> dict:
+        """
+        Return the legacy flat dict format.
+
+        Returns:
+            dict: Sensor data in format {sensor_name: value, f"{sensor_name}_gauge_min": ..., ...}
+        """
+        sensor_data = {
+            "blue_device_serial": self.device_serial,
+            "last_measurement_timestamp": format_timestamp(self.last_measurement),
+        }
+        for measurement in self.measurements.values():
+            measurement.add_to_legacy_dict(sensor_data)
+        return sensor_data
+
+    def as_response(self) -> dict:
+        """
+        Return the readings in the lastMeasurements response format.
+
+        `from_response()` parses the result back to an equal PoolMeasurements,
+        so it can be persisted as JSON and restored later.
+        """
+        return {
+            "status": "OK",
+            "blue_device_serial": self.device_serial,
+            "last_blue_measure_timestamp": format_timestamp(self.last_measurement),
+            "data": [measurement.as_api() for measurement in self.measurements.values()],
+        }
@@ -1,20 +1,33 @@
 """VirtualPoolCare sensor platform."""
+from __future__ import annotations
+
 import logging
-from datetime import timedelta, datetime
+from datetime import timedelta
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import dt as dt_util
 from homeassistant.config_entries import ConfigEntry
 
-from .const import DOMAIN, SCAN_INTERVAL_HOURS
-from .virtualpoolcare_core import VirtualPoolCareAPI, VirtualPoolCareSensorData
+from .const import DEFAULT_MAX_CONCURRENT_REQUESTS, DOMAIN, FRESHNESS_CHECK_INTERVAL_SECONDS, SCAN_INTERVAL_HOURS
+from .coordinator import VirtualPoolCareDataUpdateCoordinator
+from .measurements import THRESHOLD_FIELDS, Measurement, PoolMeasurements, format_timestamp
+from .virtualpoolcare_core import REFRESH_STAGES, ROLLING_READINGS, ROLLING_WINDOWS, VirtualPoolCareSensorData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Diagnostic sensors of the account's refresh statistics: key -> name
+REFRESH_SENSORS = {
+    "refresh_duration": "refresh duration",
+    "api_requests": "API requests",
+    "last_successful_refresh": "last successful refresh",
+}
+
 # TODO: Implement config flow for UI wizard setup
 # This would involve:
 # 1. Creating config_flow.py with user input forms
@@ -32,16 +45,94 @@ async def async_setup_entry(
     # Get the coordinator that was created in __init__.py
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
-    # No need to call any refresh methods - coordinator already has data
-    # from async_config_entry_first_refresh() called in __init__.py
-    
-    entities = []
-    if coordinator.data:
-        sensor_keys = VirtualPoolCareSensorData.get_sensor_keys(coordinator.data)
-        for key in sensor_keys:
-            entities.append(VirtualPoolCareSensor(coordinator, key))
+    # No need to call any refresh methods - coordinator already has data from
+    # the restored snapshot or async_config_entry_first_refresh() in __init__.py
     
-    async_add_entities(entities, update_before_add=False)
+    # Entities are created from the coordinator data now and whenever
+    # readings or devices appear or disappear
+    entity_index = EntityIndex(coordinator, async_add_entities)
+    entity_index.async_sync()
+    entry.async_on_unload(coordinator.async_add_listener(entity_index.async_sync))
+
+    # Refresh timing and request counters of the account, disabled by default
+    async_add_entities(_refresh_entities(coordinator), update_before_add=False)
+
+
+def _key_entities(coordinator, device_serial: str, key: str) -> list:
+    """Return the reading sensor of `key` and its rolling statistics sensors."""
+    entities = [VirtualPoolCareSensor(coordinator, device_serial, key)]
+    if key in ROLLING_READINGS:
+        for window in ROLLING_WINDOWS:
+            entities.append(VirtualPoolCareStatisticSensor(coordinator, device_serial, key, window))
+    return entities
+
+
+def _refresh_entities(coordinator) -> list:
+    """Return the diagnostic sensors of the coordinator's refresh statistics."""
+    return [VirtualPoolCareRefreshSensor(coordinator, key) for key in REFRESH_SENSORS]
+
+
+class EntityIndex:
+    """The entities of one coordinator, indexed by (device_serial, key).
+
+    `async_sync()` runs on every coordinator update. Devices whose parsed
+    measurements are the same object as last time (unchanged responses are
+    not re-parsed) are skipped, so a refresh costs O(changed devices) and
+    only new or vanished keys create or remove entities.
+    """
+
+    def __init__(self, coordinator: VirtualPoolCareDataUpdateCoordinator, async_add_entities: AddEntitiesCallback):
+        self.coordinator = coordinator
+        self.async_add_entities = async_add_entities
+        self.entities: dict[tuple[str, str], list] = {}
+        # Keys with entities, and the measurements they were last synced from, per device
+        self._device_keys: dict[str, set] = {}
+        self._synced: dict[str, PoolMeasurements] = {}
+
+    @callback
+    def async_sync(self) -> None:
+        """Add entities for new readings and devices, and remove those that went away."""
+        data = self.coordinator.data
+        if data is None:
+            return
+
+        new_entities = []
+        for device_serial, device_data in data.items():
+            if self._synced.get(device_serial) is device_data:
+                continue
+            self._synced[device_serial] = device_data
+            keys = VirtualPoolCareSensorData.get_sensor_keys(device_data)
+            known = self._device_keys.setdefault(device_serial, set())
+            for key in keys - known:
+                entities = _key_entities(self.coordinator, device_serial, key)
+                self.entities[(device_serial, key)] = entities
+                new_entities.extend(entities)
+            for key in known - keys:
+                self._async_remove(device_serial, key)
+            self._device_keys[device_serial] = keys
+
+        for device_serial in self._device_keys.keys() - data.keys():
+            for key in self._device_keys.pop(device_serial):
+                self._async_remove(device_serial, key)
+            self._synced.pop(device_serial, None)
+
+        if new_entities:
+            _LOGGER.debug("VirtualPoolCare: Adding %d entities to Home Assistant", len(new_entities))
+            self.async_add_entities(new_entities, update_before_add=False)
+
+    @callback
+    def _async_remove(self, device_serial: str, key: str) -> None:
+        """Remove the entities of a reading that is no longer reported.
+
+        Their registry entries are kept: a single non-OK response or null
+        reading is enough to drop a reading, and the user's renames, areas
+        and disabled flags must survive until it is reported again.
+        """
+        _LOGGER.debug("VirtualPoolCare: Removing entities of %s %s", device_serial, key)
+        for entity in self.entities.pop((device_serial, key), []):
+            if entity.hass is not None:
+                self.coordinator.hass.async_create_task(entity.async_remove())
+
 
 # Keep existing async_setup_platform for YAML compatibility
 async def async_setup_platform(
@@ -57,6 +148,7 @@ async def async_setup_platform(
     email = config.get("email")
     password = config.get("password")
     interval_hrs = config.get("update_interval_hours", SCAN_INTERVAL_HOURS)
+    max_concurrent_requests = config.get("max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS)
     
     _LOGGER.debug("VirtualPoolCare: Config - email: %s, interval_hrs: %s", email[:5] + "***" if email else None, interval_hrs)
     
@@ -72,87 +164,40 @@ async def async_setup_platform(
         name=DOMAIN, 
         update_interval=update_interval,
         email=email,
-        password=password
+        password=password,
+        max_concurrent_requests=max_concurrent_requests
     )
+    await coordinator.async_load_cache()
     
-    # For YAML setup, use async_request_refresh instead
-    await coordinator.async_request_refresh()
-    
-    _LOGGER.debug("VirtualPoolCare: First refresh completed. Data available: %s", bool(coordinator.data))
     if coordinator.data:
-        _LOGGER.debug("VirtualPoolCare: Data keys: %s", list(coordinator.data.keys()))
-
-    entities = []
+        # Start from the restored snapshot and fetch live data in the background
+        hass.async_create_background_task(
+            coordinator.async_refresh(), f"{DOMAIN} refresh after restoring snapshot"
+        )
+    else:
+        # For YAML setup, use async_request_refresh instead
+        await coordinator.async_request_refresh()
+    
+    _LOGGER.debug("VirtualPoolCare: Data available: %s", bool(coordinator.data))
     if coordinator.data:
-        sensor_keys = VirtualPoolCareSensorData.get_sensor_keys(coordinator.data)
-        _LOGGER.debug("VirtualPoolCare: Found %d sensor keys: %s", len(sensor_keys), sensor_keys)
-        
-        for key in sensor_keys:
-            entities.append(VirtualPoolCareSensor(coordinator, key))
+        _LOGGER.debug("VirtualPoolCare: Devices: %s", list(coordinator.data.keys()))
     else:
         _LOGGER.warning("VirtualPoolCare: No data received from coordinator")
-    
-    _LOGGER.debug("VirtualPoolCare: Adding %d entities to Home Assistant", len(entities))
-    async_add_entities(entities, update_before_add=False)
-
-    # Store entities for dynamic addition
-    hass.data.setdefault(f"{DOMAIN}_entities", []).extend(entities)
-
-    # Register a listener to add new entities dynamically if keys change
-    coordinator.async_add_listener(
-        lambda: _add_new_virtualpoolcare_entities(hass, coordinator, async_add_entities)
-    )
-
-
-def _add_new_virtualpoolcare_entities(hass, coordinator, async_add_entities):
-    """Add entities if new keys appear in coordinator.data."""
-    device_serial = coordinator.data.get("blue_device_serial", "unknown")
-    
-    existing_keys = {
-        ent._key for ent in hass.data.get(f"{DOMAIN}_entities", [])
-        if hasattr(ent, '_device_serial') and ent._device_serial == device_serial
-    }
-    
-    sensor_keys = VirtualPoolCareSensorData.get_sensor_keys(coordinator.data)
-    new_keys = sensor_keys - existing_keys
-    
-    if new_keys:
-        new_entities = [VirtualPoolCareSensor(coordinator, key) for key in new_keys]
-        async_add_entities(new_entities, update_before_add=False)
-        hass.data.setdefault(f"{DOMAIN}_entities", []).extend(new_entities)
-
-
-class VirtualPoolCareDataUpdateCoordinator(DataUpdateCoordinator):
-    """Manages fetching data from virtualpoolcare.io every X hours."""
 
-    def __init__(self, hass: HomeAssistant, name: str, update_interval: timedelta, email: str, password: str):
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=name,
-            update_interval=update_interval,
-        )
-        self.api = VirtualPoolCareAPI(email, password)
-
-    async def _async_update_data(self) -> dict:
-        """Fetch data from virtualpoolcare.io (runs in executor)."""
-        try:
-            result = await self.hass.async_add_executor_job(self.api.fetch_data)
-            return result
-        except Exception as err:
-            raise UpdateFailed(f"Error fetching VirtualPoolCare data: {err}") from err
+    # Same dynamic discovery as config entries (YAML setups are never unloaded)
+    entity_index = EntityIndex(coordinator, async_add_entities)
+    entity_index.async_sync()
+    coordinator.async_add_listener(entity_index.async_sync)
+    async_add_entities(_refresh_entities(coordinator), update_before_add=False)
 
 
 class VirtualPoolCareSensor(SensorEntity):
     """Representation of a single VirtualPoolCare sensor."""
 
-    def __init__(self, coordinator: VirtualPoolCareDataUpdateCoordinator, key: str):
+    def __init__(self, coordinator: VirtualPoolCareDataUpdateCoordinator, device_serial: str, key: str):
         self.coordinator = coordinator
         self._key = key
         
-        # Get device serial from coordinator data for unique identification
-        device_serial = coordinator.data.get("blue_device_serial", "unknown")
-        
         # Use core module to create IDs and names
         self._attr_unique_id = VirtualPoolCareSensorData.create_entity_id(device_serial, key)
         self._attr_name = VirtualPoolCareSensorData.create_entity_name(device_serial, key)
@@ -160,69 +205,113 @@ class VirtualPoolCareSensor(SensorEntity):
         # Store device serial for use in device_info
         self._device_serial = device_serial
         
+        # Written on coordinator updates and data_freshness changes only
+        self._attr_should_poll = False
+        
         # Set state class for historical data
         if key in ["temperature", "ph", "orp", "salinity", "chlorine_ppm", "chlorine", "tds", "conductivity"]:
             self._attr_state_class = SensorStateClass.MEASUREMENT
+        
+        # State, timestamp and attributes are computed once per coordinator update
+        self._cached_measurement = None
+        self._cached_restored = False
+        self._state = None
+        self._last_updated = None
+        self._measurement_attributes = {}
+        self._attributes = {}
+        self._update_from_coordinator_data()
 
     @property
-    def extra_state_attributes(self):
-        """Return additional state attributes."""
+    def _device_data(self) -> PoolMeasurements | None:
+        """Return this sensor's device measurements from the coordinator."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get(self._device_serial)
+
+    @property
+    def _measurement(self) -> Measurement | None:
+        """Return this sensor's reading from the coordinator."""
+        data = self._device_data
+        if data is None:
+            return None
+        return data.get(self._key)
+
+    @callback
+    def _update_from_coordinator_data(self) -> None:
+        """Cache state, timestamp and attributes from the latest coordinator data."""
+        measurement = self._measurement
         attributes = {}
         
-        # Add timestamp if available (also as attribute for compatibility)
-        timestamp_key = f"{self._key}_timestamp"
-        if self.coordinator.data and timestamp_key in self.coordinator.data:
-            attributes["timestamp"] = self.coordinator.data[timestamp_key]
+        if measurement is not None:
+            # Add timestamp if available (also as attribute for compatibility)
+            if measurement.timestamp is not None:
+                attributes["timestamp"] = format_timestamp(measurement.timestamp)
+                # Also add human-readable timestamp
+                attributes["last_measurement"] = measurement.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
             
-            # Also add human-readable timestamp
-            try:
-                dt = dt_util.parse_datetime(self.coordinator.data[timestamp_key])
-                if dt:
-                    attributes["last_measurement"] = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-            except (ValueError, TypeError):
-                pass
-        
-        # Add expired status if available
-        expired_key = f"{self._key}_expired"
-        if self.coordinator.data and expired_key in self.coordinator.data:
-            attributes["expired"] = self.coordinator.data[expired_key]
-        
-        # Add trend if available
-        trend_key = f"{self._key}_trend"
-        if self.coordinator.data and trend_key in self.coordinator.data:
-            attributes["trend"] = self.coordinator.data[trend_key]
-        
-        # Add gauge and threshold data for the frontend card
-        for attr in ['gauge_min', 'gauge_max', 'ok_min', 'ok_max', 'warning_low', 'warning_high', 'priority']:
-            attr_key = f"{self._key}_{attr}"
-            if self.coordinator.data and attr_key in self.coordinator.data:
-                attributes[attr] = self.coordinator.data[attr_key]
+            attributes["expired"] = measurement.expired
+            
+            # Add trend if available
+            if measurement.trend:
+                attributes["trend"] = measurement.trend
+            
+            # Add gauge and threshold data for the frontend card
+            for attr in THRESHOLD_FIELDS:
+                attributes[attr] = getattr(measurement, attr)
+            attributes["priority"] = measurement.priority
         
         # Add device serial
         attributes["device_serial"] = self._device_serial
         
-        # Add data freshness info based on actual measurement time
-        measurement_time = self.last_updated
+        self._cached_measurement = measurement
+        self._cached_restored = self.coordinator.data_restored
+        self._state = measurement.value if measurement is not None else None
+        self._last_updated = measurement.timestamp if measurement is not None else None
+        self._measurement_attributes = attributes
+        self._update_freshness()
+
+    @callback
+    def _update_freshness(self) -> None:
+        """Recompute the data age attributes, which change between coordinator updates."""
+        self._attributes = self._freshness_attributes()
+
+    @callback
+    def _freshness_attributes(self) -> dict:
+        """Return the measurement attributes with the data freshness as of now."""
+        attributes = self._measurement_attributes
+        
+        # Add data freshness info based on actual measurement time; the
+        # measurement time itself is in the timestamp attribute
+        measurement_time = self._last_updated
         if measurement_time:
-            now = dt_util.utcnow()
-            age_seconds = (now - measurement_time).total_seconds()
-            age_hours = age_seconds / 3600
-            attributes["data_age_hours"] = round(age_hours, 1)
-            
+            age_hours = (dt_util.utcnow() - measurement_time).total_seconds() / 3600
             if age_hours > 24:
-                attributes["data_freshness"] = "stale"
+                data_freshness = "stale"
             elif age_hours > 12:
-                attributes["data_freshness"] = "old"
+                data_freshness = "old"
             else:
-                attributes["data_freshness"] = "fresh"
+                data_freshness = "fresh"
+            attributes = {**attributes, "data_freshness": data_freshness}
+        
+        # Data restored from the last run's snapshot until the first live refresh
+        if self.coordinator.data_restored and self.coordinator.data_fetched_at is not None:
+            attributes = {
+                **attributes,
+                "restored": True,
+                "cached_at": dt_util.utc_from_timestamp(self.coordinator.data_fetched_at).isoformat(),
+            }
         
         return attributes
 
+    @property
+    def extra_state_attributes(self):
+        """Return additional state attributes."""
+        return self._attributes
+
     @property
     def device_info(self):
         """Return device information for this sensor."""
-        # Enhanced device info with API metadata
-        device_info = {
+        return {
             "identifiers": {(DOMAIN, self._device_serial)},
             "name": f"VirtualPoolCare Pool Monitor ({self._device_serial})",
             "manufacturer": "Blue Riiot",
@@ -230,28 +319,6 @@ class VirtualPoolCareSensor(SensorEntity):
             "sw_version": "1.0",
             "suggested_area": "Pool",
         }
-        
-        # Add dynamic metadata from API if available
-        if self.coordinator.data:
-            # Pool location/name if available
-            pool_name = self.coordinator.data.get("pool_name")
-            pool_location = self.coordinator.data.get("pool_location") 
-            if pool_name:
-                device_info["name"] = f"VirtualPoolCare {pool_name}"
-            if pool_location:
-                device_info["suggested_area"] = pool_location
-            
-            # Device firmware if available
-            firmware_version = self.coordinator.data.get("firmware_version")
-            if firmware_version:
-                device_info["sw_version"] = firmware_version
-                
-            # Installation date if available
-            install_date = self.coordinator.data.get("installation_date")
-            if install_date:
-                device_info["configuration_url"] = "https://app.virtualpoolcare.io"
-                
-        return device_info
 
     @property
     def native_unit_of_measurement(self):
@@ -261,44 +328,182 @@ class VirtualPoolCareSensor(SensorEntity):
     @property
     def state(self):
         """Return the current state for this key."""
-        if self.coordinator.data and self._key in self.coordinator.data:
-            return self.coordinator.data[self._key]
-        return None
+        return self._state
 
     @property
     def last_updated(self):
         """Return when this sensor was last updated using API timestamp."""
-        if not self.coordinator.data:
-            return None
-            
-        timestamp_key = f"{self._key}_timestamp"
-        if timestamp_key in self.coordinator.data:
-            timestamp_str = self.coordinator.data[timestamp_key]
-            try:
-                # Parse ISO timestamp from VirtualPoolCare API
-                return dt_util.parse_datetime(timestamp_str)
-            except (ValueError, TypeError) as e:
-                _LOGGER.warning("Could not parse timestamp %s for %s: %s", timestamp_str, self._key, e)
-                return None
-        return None
+        return self._last_updated
 
     async def async_added_to_hass(self):
         """Register listener so HA updates state when coordinator data changes."""
         self.async_on_remove(
             self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_check_freshness, timedelta(seconds=FRESHNESS_CHECK_INTERVAL_SECONDS)
+            )
+        )
+
+    @callback
+    def _async_check_freshness(self, now=None) -> None:
+        """Write the state when data_freshness changed since the last write."""
+        attributes = self._freshness_attributes()
+        if attributes.get("data_freshness") == self._attributes.get("data_freshness"):
+            return
+        self._attributes = attributes
+        self.async_write_ha_state()
 
     @callback
     def _handle_coordinator_update(self):
-        """Write updated state back to HA when coordinator data changes."""
+        """Write updated state back to HA when this sensor's measurement changed."""
+        # Value, timestamp and thresholds are all compared; an identical
+        # measurement would only add a duplicate row to the recorder
+        if (
+            self._measurement == self._cached_measurement
+            and self.coordinator.data_restored == self._cached_restored
+        ):
+            self.coordinator.suppressed_writes += 1
+            return
+        
+        self._update_from_coordinator_data()
+        
         # For timestamp accuracy, we could try setting state with custom timestamp
         # but HA's recorder will still use the write time
         self.async_write_ha_state()
         
         # Log the actual vs desired timestamp for debugging
-        if self.coordinator.data:
-            timestamp_key = f"{self._key}_timestamp"
-            if timestamp_key in self.coordinator.data:
-                api_time = self.coordinator.data[timestamp_key]
-                _LOGGER.debug("Entity %s: API timestamp %s, HA will record at %s", 
-                            self._attr_name, api_time, dt_util.utcnow().isoformat())
\ No newline at end of file
+        api_time = self.last_updated
+        if api_time is not None and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Entity %s: API timestamp %s, HA will record at %s", 
+                        self._attr_name, api_time.isoformat(), dt_util.utcnow().isoformat())
+
+
+class VirtualPoolCareStatisticSensor(SensorEntity):
+    """Mean of one reading over a rolling window, with min, max and rate of change as attributes."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: VirtualPoolCareDataUpdateCoordinator,
+        device_serial: str,
+        key: str,
+        window: str,
+    ):
+        self.coordinator = coordinator
+        self._device_serial = device_serial
+        self._key = key
+        self._window = window
+        self._attr_unique_id = VirtualPoolCareSensorData.create_entity_id(device_serial, f"{key}_mean_{window}")
+        self._attr_name = VirtualPoolCareSensorData.create_entity_name(device_serial, f"{key} mean {window}")
+        self._attr_native_unit_of_measurement = VirtualPoolCareSensorData.get_unit_of_measurement(key)
+        self._attr_should_poll = False
+        self._summary = None
+        self._attributes = {}
+        self._update_from_statistics()
+
+    @callback
+    def _update_from_statistics(self) -> None:
+        """Cache state and attributes from the coordinator's rolling statistics."""
+        summary = self.coordinator.rolling.summary(self._device_serial, self._key, self._window)
+        self._summary = summary
+        if summary is None:
+            self._attr_native_value = None
+            self._attributes = {"device_serial": self._device_serial}
+            return
+        rate = summary["rate_per_hour"]
+        self._attr_native_value = round(summary["mean"], 3)
+        self._attributes = {
+            "min": summary["min"],
+            "max": summary["max"],
+            "rate_of_change_per_hour": round(rate, 4) if rate is not None else None,
+            "samples": summary["count"],
+            "window": self._window,
+            "device_serial": self._device_serial,
+        }
+
+    @property
+    def extra_state_attributes(self):
+        """Return min, max, rate of change and sample count."""
+        return self._attributes
+
+    @property
+    def device_info(self):
+        """Return device information for this sensor."""
+        return {"identifiers": {(DOMAIN, self._device_serial)}}
+
+    async def async_added_to_hass(self):
+        """Register listener so HA updates state when coordinator data changes."""
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write the state when a new reading changed the window's statistics."""
+        if self.coordinator.rolling.summary(self._device_serial, self._key, self._window) == self._summary:
+            self.coordinator.suppressed_writes += 1
+            return
+        self._update_from_statistics()
+        self.async_write_ha_state()
+
+
+class VirtualPoolCareRefreshSensor(SensorEntity):
+    """Refresh timing or request counter of one account, for finding where refresh time goes.
+
+    Polled, as unchanged refreshes do not notify coordinator listeners.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator: VirtualPoolCareDataUpdateCoordinator, key: str):
+        self.coordinator = coordinator
+        self._key = key
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.entry_id}_{key}"
+        self._attr_name = f"VirtualPoolCare {REFRESH_SENSORS[key]}"
+        if key == "refresh_duration":
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        elif key == "api_requests":
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        else:
+            self._attr_device_class = SensorDeviceClass.TIMESTAMP
+        self._update_from_stats()
+
+    @callback
+    def _update_from_stats(self) -> None:
+        """Read state and attributes from the API client's refresh statistics."""
+        refresh_stats = self.coordinator.api.refresh_stats
+        if self._key == "refresh_duration":
+            self._attr_native_value = refresh_stats.last_ms("refresh")
+            self._attr_extra_state_attributes = {
+                f"{stage}_ms": refresh_stats.last_ms(stage) for stage in REFRESH_STAGES if stage != "refresh"
+            }
+        elif self._key == "api_requests":
+            self._attr_native_value = refresh_stats.requests
+            self._attr_extra_state_attributes = {
+                "bytes_received": refresh_stats.bytes_received,
+                "request_errors": dict(refresh_stats.request_errors),
+                "refresh_errors": dict(refresh_stats.refresh_errors),
+            }
+        else:
+            last_success = refresh_stats.last_success
+            self._attr_native_value = dt_util.utc_from_timestamp(last_success) if last_success is not None else None
+
+    @property
+    def device_info(self):
+        """Return the account's service device."""
+        return {
+            "identifiers": {(DOMAIN, f"account_{self.coordinator.entry_id}")},
+            "name": "VirtualPoolCare account",
+            "manufacturer": "Blue Riiot",
+            "entry_type": DeviceEntryType.SERVICE,
+        }
+
+    async def async_update(self):
+        """Read the latest refresh statistics (called when HA polls)."""
+        self._update_from_stats()
@@ -0,0 +1,162 @@
+"""Minimal AWS Signature Version 4 signer for VirtualPoolCare API requests.
+
+Produces the same signatures as botocore's SigV4Auth for the requests this
+integration makes, without importing boto3/botocore.
+"""
+from __future__ import annotations
+
+import hashlib
+import hmac
+from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import quote, urlsplit
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+EXECUTE_API_SERVICE = "execute-api"
+SIGV4_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%SZ"
+EMPTY_SHA256_HASH = hashlib.sha256(b"").hexdigest()
+
+# Hop-by-hop and client headers botocore never signs
+UNSIGNED_HEADERS = frozenset((
+    "authorization", "connection", "expect", "keep-alive", "proxy-authenticate",
+    "proxy-authorization", "te", "trailer", "transfer-encoding", "upgrade",
+    "user-agent", "x-amzn-trace-id",
+))
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@lru_cache(maxsize=32)
+def derive_signing_key(secret_key: str, date: str, region: str, service: str) -> bytes:
+    """Return the SigV4 signing key for a secret key, date (YYYYMMDD), region and service."""
+    key = hmac.new(f"AWS4{secret_key}".encode(), date.encode(), hashlib.sha256).digest()
+    key = hmac.new(key, region.encode(), hashlib.sha256).digest()
+    key = hmac.new(key, service.encode(), hashlib.sha256).digest()
+    return hmac.new(key, b"aws4_request", hashlib.sha256).digest()
+
+
+def _remove_dot_segments(path: str) -> str:
+    """Remove `.`/`..` segments and repeated slashes (RFC 3986 5.2.4, as botocore does)."""
+    if not path:
+        return "/"
+    segments = []
+    for segment in path.split("/"):
+        if not segment or segment == ".":
+            continue
+        if segment == "..":
+            if segments:
+                segments.pop()
+        else:
+            segments.append(segment)
+    first = "/" if path[0] == "/" else ""
+    last = "/" if path[-1] == "/" and segments else ""
+    return first + "/".join(segments) + last
+
+
+def _canonical_query_string(query: str) -> str:
+    """Sort the raw query parameters by key, then value."""
+    if not query:
+        return ""
+    pairs = sorted(pair.partition("=")[::2] for pair in query.split("&"))
+    return "&".join(f"{key}={value}" for key, value in pairs)
+
+
+def _host_header(parts) -> str:
+    """Return the Host header value for a split URL, omitting default ports."""
+    host = parts.hostname
+    if ":" in host:
+        host = f"[{host}]"
+    if parts.port is not None and parts.port != DEFAULT_PORTS.get(parts.scheme):
+        host = f"{host}:{parts.port}"
+    return host
+
+
+class SigV4Signer:
+    """Signs requests with one set of (temporary) AWS credentials.
+
+    Signing keys are derived once per day and cached, so signing a request
+    costs one SHA-256 of the canonical request and one HMAC.
+    """
+
+    __slots__ = ("access_key", "secret_key", "session_token", "region", "service")
+
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        session_token: str | None,
+        region: str,
+        service: str = EXECUTE_API_SERVICE,
+    ):
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.session_token = session_token
+        self.region = region
+        self.service = service
+
+    def sign(
+        self,
+        method: str,
+        url: str,
+        headers: dict | None = None,
+        body: bytes | str = b"",
+        now: datetime | None = None,
+    ) -> dict:
+        """
+        Sign a request and return the headers to send with it.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full URL to request, including any query string
+            headers: Headers to send (and sign), e.g. Content-Type
+            body: Request body
+            now: Signing time (defaults to the current UTC time)
+
+        Returns:
+            dict: `headers` plus X-Amz-Date, X-Amz-Security-Token and Authorization
+        """
+        now = now or datetime.now(timezone.utc)
+        timestamp = now.strftime(SIGV4_TIMESTAMP_FORMAT)
+        date = timestamp[:8]
+
+        signed = dict(headers) if headers else {}
+        signed["X-Amz-Date"] = timestamp
+        if self.session_token:
+            signed["X-Amz-Security-Token"] = self.session_token
+
+        parts = urlsplit(url)
+        canonical = {"host": _host_header(parts)}
+        for name, value in signed.items():
+            lname = name.lower()
+            if lname not in UNSIGNED_HEADERS:
+                canonical[lname] = " ".join(str(value).split())
+        header_names = sorted(canonical)
+        signed_headers = ";".join(header_names)
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        payload_hash = hashlib.sha256(body).hexdigest() if body else EMPTY_SHA256_HASH
+
+        canonical_request = "\n".join((
+            method.upper(),
+            quote(_remove_dot_segments(parts.path), safe="/~"),
+            _canonical_query_string(parts.query),
+            "".join(f"{name}:{canonical[name]}\n" for name in header_names),
+            signed_headers,
+            payload_hash,
+        ))
+
+        scope = f"{date}/{self.region}/{self.service}/aws4_request"
+        string_to_sign = "\n".join((
+            ALGORITHM,
+            timestamp,
+            scope,
+            hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+        ))
+        key = derive_signing_key(self.secret_key, date, self.region, self.service)
+        signature = hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
+        signed["Authorization"] = (
+            f"{ALGORITHM} Credential={self.access_key}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        )
+        return signed
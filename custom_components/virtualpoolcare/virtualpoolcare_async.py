@@ -0,0 +1,223 @@
+"""Asyncio VirtualPoolCare API client built on a shared aiohttp session."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+import aiohttp
+
+from .measurements import PoolMeasurements
+from .virtualpoolcare_core import (
+    DOMAIN,
+    REQUEST_TIMEOUT_SECONDS,
+    VirtualPoolCareAPI,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+
+# Failures that mean the API could not be reached (retried as transient)
+CONNECTION_ERRORS = (OSError, asyncio.TimeoutError, aiohttp.ClientError)
+
+
+class AsyncVirtualPoolCareAPI(VirtualPoolCareAPI):
+    """Asyncio API client for VirtualPoolCare.
+
+    Runs the same client steps as VirtualPoolCareAPI (credential cache,
+    pool index, retries, parsing), but performs their I/O with the given
+    aiohttp session instead of blocking `requests` calls. The blocking
+    methods inherited from VirtualPoolCareAPI still work for scripts.
+    """
+
+    connection_errors = CONNECTION_ERRORS
+
+    def __init__(self, email: str, password: str, session: aiohttp.ClientSession, **kwargs):
+        super().__init__(email, password, **kwargs)
+        self.client_session = session
+        self._refresh_task: asyncio.Task | None = None
+        self._async_login_lock = asyncio.Lock()
+
+    async def _async_run(self, steps):
+        """Drive shared client steps to completion, awaiting their I/O on the event loop."""
+        send, value = steps.send, None
+        while True:
+            try:
+                operation, *args = send(value)
+            except StopIteration as done:
+                return done.value
+            try:
+                value, send = await getattr(self, f"_async_io_{operation}")(*args), steps.send
+            except Exception as e:
+                value, send = e, steps.throw
+
+    async def _async_io_send(self, method: str, url: str, kwargs: dict) -> bytes:
+        """Send one request with the aiohttp session and return the response body."""
+        async with self.client_session.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def _async_io_sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    async def _async_io_login(self) -> dict:
+        return await self.async_login_to_virtualpoolcare()
+
+    async def _async_io_locked(self, steps):
+        """Run `steps` while holding the login lock."""
+        async with self._async_login_lock:
+            return await self._async_run(steps)
+
+    async def _async_io_refresh_credentials(self) -> None:
+        """Refresh the cached credentials in a background task (at most one at a time)."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(
+                self._async_run(self._background_refresh_steps()),
+                name=f"{DOMAIN}-credential-refresh",
+            )
+
+    async def _async_io_fan_out(self, all_steps: list) -> list:
+        """
+        Run independent steps concurrently (up to max_concurrent_requests).
+
+        Returns:
+            list: The result, or the raised exception, of each of `all_steps`
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def run(steps):
+            async with semaphore:
+                return await self._async_run(steps)
+
+        return await asyncio.gather(*(run(steps) for steps in all_steps), return_exceptions=True)
+
+    async def async_login_to_virtualpoolcare(self) -> dict:
+        """
+        Step 1: Login to VirtualPoolCare and get AWS credentials.
+
+        Returns:
+            dict: Contains access_key, secret_key, session_token, region
+        """
+        return await self._async_run(self._login_steps())
+
+    async def async_get_credentials(self) -> dict:
+        """
+        Return valid AWS credentials, logging in only when the cache is empty or expired.
+
+        Returns:
+            dict: Contains access_key, secret_key, session_token, region
+        """
+        return await self._async_run(self._credentials_steps())
+
+    async def async_make_authenticated_request(
+        self, url: str, method: str, credentials: dict, payload: str = ""
+    ) -> dict:
+        """
+        Make authenticated API request signed with AWS SigV4.
+
+        Signing is pure computation, so it runs inline on the event loop.
+
+        Returns:
+            dict: JSON response
+        """
+        body = await self._async_run(self._authenticated_request_steps(url, method, credentials, payload))
+        return json.loads(body)
+
+    async def async_get_pools_list(self, credentials: dict) -> list:
+        """
+        Step 2: Get list of pools from VirtualPoolCare, walking every page.
+
+        Returns:
+            list: Pool dicts containing pool_id and blue_key
+        """
+        return await self._async_run(self._pools_list_steps(credentials))
+
+    async def async_get_cached_pools(self) -> list:
+        """
+        Return the pools list from the pool index, fetching it only when stale.
+
+        Returns:
+            list: Pool dicts containing pool_id and blue_key
+        """
+        return await self._async_run(self._cached_pools_steps())
+
+    async def async_get_pool_measurements(self, credentials: dict, pool_id: str, blue_key: str) -> dict:
+        """
+        Step 3: Get latest measurements for a specific pool.
+
+        Returns:
+            dict: Latest sensor measurements
+        """
+        return json.loads(await self._async_run(self._pool_measurements_steps(credentials, pool_id, blue_key)))
+
+    async def async_fetch_pool_data(self, pool: dict) -> PoolMeasurements | None:
+        """
+        Fetch and parse the latest measurements for one pool.
+
+        Returns:
+            PoolMeasurements: Readings of the pool's Blue device
+        """
+        return await self._async_run(self._pool_data_steps(pool))
+
+    async def async_fetch_all_data(self) -> dict:
+        """
+        Fetch the latest data for every pool without blocking the event loop.
+
+        Returns:
+            dict: {blue_device_serial: PoolMeasurements} for every pool
+        """
+        return await self._async_run(self._fetch_all_steps())
+
+    async def async_get_first_device(self) -> tuple[str | None, dict]:
+        """
+        Return the serial of the account's first Blue device, e.g. to validate a login.
+
+        Only logs in and fetches the pools list, unless the pools list has no
+        serials; then the first pool's measurements are fetched to read it.
+
+        Returns:
+            tuple: blue_device_serial (None if the device has no measurements),
+                and the fetched data, {blue_device_serial: PoolMeasurements},
+                when it covers every pool of the account (else empty)
+        """
+        await self.async_get_credentials()
+        pools = await self.async_get_cached_pools()
+        pool = pools[0]
+        if pool.get("blue_device_serial"):
+            return pool["blue_device_serial"], {}
+        measurements = await self.async_fetch_pool_data(pool)
+        if not measurements:
+            return None, {}
+        data = self._key_by_device([(pool, measurements)]) if len(pools) == 1 else {}
+        return measurements.device_serial, data
+
+    async def async_fetch_device_data(self, device_serial: str) -> PoolMeasurements | None:
+        """
+        Fetch the latest data for one device seen in an earlier refresh.
+
+        Returns:
+            PoolMeasurements: Readings of the device, or None if its pool is gone
+        """
+        pool = self.device_pools.get(device_serial)
+        if pool is None:
+            raise ValueError(f"Unknown VirtualPoolCare device {device_serial}")
+
+        await self.async_get_credentials()
+        results, missing = await self._async_run(self._fetch_pools_steps([pool]))
+        if missing:
+            # Let the next full refresh re-fetch the pools list
+            self.pool_index.invalidate()
+            return None
+        return self._key_by_device(results).get(device_serial)
+
+    async def async_fetch_data(self) -> dict:
+        """
+        Fetch VirtualPoolCare data for the first pool on the account.
+
+        Returns:
+            dict: Complete sensor data
+        """
+        devices = await self.async_fetch_all_data()
+        measurements = next(iter(devices.values()), None)
+        return measurements.as_dict() if measurements is not None else {}
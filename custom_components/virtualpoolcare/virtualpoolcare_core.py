@@ -1,56 +1,1174 @@
 """Core VirtualPoolCare API logic without Home Assistant dependencies."""
-import logging
+from __future__ import annotations
+
+import bisect
+import hashlib
 import json
+import logging
+import os
 import random
+import threading
+import time
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+from .measurements import LEGACY_METADATA_KEYS, LEGACY_SUFFIXES, PoolMeasurements
+from .sigv4 import SigV4Signer
 
 _LOGGER = logging.getLogger(__name__)
 
 # Configuration constants
 DOMAIN = "virtualpoolcare"
 SCAN_INTERVAL_HOURS = 6
-BASE_URL = "https://vpc.virtualpoolcare.io/prod"
+# Overridable for development, e.g. to point at the local stand-in server
+BASE_URL = os.environ.get("VIRTUALPOOLCARE_BASE_URL", "https://vpc.virtualpoolcare.io/prod")
+
+# Temporary AWS credentials from Cognito are valid for one hour unless the
+# login response says otherwise. Refresh them a few minutes before expiry.
+CREDENTIAL_DEFAULT_TTL_SECONDS = 3600
+CREDENTIAL_REFRESH_MARGIN_SECONDS = 300
+
+# The pools list (pool_id/blue_key) rarely changes; re-fetch it once a day
+POOL_INDEX_TTL_SECONDS = 24 * 3600
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+AUTH_FAILURE_STATUS_CODES = (401, 403)
+NOT_FOUND_STATUS_CODE = 404
+
+# HTTP transport settings (one pooled session per API instance)
+REQUEST_TIMEOUT_SECONDS = 30
+HTTP_POOL_CONNECTIONS = 2
+HTTP_POOL_MAXSIZE = 10
+
+# Pools list pagination and concurrent measurement fetching
+POOLS_PAGE_SIZE = 15
+POOLS_MAX_PAGES = 100
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# Adaptive polling: poll shortly after a device's next measurement is due,
+# never more often than the minimum or less often than the configured interval
+POLL_MIN_INTERVAL_SECONDS = 5 * 60
+POLL_DELAY_AFTER_MEASUREMENT_SECONDS = 2 * 60
+POLL_CADENCE_HISTORY = 8
+POLL_MAX_BACKOFF_STEPS = 10
+
+
+# Rolling statistics (mean, min, max, rate of change) over these windows are
+# kept for these readings, in ring buffers of ROLLING_CAPACITY readings each
+ROLLING_READINGS = ("ph", "orp", "temperature", "salinity")
+ROLLING_WINDOWS = {"24h": 24 * 3600, "7d": 7 * 24 * 3600}
+ROLLING_CAPACITY = 2048
+
+# Transient failures (network errors, timeouts, 429 and 5xx) are retried with
+# full-jitter exponential backoff; after repeated failures the circuit breaker
+# pauses all requests for a while instead of hammering the backend
+REQUEST_RETRIES = 3
+RETRY_BACKOFF_BASE_SECONDS = 0.5
+RETRY_BACKOFF_MAX_SECONDS = 8
+TOO_MANY_REQUESTS_STATUS_CODE = 429
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_SECONDS = 5 * 60
+
+# Refresh stages timed into histograms ("refresh" is the whole refresh), and
+# the upper bounds (ms) of the histogram buckets; slower ones go in a last bucket
+REFRESH_STAGES = ("refresh", "login", "pools", "measurements", "parse")
+REFRESH_HISTOGRAM_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class VirtualPoolCareError(Exception):
+    """Base class for errors talking to the VirtualPoolCare API."""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+class VirtualPoolCareAuthError(VirtualPoolCareError):
+    """The login or the signed credentials were rejected (401/403)."""
+
+
+class VirtualPoolCareNotFoundError(VirtualPoolCareError):
+    """The requested resource does not exist (404), e.g. a removed pool."""
+
+
+class VirtualPoolCareTransientError(VirtualPoolCareError):
+    """A failure worth retrying: network error, timeout, 429 or 5xx."""
+
+
+class VirtualPoolCareCircuitOpenError(VirtualPoolCareError):
+    """Requests are paused because the API kept failing."""
+
+    def __init__(self, retry_in: float):
+        super().__init__(
+            f"VirtualPoolCare API paused after repeated failures, retrying in {retry_in:.0f}s"
+        )
+        self.retry_in = retry_in
+
+
+def _parse_expiration(expiration) -> float | None:
+    """Convert a login `expiration` value (epoch or ISO string) to epoch seconds."""
+    if expiration is None:
+        return None
+    if isinstance(expiration, (int, float)):
+        # Some AWS endpoints report milliseconds
+        return expiration / 1000 if expiration > 1e11 else float(expiration)
+    try:
+        return datetime.fromisoformat(str(expiration).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        _LOGGER.debug("Could not parse credential expiration %s", expiration)
+        return None
+
+
+def _http_status(err: Exception) -> int | None:
+    """Return the HTTP status of a requests or aiohttp error, if it has one."""
+    status = getattr(err, "status", None)
+    if isinstance(status, int):
+        return status
+    response = getattr(err, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _is_auth_failure(err: Exception) -> bool:
+    """Return True if an HTTP error was caused by rejected credentials."""
+    return _http_status(err) in AUTH_FAILURE_STATUS_CODES
+
+
+def _is_not_found(err: Exception) -> bool:
+    """Return True if an HTTP error was a 404 (e.g. a pool that no longer exists)."""
+    return _http_status(err) == NOT_FOUND_STATUS_CODE
+
+
+def _typed_error(err: Exception, connection_errors: tuple = (OSError,)) -> Exception:
+    """
+    Map a requests/aiohttp exception to a VirtualPoolCareError.
+    
+    Args:
+        err: Exception raised while sending a request or reading its response
+        connection_errors: Exception types that mean the API could not be reached
+        
+    Returns:
+        Exception: The typed error, or `err` itself if it is not an HTTP failure
+    """
+    if isinstance(err, VirtualPoolCareError):
+        return err
+    status = _http_status(err)
+    if status in AUTH_FAILURE_STATUS_CODES:
+        return VirtualPoolCareAuthError(f"VirtualPoolCare rejected the credentials (HTTP {status})", status)
+    if status == NOT_FOUND_STATUS_CODE:
+        return VirtualPoolCareNotFoundError(f"VirtualPoolCare resource not found (HTTP {status})", status)
+    if status is not None:
+        message = f"VirtualPoolCare API error (HTTP {status})"
+        if status == TOO_MANY_REQUESTS_STATUS_CODE or status >= 500:
+            return VirtualPoolCareTransientError(message, status)
+        return VirtualPoolCareError(message, status)
+    if isinstance(err, connection_errors):
+        return VirtualPoolCareTransientError(f"Cannot reach VirtualPoolCare: {err or type(err).__name__}")
+    return err
+
+
+class CredentialCache:
+    """Thread-safe cache for the temporary AWS credentials returned by login."""
+
+    def __init__(
+        self,
+        refresh_margin: float = CREDENTIAL_REFRESH_MARGIN_SECONDS,
+        default_ttl: float = CREDENTIAL_DEFAULT_TTL_SECONDS,
+    ):
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+        self._credentials = None
+        self._expires_at = 0.0
+
+    def get(self) -> dict | None:
+        """Return cached credentials if they have not expired, else None."""
+        with self._lock:
+            if self._credentials is not None and time.monotonic() < self._expires_at:
+                self.hits += 1
+                return self._credentials
+            self.misses += 1
+            return None
+
+    def store(self, credentials: dict) -> None:
+        """Cache a credential bundle, deriving its expiry from `expiration`."""
+        expires_epoch = _parse_expiration(credentials.get("expiration"))
+        if expires_epoch is not None:
+            ttl = expires_epoch - time.time()
+        else:
+            ttl = self.default_ttl
+        with self._lock:
+            self._credentials = credentials
+            self._expires_at = time.monotonic() + ttl
+
+    def needs_refresh(self) -> bool:
+        """Return True if the cached credentials are close to expiry."""
+        with self._lock:
+            return (
+                self._credentials is not None
+                and time.monotonic() >= self._expires_at - self.refresh_margin
+            )
+
+    def peek(self) -> dict | None:
+        """Return cached credentials if they have not expired, without counting a lookup."""
+        with self._lock:
+            if self._credentials is not None and time.monotonic() < self._expires_at:
+                return self._credentials
+            return None
+
+    def invalidate(self, credentials: dict | None = None) -> None:
+        """
+        Drop the cached credentials, forcing the next caller to log in.
+        
+        Args:
+            credentials: Only drop the cache if it still holds this bundle, so
+                callers rejected with the same credentials trigger one login
+        """
+        with self._lock:
+            if credentials is not None and credentials is not self._credentials:
+                return
+            if self._credentials is not None:
+                self.invalidations += 1
+            self._credentials = None
+            self._expires_at = 0.0
+
+    @property
+    def seconds_remaining(self) -> float:
+        """Seconds until the cached credentials expire (0 if none)."""
+        with self._lock:
+            if self._credentials is None:
+                return 0.0
+            return max(0.0, self._expires_at - time.monotonic())
+
+    def stats(self) -> dict:
+        """Return cache counters for diagnostics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "invalidations": self.invalidations,
+            "seconds_remaining": round(self.seconds_remaining),
+        }
+
+
+class PoolIndex:
+    """Cached pools list (pool_id/blue_key per pool) with a time-to-live.
+    
+    The index can be exported with `as_dict()` and restored with `restore()`
+    so it survives restarts.
+    """
+
+    def __init__(self, ttl: float = POOL_INDEX_TTL_SECONDS):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+        self._lock = threading.Lock()
+        self._pools = None
+        self._fetched_at = None
+
+    def get(self) -> list | None:
+        """Return the cached pools if the index is still fresh, else None."""
+        with self._lock:
+            if self._pools is not None and time.time() - self._fetched_at < self.ttl:
+                self.hits += 1
+                return self._pools
+            self.misses += 1
+            return None
+
+    def store(self, pools: list, fetched_at: float | None = None) -> None:
+        """Replace the cached pools."""
+        with self._lock:
+            self._pools = list(pools)
+            self._fetched_at = fetched_at if fetched_at is not None else time.time()
+            self.version += 1
+
+    def invalidate(self) -> None:
+        """Drop the cached pools so the next refresh re-fetches them."""
+        with self._lock:
+            if self._pools is not None:
+                self.version += 1
+            self._pools = None
+            self._fetched_at = None
+
+    def as_dict(self) -> dict:
+        """Return the index in a JSON-serialisable form."""
+        with self._lock:
+            return {"pools": self._pools, "fetched_at": self._fetched_at}
+
+    def restore(self, data: dict | None) -> None:
+        """Load an index previously returned by `as_dict()`."""
+        if not data or not data.get("pools") or data.get("fetched_at") is None:
+            return
+        self.store(data["pools"], data["fetched_at"])
+
+    def stats(self) -> dict:
+        """Return cache counters for diagnostics."""
+        with self._lock:
+            cached = len(self._pools) if self._pools is not None else 0
+            fetched_at = self._fetched_at
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "pools": cached,
+            "fetched_at": fetched_at,
+        }
+
+
+def response_fingerprint(body: bytes) -> bytes:
+    """Return a short digest identifying a raw response body."""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+class ResponseFingerprints:
+    """Remembers the fingerprint and parsed result of the last response per pool.
+    
+    When a pool's lastMeasurements body is byte-for-byte unchanged, the
+    previously parsed object is returned instead of decoding and parsing
+    the response again.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, key: str, fingerprint: bytes):
+        """Return the parsed result stored for `key` if its fingerprint matches, else None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def store(self, key: str, fingerprint: bytes, parsed) -> None:
+        """Remember the parsed result of the response with `fingerprint`."""
+        with self._lock:
+            self._entries[key] = (fingerprint, parsed)
+
+    def clear(self) -> None:
+        """Forget all stored responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return dedup counters for diagnostics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+class PollScheduler:
+    """Learns each Blue device's measurement cadence and picks the next poll time.
+    
+    The cadence is the median gap between the distinct measurement
+    timestamps seen so far. The next poll is scheduled just after the
+    earliest expected measurement; while a measurement is overdue and the
+    data stays unchanged, the delay doubles on every poll. The interval is
+    always between `min_interval` and `max_interval` (the configured one).
+    """
+
+    def __init__(
+        self,
+        max_interval: float,
+        min_interval: float = POLL_MIN_INTERVAL_SECONDS,
+        delay: float = POLL_DELAY_AFTER_MEASUREMENT_SECONDS,
+        history: int = POLL_CADENCE_HISTORY,
+    ):
+        self.max_interval = max_interval
+        self.min_interval = min(min_interval, max_interval)
+        self.delay = delay
+        self.history = history
+        self.unchanged_polls = 0
+        self.last_interval = max_interval
+        self._timestamps = {}
+        self._unchanged = {}
+        self._expired = set()
+
+    def observe(self, devices: dict) -> None:
+        """Record the latest measurement time of every device ({serial: PoolMeasurements})."""
+        for serial in set(self._timestamps) - set(devices):
+            # Pool removed from the account
+            del self._timestamps[serial]
+            self._unchanged.pop(serial, None)
+            self._expired.discard(serial)
+        
+        for serial, measurements in devices.items():
+            if measurements.last_measurement is None:
+                continue
+            timestamp = measurements.last_measurement.timestamp()
+            history = self._timestamps.setdefault(serial, deque(maxlen=self.history))
+            if history and timestamp <= history[-1]:
+                self._unchanged[serial] = self._unchanged.get(serial, 0) + 1
+                self.unchanged_polls += 1
+            else:
+                history.append(timestamp)
+                self._unchanged[serial] = 0
+            
+            # A device whose readings are all expired is offline; don't chase it
+            readings = measurements.measurements.values()
+            if readings and all(reading.expired for reading in readings):
+                self._expired.add(serial)
+            else:
+                self._expired.discard(serial)
+
+    def cadence(self, serial: str) -> float | None:
+        """Return the learned measurement interval of a device in seconds, if known."""
+        history = self._timestamps.get(serial)
+        if not history or len(history) < 2:
+            return None
+        timestamps = list(history)
+        gaps = sorted(b - a for a, b in zip(timestamps, timestamps[1:]))
+        return gaps[len(gaps) // 2]
+
+    def next_interval(self, now: float | None = None) -> float:
+        """Return the number of seconds until the next poll."""
+        now = time.time() if now is None else now
+        interval = self.max_interval
+        for serial, history in self._timestamps.items():
+            cadence = self.cadence(serial)
+            if cadence is None or serial in self._expired:
+                continue
+            due = history[-1] + cadence + self.delay - now
+            if due <= 0:
+                # The measurement is overdue; back off while the data is unchanged
+                steps = min(self._unchanged.get(serial, 0), POLL_MAX_BACKOFF_STEPS)
+                due = self.min_interval * 2 ** steps
+            interval = min(interval, due)
+        self.last_interval = max(self.min_interval, min(interval, self.max_interval))
+        return self.last_interval
+
+    def stats(self) -> dict:
+        """Return the learned cadences and counters for diagnostics."""
+        return {
+            "cadence_seconds": {serial: self.cadence(serial) for serial in self._timestamps},
+            "unchanged_polls": self.unchanged_polls,
+            "next_interval_seconds": self.last_interval,
+        }
+
+
+class CircuitBreaker:
+    """Fails requests fast while the API is down.
+    
+    After `failure_threshold` consecutive failed requests (transient errors
+    that survived their retries) the circuit opens and requests raise
+    VirtualPoolCareCircuitOpenError without touching the network. Once
+    `reset_timeout` has passed a single trial request is let through
+    (half-open): success closes the circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.times_opened = 0
+        self.rejected = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        return self._state
+
+    def _retry_in(self) -> float:
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def before_request(self) -> None:
+        """Raise VirtualPoolCareCircuitOpenError unless a request may be sent now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            retry_in = self._retry_in()
+            if retry_in > 0:
+                self.rejected += 1
+                raise VirtualPoolCareCircuitOpenError(retry_in)
+            # Let one trial request through; others wait for its outcome
+            self._state = self.HALF_OPEN
+            self._opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        """Close the circuit after a request reached the API."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                _LOGGER.info("VirtualPoolCare API is reachable again, resuming requests")
+            self._state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self._state == self.OPEN:
+                return
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                _LOGGER.warning(
+                    "VirtualPoolCare API failed %d times in a row, pausing requests for %ds",
+                    self.failures, self.reset_timeout
+                )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self.times_opened += 1
+
+    def stats(self) -> dict:
+        """Return the circuit state and counters for diagnostics."""
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self.failures,
+                "times_opened": self.times_opened,
+                "rejected_requests": self.rejected,
+                "retry_in_seconds": round(self._retry_in()) if self._state != self.CLOSED else None,
+            }
+
+
+class RefreshStats:
+    """Where refresh time goes: per-stage timing histograms and request counters.
+    
+    Durations of whole refreshes and of their login, pools, measurements
+    (one per pool) and parse stages go into fixed-bucket histograms. Every
+    HTTP attempt is counted, with the bytes it received or the type of error
+    it failed with.
+    """
+
+    def __init__(self, buckets_ms: tuple = REFRESH_HISTOGRAM_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.requests = 0
+        self.bytes_received = 0
+        self.request_errors = {}
+        self.refresh_errors = {}
+        # Epoch times of the last successful and failed refresh
+        self.last_success = None
+        self.last_failure = None
+        self._histograms = {stage: self._empty_histogram() for stage in REFRESH_STAGES}
+        self._lock = threading.Lock()
+
+    def _empty_histogram(self) -> dict:
+        return {"count": 0, "total": 0.0, "max": 0.0, "last": None, "buckets": [0] * (len(self.buckets_ms) + 1)}
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Add a duration of `stage` to its histogram."""
+        milliseconds = seconds * 1000
+        with self._lock:
+            histogram = self._histograms[stage]
+            histogram["count"] += 1
+            histogram["total"] += milliseconds
+            histogram["max"] = max(histogram["max"], milliseconds)
+            histogram["last"] = milliseconds
+            histogram["buckets"][bisect.bisect_left(self.buckets_ms, milliseconds)] += 1
+
+    @contextmanager
+    def timer(self, stage: str):
+        """Time the body of a `with` block (also across awaits) as `stage`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def last_ms(self, stage: str) -> float | None:
+        """Return the last duration of `stage` in milliseconds."""
+        last = self._histograms[stage]["last"]
+        return round(last, 1) if last is not None else None
+
+    def record_request(self, bytes_received: int) -> None:
+        """Count a request that succeeded with a body of `bytes_received` bytes."""
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += bytes_received
+
+    def record_request_error(self, err: Exception) -> None:
+        """Count a request attempt that failed with `err`."""
+        with self._lock:
+            self.requests += 1
+            name = type(err).__name__
+            self.request_errors[name] = self.request_errors.get(name, 0) + 1
+
+    def record_refresh_success(self) -> None:
+        """Note the time of a successful refresh."""
+        self.last_success = time.time()
+
+    def record_refresh_error(self, err: Exception) -> None:
+        """Count a refresh that failed with `err`."""
+        with self._lock:
+            self.last_failure = time.time()
+            name = type(err).__name__
+            self.refresh_errors[name] = self.refresh_errors.get(name, 0) + 1
+
+    def stats(self) -> dict:
+        """Return the counters and per-stage histograms (ms) for diagnostics."""
+        with self._lock:
+            stages = {}
+            for stage, histogram in self._histograms.items():
+                count = histogram["count"]
+                bucket_names = [f"<={bound}" for bound in self.buckets_ms] + [f">{self.buckets_ms[-1]}"]
+                stages[stage] = {
+                    "count": count,
+                    "mean_ms": round(histogram["total"] / count, 1) if count else None,
+                    "max_ms": round(histogram["max"], 1) if count else None,
+                    "last_ms": round(histogram["last"], 1) if count else None,
+                    "histogram_ms": dict(zip(bucket_names, histogram["buckets"])),
+                }
+            return {
+                "requests": self.requests,
+                "bytes_received": self.bytes_received,
+                "request_errors": dict(self.request_errors),
+                "refresh_errors": dict(self.refresh_errors),
+                "last_success": self.last_success,
+                "last_failure": self.last_failure,
+                "stages": stages,
+            }
 
 
 class VirtualPoolCareAPI:
     """Core API client for VirtualPoolCare without Home Assistant dependencies."""
-    
-    def __init__(self, email: str, password: str):
+
+    # Failures that mean the API could not be reached (retried as transient)
+    connection_errors = (OSError,)
+
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        base_url: str = BASE_URL,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    ):
         self.email = email
         self.password = password
+        self.base_url = base_url
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self.credential_cache = CredentialCache()
+        self.pool_index = PoolIndex()
+        self.response_fingerprints = ResponseFingerprints()
+        self.circuit_breaker = CircuitBreaker()
+        self.request_retries = REQUEST_RETRIES
+        self.retry_backoff_base = RETRY_BACKOFF_BASE_SECONDS
+        self.retry_backoff_max = RETRY_BACKOFF_MAX_SECONDS
+        self.retried_requests = 0
+        self.refresh_stats = RefreshStats()
+        # Pool of each device seen so far, and the last fetch time per pool_id
+        self.device_pools = {}
+        self.pool_fetch_seconds = {}
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread = None
+        self._login_lock = threading.Lock()
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._signer = None
+        self._signer_key = None
     
-    def login_to_virtualpoolcare(self) -> dict:
+    @property
+    def session(self):
+        """Long-lived HTTP session with connection pooling and keep-alive."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=HTTP_POOL_CONNECTIONS,
+                        pool_maxsize=max(HTTP_POOL_MAXSIZE, self.max_concurrent_requests)
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Close pooled connections held by this client."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _get_signer(self, credentials: dict) -> SigV4Signer:
+        """Return a SigV4 signer for the credential bundle, reusing it while it is unchanged."""
+        signer_key = (credentials["access_key"], credentials["session_token"], credentials["region"])
+        if self._signer_key != signer_key:
+            self._signer = SigV4Signer(
+                credentials["access_key"],
+                credentials["secret_key"],
+                credentials["session_token"],
+                credentials["region"]
+            )
+            self._signer_key = signer_key
+        return self._signer
+
+    def _sign_request(self, url: str, method: str, credentials: dict, payload: str = "") -> dict:
+        """Return the SigV4-signed headers for a request to `url`."""
+        return self._get_signer(credentials).sign(method, url, JSON_HEADERS, payload)
+
+    @staticmethod
+    def _parse_login_response(json_data: dict) -> dict:
+        """Extract the AWS credential bundle from a login response."""
+        credentials = json_data["credentials"]
+        identity_id = json_data["identity_id"]
+        
+        return {
+            "access_key": credentials["access_key"],
+            "secret_key": credentials["secret_key"],
+            "session_token": credentials["session_token"],
+            "region": identity_id.split(':')[0],
+            "expiration": credentials.get("expiration")
+        }
+
+    @staticmethod
+    def _parse_pools_response(json_data: dict) -> list:
+        """Extract pool_id, blue_key (and blue_device_serial, if listed) of every pool with a Blue device from a pools page."""
+        pools = []
+        for pool in json_data.get("data") or []:
+            if not pool.get("pool_id") or not pool.get("blue_key"):
+                # Pools without a Blue device have no measurements to fetch
+                continue
+            entry = {
+                "pool_id": pool["pool_id"],
+                "blue_key": pool["blue_key"]
+            }
+            if pool.get("blue_device_serial"):
+                entry["blue_device_serial"] = pool["blue_device_serial"]
+            pools.append(entry)
+        return pools
+
+    @staticmethod
+    def _is_last_pools_page(json_data: dict, page: int) -> bool:
+        """Return True if there are no pools after `page`."""
+        page_items = json_data.get("data") or []
+        total = json_data.get("total")
+        if isinstance(total, int):
+            return page * POOLS_PAGE_SIZE >= total
+        return len(page_items) < POOLS_PAGE_SIZE
+
+    def _key_by_device(self, pool_results: list) -> dict:
+        """Map parsed per-pool measurements by blue_device_serial (pool_id as fallback)."""
+        devices = {}
+        for pool, measurements in pool_results:
+            if not measurements:
+                continue
+            device_serial = measurements.device_serial or pool["pool_id"]
+            devices[device_serial] = measurements
+            self.device_pools[device_serial] = pool
+        return devices
+
+    def pool_timings(self, device_serials=None) -> dict:
         """
-        Step 1: Login to VirtualPoolCare and get AWS credentials.
+        Return how long the last measurements fetch of each device's pool took.
         
+        Args:
+            device_serials: Devices to report (defaults to every known device)
+            
         Returns:
-            dict: Contains access_key, secret_key, session_token, region
+            dict: {blue_device_serial: {"pool_id": ..., "duration_ms": ...}}
         """
-        import requests
+        if device_serials is None:
+            device_serials = list(self.device_pools)
+        timings = {}
+        for device_serial in device_serials:
+            pool = self.device_pools.get(device_serial)
+            if pool is None:
+                continue
+            seconds = self.pool_fetch_seconds.get(pool["pool_id"])
+            timings[device_serial] = {
+                "pool_id": pool["pool_id"],
+                "duration_ms": round(seconds * 1000, 1) if seconds is not None else None,
+            }
+        return timings
+
+    def _login_url(self) -> str:
+        return f"{self.base_url}/user/login"
+
+    def _pools_url(self, page: int = 1) -> str:
+        return (
+            f"{self.base_url}/pools?page={page}&results={POOLS_PAGE_SIZE}"
+            "&sortField=user_lastname&sortOrder=ASC"
+        )
+
+    def _measurements_url(self, pool_id: str, blue_key: str) -> str:
+        return f"{self.base_url}/swimming_pool/{pool_id}/blue/{blue_key}/lastMeasurements"
+    
+    # Shared client logic
+    #
+    # The *_steps generators below hold everything the blocking and asyncio
+    # clients have in common, without doing any I/O themselves: each yields the
+    # operations it needs as (operation, *args) tuples and is sent back their
+    # result, or thrown their error. _run() performs the operations with the
+    # blocking _io_* methods; AsyncVirtualPoolCareAPI._async_run() awaits its
+    # _async_io_* methods instead.
+
+    def _run(self, steps):
+        """
+        Drive shared client steps to completion, performing their I/O with blocking calls.
         
-        login_url = f"{BASE_URL}/user/login"
+        Args:
+            steps: Generator returned by one of the *_steps methods
+            
+        Returns:
+            The value returned by the steps
+        """
+        send, value = steps.send, None
+        while True:
+            try:
+                operation, *args = send(value)
+            except StopIteration as done:
+                return done.value
+            try:
+                value, send = getattr(self, f"_io_{operation}")(*args), steps.send
+            except Exception as e:
+                value, send = e, steps.throw
+
+    def _io_send(self, method: str, url: str, kwargs: dict) -> bytes:
+        """Send one request over the pooled session and return the response body."""
+        response = self.session.request(method, url, timeout=REQUEST_TIMEOUT_SECONDS, **kwargs)
+        response.raise_for_status()
+        return response.content
+
+    def _io_sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def _io_login(self) -> dict:
+        return self.login_to_virtualpoolcare()
+
+    def _io_locked(self, steps):
+        """Run `steps` while holding the login lock."""
+        with self._login_lock:
+            return self._run(steps)
+
+    def _io_refresh_credentials(self) -> None:
+        """Refresh the cached credentials on a daemon thread (at most one at a time)."""
+        with self._refresh_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh,
+                name=f"{DOMAIN}-credential-refresh",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    def _io_fan_out(self, all_steps: list) -> list:
+        """
+        Run independent steps concurrently (up to max_concurrent_requests).
+        
+        Returns:
+            list: The result, or the raised exception, of each of `all_steps`
+        """
+        if len(all_steps) == 1:
+            try:
+                return [self._run(all_steps[0])]
+            except Exception as e:
+                return [e]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        workers = min(self.max_concurrent_requests, len(all_steps))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=DOMAIN) as executor:
+            futures = [executor.submit(self._run, steps) for steps in all_steps]
+        return [future.exception() or future.result() for future in futures]
+
+    def _io_call(self, func, *args):
+        return func(*args)
+
+    def _request_steps(self, method: str, url: str, **kwargs):
+        """
+        Send a request, retrying transient failures.
+        
+        Returns:
+            bytes: The body of the successful response
+            
+        Raises:
+            VirtualPoolCareCircuitOpenError: The circuit breaker is open
+            VirtualPoolCareError: The request failed (typed by cause)
+        """
+        self.circuit_breaker.before_request()
+        for attempt in range(self.request_retries + 1):
+            try:
+                body = yield ("send", method, url, kwargs)
+            except Exception as e:
+                yield ("sleep", self._retry_delay_or_raise(e, attempt, self.connection_errors))
+            else:
+                self.circuit_breaker.record_success()
+                self.refresh_stats.record_request(len(body))
+                return body
+
+    def _login_steps(self):
+        """Log in and return the AWS credential bundle."""
         login_data = {
             "email": self.email,
             "password": self.password
         }
         
-        # TODO: Handle error responses (401, 403, 500, etc.)
-        response = requests.post(login_url, json=login_data)
-        response.raise_for_status()
+        with self.refresh_stats.timer("login"):
+            body = yield from self._request_steps("POST", self._login_url(), json=login_data)
+            return self._parse_login_response(json.loads(body))
+
+    def _credentials_steps(self):
+        """
+        Return valid AWS credentials, logging in only when the cache is empty or expired.
         
-        json_data = response.json()
-        credentials = json_data["credentials"]
-        identity_id = json_data["identity_id"]
+        When the cached credentials are close to expiry they are still returned,
+        and a background login replaces them before they run out.
+        """
+        credentials = self.credential_cache.get()
+        if credentials is None:
+            credentials = yield ("locked", self._locked_login_steps())
+        elif self.credential_cache.needs_refresh():
+            yield ("refresh_credentials",)
+        return credentials
+
+    def _locked_login_steps(self):
+        """Log in unless another caller did while this one waited for the login lock."""
+        credentials = self.credential_cache.peek()
+        if credentials is None:
+            _LOGGER.debug("Logging into VirtualPoolCare...")
+            credentials = yield ("login",)
+            self.credential_cache.store(credentials)
+        return credentials
+
+    def _background_refresh_steps(self):
+        """Log in again and replace the cached credentials."""
+        try:
+            credentials = yield ("login",)
+        except Exception as e:
+            # The current credentials are still valid; the next call retries
+            _LOGGER.warning("Background VirtualPoolCare credential refresh failed: %s", e)
+            return
+        self.credential_cache.store(credentials)
+        self.credential_cache.refreshes += 1
+        _LOGGER.debug("Refreshed VirtualPoolCare credentials in the background")
+
+    def _with_credentials_steps(self, steps, *args):
+        """
+        Run `steps(credentials, *args)`, re-logging in once if the credentials are rejected.
         
-        return {
-            "access_key": credentials["access_key"],
-            "secret_key": credentials["secret_key"],
-            "session_token": credentials["session_token"],
-            "region": identity_id.split(':')[0]
-        }
+        Only the rejected request is repeated, and concurrent callers rejected
+        with the same credentials share a single new login.
+        """
+        credentials = yield from self._credentials_steps()
+        try:
+            return (yield from steps(credentials, *args))
+        except Exception as e:
+            if not _is_auth_failure(e):
+                raise
+            _LOGGER.debug("VirtualPoolCare rejected cached credentials, logging in again")
+            self.credential_cache.invalidate(credentials)
+            credentials = yield from self._credentials_steps()
+            return (yield from steps(credentials, *args))
+
+    def _call_steps(self, credentials: dict, func, *args):
+        return (yield ("call", func, credentials, *args))
+
+    def _authenticated_request_steps(self, url: str, method: str, credentials: dict, payload: str = ""):
+        """Make an authenticated API request and return the raw response body."""
+        headers = self._sign_request(url, method, credentials, payload)
+        return (yield from self._request_steps(method, url, headers=headers, data=payload))
+
+    def _pools_list_steps(self, credentials: dict):
+        """Return the pools with a Blue device, walking every page of the pools list."""
+        pools = []
+        for page in range(1, POOLS_MAX_PAGES + 1):
+            body = yield from self._authenticated_request_steps(self._pools_url(page), "GET", credentials)
+            json_data = json.loads(body)
+            pools.extend(self._parse_pools_response(json_data))
+            if self._is_last_pools_page(json_data, page):
+                break
+        
+        if not pools:
+            raise ValueError("No pools with a Blue device found for this account")
+        return pools
+
+    def _cached_pools_steps(self):
+        """Return the pools list from the pool index, fetching it only when stale."""
+        pools = self.pool_index.get()
+        if pools is None:
+            _LOGGER.debug("Getting pools list...")
+            with self.refresh_stats.timer("pools"):
+                pools = yield from self._with_credentials_steps(self._pools_list_steps)
+            self.pool_index.store(pools)
+        return pools
+
+    def _pool_measurements_steps(self, credentials: dict, pool_id: str, blue_key: str):
+        """Return the raw lastMeasurements response body for a pool."""
+        measurements_url = self._measurements_url(pool_id, blue_key)
+        return (yield from self._authenticated_request_steps(measurements_url, "GET", credentials))
+
+    def _pool_data_steps(self, pool: dict):
+        """Fetch and parse the latest measurements for one pool, timing the fetch."""
+        start = time.monotonic()
+        try:
+            body = yield from self._with_credentials_steps(
+                self._pool_measurements_steps,
+                pool["pool_id"],
+                pool["blue_key"]
+            )
+        finally:
+            seconds = time.monotonic() - start
+            self.pool_fetch_seconds[pool["pool_id"]] = seconds
+            self.refresh_stats.observe("measurements", seconds)
+        return self._parse_measurements_body(pool["pool_id"], body)
+
+    def _fetch_pools_steps(self, pools: list):
+        """
+        Fetch measurements for `pools` concurrently.
+        
+        Returns:
+            tuple: ([(pool, PoolMeasurements), ...], [pools that returned 404])
+        """
+        outcomes = []
+        if pools:
+            outcomes = yield ("fan_out", [self._pool_data_steps(pool) for pool in pools])
+        
+        results = []
+        missing = []
+        for pool, outcome in zip(pools, outcomes):
+            if isinstance(outcome, BaseException):
+                if not _is_not_found(outcome):
+                    raise outcome
+                missing.append(pool)
+            else:
+                results.append((pool, outcome))
+        return results, missing
+
+    def _fetch_all_steps(self):
+        """
+        Fetch the latest data for every pool on the account.
+        
+        Measurements for all pools are fetched concurrently, so a refresh
+        takes about as long as the slowest pool.
+        
+        Returns:
+            dict: {blue_device_serial: PoolMeasurements} for every pool
+        """
+        start = time.perf_counter()
+        try:
+            # Step 1: Login (or reuse cached credentials) before fanning out
+            yield from self._credentials_steps()
+            
+            # Step 2: Get pools list (cached in the pool index)
+            pools = yield from self._cached_pools_steps()
+            
+            # Step 3 + 4: Get and parse measurements for every pool
+            _LOGGER.debug("Getting measurements for %d pools...", len(pools))
+            results, missing = yield from self._fetch_pools_steps(pools)
+            
+            if missing:
+                # A cached pool is gone; re-fetch the pools list and retry once
+                _LOGGER.debug(
+                    "Pools %s not found, refreshing pools list",
+                    [pool["pool_id"] for pool in missing]
+                )
+                self.pool_index.invalidate()
+                fetched = {pool["pool_id"] for pool, _ in results}
+                pools = yield from self._cached_pools_steps()
+                retry = [pool for pool in pools if pool["pool_id"] not in fetched]
+                retry_results, still_missing = yield from self._fetch_pools_steps(retry)
+                if still_missing:
+                    _LOGGER.warning(
+                        "VirtualPoolCare pools not found: %s",
+                        [pool["pool_id"] for pool in still_missing]
+                    )
+                results.extend(retry_results)
+            
+            devices = self._key_by_device(results)
+            _LOGGER.debug("Successfully fetched VirtualPoolCare data for %d devices", len(devices))
+            self.refresh_stats.record_refresh_success()
+            return devices
+            
+        except Exception as e:
+            self.refresh_stats.record_refresh_error(e)
+            _LOGGER.error("Error fetching VirtualPoolCare data: %s", str(e))
+            raise
+        finally:
+            self.refresh_stats.observe("refresh", time.perf_counter() - start)
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Return a full-jitter exponential backoff delay for retry number `attempt` (from 0)."""
+        return random.uniform(0, min(self.retry_backoff_max, self.retry_backoff_base * 2 ** attempt))
+
+    def _retry_delay_or_raise(self, err: Exception, attempt: int, connection_errors: tuple = (OSError,)) -> float:
+        """
+        Decide what to do after attempt number `attempt` of a request failed.
+        
+        Must be called from the `except` block handling `err`.
+        
+        Returns:
+            float: Seconds to wait before retrying a transient failure
+            
+        Raises:
+            VirtualPoolCareError: The typed error, if it is not transient or
+                the retries are used up
+        """
+        error = _typed_error(err, connection_errors)
+        self.refresh_stats.record_request_error(error)
+        if not isinstance(error, VirtualPoolCareTransientError):
+            if error is err:
+                raise
+            # The API answered, so it is up even though it refused the request
+            self.circuit_breaker.record_success()
+            raise error from err
+        if attempt >= self.request_retries:
+            self.circuit_breaker.record_failure()
+            raise error from err
+        delay = self._retry_delay(attempt)
+        self.retried_requests += 1
+        _LOGGER.debug("%s, retrying in %.2fs", error, delay)
+        return delay
+
+    # Blocking client
+
+    def login_to_virtualpoolcare(self) -> dict:
+        """
+        Step 1: Login to VirtualPoolCare and get AWS credentials.
+        
+        Returns:
+            dict: Contains access_key, secret_key, session_token, region
+        """
+        return self._run(self._login_steps())
+
+    def get_credentials(self) -> dict:
+        """
+        Return valid AWS credentials, logging in only when the cache is empty or expired.
+        
+        When the cached credentials are close to expiry they are still returned,
+        and a background login replaces them before they run out.
+        
+        Returns:
+            dict: Contains access_key, secret_key, session_token, region
+        """
+        return self._run(self._credentials_steps())
+
+    def _background_refresh(self) -> None:
+        """Log in again and replace the cached credentials."""
+        self._run(self._background_refresh_steps())
+
+    def _call_with_credentials(self, func, *args):
+        """Call `func(credentials, *args)`, re-logging in once if the credentials are rejected."""
+        return self._run(self._with_credentials_steps(self._call_steps, func, *args))
 
     def make_authenticated_request(self, url: str, method: str, credentials: dict, payload: str = "") -> dict:
         """
-        Make authenticated API request using boto3 for AWS signature.
+        Make authenticated API request signed with AWS SigV4.
         
         Args:
             url: Full URL to request
@@ -61,60 +1179,28 @@ class VirtualPoolCareAPI:
         Returns:
             dict: JSON response
         """
-        import boto3
-        from botocore.auth import SigV4Auth
-        from botocore.awsrequest import AWSRequest
-        import requests
-        
-        # Create boto3 session with temporary credentials
-        session = boto3.Session(
-            aws_access_key_id=credentials["access_key"],
-            aws_secret_access_key=credentials["secret_key"],
-            aws_session_token=credentials["session_token"],
-            region_name=credentials["region"]
-        )
-        
-        # Create AWS request object
-        request = AWSRequest(method=method, url=url, data=payload)
-        request.headers['Content-Type'] = 'application/json'
-        
-        # Sign the request
-        SigV4Auth(session.get_credentials(), "execute-api", credentials["region"]).add_auth(request)
-        
-        # Make the actual HTTP request
-        response = requests.request(
-            method=request.method,
-            url=request.url,
-            headers=dict(request.headers),
-            data=request.body
-        )
-        
-        # TODO: Handle error responses
-        response.raise_for_status()
-        return response.json()
+        return json.loads(self._run(self._authenticated_request_steps(url, method, credentials, payload)))
 
-    def get_pools_list(self, credentials: dict) -> dict:
+    def get_pools_list(self, credentials: dict) -> list:
         """
-        Step 2: Get list of pools from VirtualPoolCare.
+        Step 2: Get list of pools from VirtualPoolCare, walking every page.
         
         Args:
             credentials: AWS credentials from login step
             
         Returns:
-            dict: Contains pool_id and blue_key for first pool
+            list: Pool dicts containing pool_id and blue_key
         """
-        pools_url = f"{BASE_URL}/pools?page=1&results=15&sortField=user_lastname&sortOrder=ASC"
-        
-        json_data = self.make_authenticated_request(pools_url, "GET", credentials)
-        
-        # TODO: Handle pagination if > 15 results
-        # TODO: Loop through all results instead of just taking first
-        first_pool = json_data["data"][0]
+        return self._run(self._pools_list_steps(credentials))
+
+    def get_cached_pools(self) -> list:
+        """
+        Return the pools list from the pool index, fetching it only when stale.
         
-        return {
-            "pool_id": first_pool["pool_id"],
-            "blue_key": first_pool["blue_key"]
-        }
+        Returns:
+            list: Pool dicts containing pool_id and blue_key
+        """
+        return self._run(self._cached_pools_steps())
 
     def get_pool_measurements(self, credentials: dict, pool_id: str, blue_key: str) -> dict:
         """
@@ -128,13 +1214,43 @@ class VirtualPoolCareAPI:
         Returns:
             dict: Latest sensor measurements
         """
-        measurements_url = f"{BASE_URL}/swimming_pool/{pool_id}/blue/{blue_key}/lastMeasurements"
+        return json.loads(self._run(self._pool_measurements_steps(credentials, pool_id, blue_key)))
+
+    def parse_measurements(self, measurements_response: dict) -> PoolMeasurements | None:
+        """
+        Step 4: Parse measurements response into Measurement records.
         
-        return self.make_authenticated_request(measurements_url, "GET", credentials)
+        Args:
+            measurements_response: Raw API response from lastMeasurements
+            
+        Returns:
+            PoolMeasurements: Readings keyed by name, or None if the status is not OK
+        """
+        return PoolMeasurements.from_response(measurements_response)
+
+    def _parse_measurements_body(self, pool_id: str, body: bytes) -> PoolMeasurements | None:
+        """
+        Parse a raw lastMeasurements body, reusing the previous result if it is unchanged.
+        
+        Args:
+            pool_id: Pool the response belongs to
+            body: Raw response body
+            
+        Returns:
+            PoolMeasurements: Readings keyed by name, or None if the status is not OK
+        """
+        with self.refresh_stats.timer("parse"):
+            fingerprint = response_fingerprint(body)
+            parsed = self.response_fingerprints.get(pool_id, fingerprint)
+            if parsed is None:
+                parsed = self.parse_measurements(json.loads(body))
+                if parsed is not None:
+                    self.response_fingerprints.store(pool_id, fingerprint, parsed)
+        return parsed
 
     def parse_measurements_data(self, measurements_response: dict) -> dict:
         """
-        Step 4: Parse measurements response into sensor format.
+        Parse measurements response into the legacy flat sensor format.
         
         Args:
             measurements_response: Raw API response from lastMeasurements
@@ -142,159 +1258,112 @@ class VirtualPoolCareAPI:
         Returns:
             dict: Sensor data in format {sensor_name: value}
         """
-        sensor_data = {}
+        parsed = self.parse_measurements(measurements_response)
+        return parsed.as_dict() if parsed is not None else {}
+
+    def fetch_pool_data(self, pool: dict) -> PoolMeasurements | None:
+        """
+        Fetch and parse the latest measurements for one pool.
         
-        if measurements_response.get("status") != "OK":
-            _LOGGER.warning("Measurements response status not OK: %s", measurements_response.get("status"))
-            return sensor_data
+        Args:
+            pool: Pool dict containing pool_id and blue_key
+            
+        Returns:
+            PoolMeasurements: Readings of the pool's Blue device
+        """
+        return self._run(self._pool_data_steps(pool))
+
+    def fetch_all_data(self) -> dict:
+        """
+        Fetch the latest data for every pool on the account.
         
-        # Add metadata
-        sensor_data["blue_device_serial"] = measurements_response.get("blue_device_serial")
-        sensor_data["last_measurement_timestamp"] = measurements_response.get("last_blue_measure_timestamp")
+        Measurements for all pools are fetched concurrently, so a refresh
+        takes about as long as the slowest pool.
         
-        # Parse measurement data
-        for measurement in measurements_response.get("data", []):
-            name = measurement.get("name")
-            value = measurement.get("value")
-            timestamp = measurement.get("timestamp")
-            expired = measurement.get("expired", False)
-            
-            if name and value is not None:
-                sensor_data[name] = value
-                sensor_data[f"{name}_timestamp"] = timestamp
-                sensor_data[f"{name}_expired"] = expired
-                
-                # Gauge and threshold data for the dashboard card
-                sensor_data[f"{name}_gauge_min"] = measurement.get("gauge_min")
-                sensor_data[f"{name}_gauge_max"] = measurement.get("gauge_max")
-                sensor_data[f"{name}_ok_min"] = measurement.get("ok_min")
-                sensor_data[f"{name}_ok_max"] = measurement.get("ok_max")
-                sensor_data[f"{name}_warning_low"] = measurement.get("warning_low")
-                sensor_data[f"{name}_warning_high"] = measurement.get("warning_high")
-                sensor_data[f"{name}_priority"] = measurement.get("priority")
-                
-                # Add trend if available
-                trend = measurement.get("trend")
-                if trend and trend != "undefined":
-                    sensor_data[f"{name}_trend"] = trend
-        
-        return sensor_data
+        Returns:
+            dict: {blue_device_serial: PoolMeasurements} for every pool
+        """
+        return self._run(self._fetch_all_steps())
 
     def fetch_data(self) -> dict:
         """
-        Main function to fetch all VirtualPoolCare data.
+        Fetch VirtualPoolCare data for the first pool on the account.
+        
+        Kept for scripts and single-pool callers; see fetch_all_data().
         
         Returns:
             dict: Complete sensor data
         """
-        try:
-            # Step 1: Login and get credentials
-            _LOGGER.debug("Logging into VirtualPoolCare...")
-            credentials = self.login_to_virtualpoolcare()
-            
-            # Step 2: Get pools list
-            _LOGGER.debug("Getting pools list...")
-            pool_info = self.get_pools_list(credentials)
-            
-            # Step 3: Get measurements
-            _LOGGER.debug("Getting pool measurements...")
-            measurements = self.get_pool_measurements(
-                credentials, 
-                pool_info["pool_id"], 
-                pool_info["blue_key"]
-            )
-            
-            # Step 4: Parse and return data
-            _LOGGER.debug("Parsing measurement data...")
-            sensor_data = self.parse_measurements_data(measurements)
-            
-            _LOGGER.debug("Successfully fetched VirtualPoolCare data: %s sensors", len(sensor_data))
-            return sensor_data
-            
-        except Exception as e:
-            _LOGGER.error("Error fetching VirtualPoolCare data: %s", str(e))
-            raise
+        devices = self.fetch_all_data()
+        measurements = next(iter(devices.values()), None)
+        return measurements.as_dict() if measurements is not None else {}
 
 
 class MockVirtualPoolCareAPI(VirtualPoolCareAPI):
     """Mock version for testing that returns fake data."""
     
+    # name: (value, gauge_min, gauge_max, ok_min, ok_max, warning_low, warning_high)
+    MOCK_READINGS = {
+        "temperature": (lambda: round(random.uniform(20.0, 30.0), 1), 5, 50, 22, 33, 15, 40),
+        "ph": (lambda: round(random.uniform(7.0, 8.0), 2), 6.6, 8.4, 7.2, 7.6, 6.8, 8.0),
+        "orp": (lambda: round(random.uniform(600, 800), 0), 400, 900, 650, 800, 550, 850),
+        "salinity": (lambda: round(random.uniform(2.5, 4.0), 1), 1.4, 5.7, 2.8, 3.8, 2.2, 4.5),
+    }
+    
+    def _mock_measurements_response(self) -> dict:
+        """Return a fake lastMeasurements response, including gauge and threshold data."""
+        timestamp = "2024-01-01T12:00:00.000Z"
+        data = []
+        for priority, (name, reading) in enumerate(self.MOCK_READINGS.items(), start=1):
+            value, gauge_min, gauge_max, ok_min, ok_max, warning_low, warning_high = reading
+            data.append({
+                "name": name,
+                "priority": priority,
+                "timestamp": timestamp,
+                "expired": False,
+                "value": value(),
+                "gauge_min": gauge_min,
+                "gauge_max": gauge_max,
+                "ok_min": ok_min,
+                "ok_max": ok_max,
+                "warning_low": warning_low,
+                "warning_high": warning_high,
+            })
+        return {
+            "status": "OK",
+            "blue_device_serial": "0A2B3C4D",
+            "last_blue_measure_timestamp": timestamp,
+            "data": data,
+        }
+    
     def fetch_data(self) -> dict:
         """Return mock data for testing."""
         _LOGGER.debug(f"Mock fetching VirtualPoolCare data for {self.email}...")
-        
-        base_data = {
-            "temperature": round(random.uniform(20.0, 30.0), 1),
-            "ph": round(random.uniform(7.0, 8.0), 2),
-            "orp": round(random.uniform(600, 800), 0),
-            "salinity": round(random.uniform(2.5, 4.0), 1),
-            "blue_device_serial": "0A2B3C4D",
-            "last_measurement_timestamp": "2024-01-01T12:00:00Z"
-        }
-        
-        # Add gauge and threshold data for testing the frontend card
-        gauge_data = {
-            # Temperature gauge data
-            "temperature_gauge_min": 5,
-            "temperature_gauge_max": 50,
-            "temperature_ok_min": 22,
-            "temperature_ok_max": 33,
-            "temperature_warning_low": 15,
-            "temperature_warning_high": 40,
-            "temperature_priority": 1,
-            
-            # pH gauge data  
-            "ph_gauge_min": 6.6,
-            "ph_gauge_max": 8.4,
-            "ph_ok_min": 7.2,
-            "ph_ok_max": 7.6,
-            "ph_warning_low": 6.8,
-            "ph_warning_high": 8.0,
-            "ph_priority": 2,
-            
-            # ORP gauge data
-            "orp_gauge_min": 400,
-            "orp_gauge_max": 900,
-            "orp_ok_min": 650,
-            "orp_ok_max": 800,
-            "orp_warning_low": 550,
-            "orp_warning_high": 850,
-            "orp_priority": 3,
-            
-            # Salinity gauge data
-            "salinity_gauge_min": 1.4,
-            "salinity_gauge_max": 5.7,
-            "salinity_ok_min": 2.8,
-            "salinity_ok_max": 3.8,
-            "salinity_warning_low": 2.2,
-            "salinity_warning_high": 4.5,
-            "salinity_priority": 4,
-        }
-        
-        return {**base_data, **gauge_data}
+        return self.parse_measurements_data(self._mock_measurements_response())
+
+    def fetch_all_data(self) -> dict:
+        """Return mock data for a single device."""
+        measurements = self.parse_measurements(self._mock_measurements_response())
+        return {measurements.device_serial: measurements}
 
 
 class VirtualPoolCareSensorData:
     """Helper class for sensor data management."""
     
     @staticmethod
-    def get_sensor_keys(data: dict) -> set:
-        """Get keys that should become sensors (exclude metadata)."""
-        excluded_keys = {
-            "blue_device_serial", 
-            "last_measurement_timestamp"
-        }
+    def get_sensor_keys(data: PoolMeasurements | dict) -> set:
+        """Get keys that should become sensors (exclude metadata).
         
-        # Exclude all gauge, threshold, and metadata suffixes
-        excluded_suffixes = (
-            '_timestamp', '_expired', '_trend', '_gauge_min', '_gauge_max',
-            '_ok_min', '_ok_max', '_warning_low', '_warning_high', '_priority'
-        )
+        Accepts parsed PoolMeasurements or the legacy flat dict.
+        """
+        if isinstance(data, PoolMeasurements):
+            return data.sensor_keys()
         
+        # Legacy dict: exclude all gauge, threshold, and metadata suffixes
         return {
             key for key in data.keys() 
-            if not key.endswith(excluded_suffixes)
-            and key not in excluded_keys
+            if not key.endswith(LEGACY_SUFFIXES)
+            and key not in LEGACY_METADATA_KEYS
         }
     
     @staticmethod
@@ -320,4 +1389,171 @@ class VirtualPoolCareSensorData:
     @staticmethod
     def create_entity_name(device_serial: str, sensor_key: str) -> str:
         """Create human-readable entity name."""
-        return f"{DOMAIN} {device_serial} {sensor_key}"
\ No newline at end of file
+        return f"{DOMAIN} {device_serial} {sensor_key}"
+
+
+class RollingWindow:
+    """Mean, min, max and rate of change of the readings in a sliding time window.
+
+    Readings live in two fixed-size arrays used as a ring buffer. The sum is
+    kept up to date and min/max come from monotonic queues of sequence
+    numbers, so adding a reading is O(1) amortised and a summary is O(1).
+    The window ends at the newest reading; when the buffer is full the
+    oldest reading is dropped even if it is still inside the window.
+    """
+
+    __slots__ = (
+        "duration", "capacity", "_times", "_values", "_start", "_next", "_sum", "_min", "_max",
+    )
+
+    def __init__(self, duration: float, capacity: int = ROLLING_CAPACITY):
+        self.duration = duration
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        # Sequence numbers of the oldest reading and of the next one to add
+        self._start = 0
+        self._next = 0
+        self._sum = 0.0
+        # Sequence numbers of readings with increasing (min) / decreasing (max) values
+        self._min = deque()
+        self._max = deque()
+
+    def __len__(self):
+        return self._next - self._start
+
+    def _drop_oldest(self) -> None:
+        seq = self._start
+        self._sum -= self._values[seq % self.capacity]
+        self._start += 1
+        if self._min[0] == seq:
+            self._min.popleft()
+        if self._max[0] == seq:
+            self._max.popleft()
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a reading taken at `timestamp` (epoch seconds), newer than any before it."""
+        if len(self) == self.capacity:
+            self._drop_oldest()
+        seq = self._next
+        slot = seq % self.capacity
+        self._times[slot] = timestamp
+        self._values[slot] = value
+        self._next += 1
+        self._sum += value
+
+        values = self._values
+        capacity = self.capacity
+        while self._min and values[self._min[-1] % capacity] >= value:
+            self._min.pop()
+        self._min.append(seq)
+        while self._max and values[self._max[-1] % capacity] <= value:
+            self._max.pop()
+        self._max.append(seq)
+
+        cutoff = timestamp - self.duration
+        while self._times[self._start % capacity] <= cutoff:
+            self._drop_oldest()
+
+    def summary(self) -> dict | None:
+        """
+        Return the window's statistics, or None if it holds no readings.
+
+        Returns:
+            dict: count, mean, min, max and rate_per_hour (change from the
+                oldest to the newest reading per hour; None for one reading)
+        """
+        count = len(self)
+        if not count:
+            return None
+        capacity = self.capacity
+        oldest = self._start % capacity
+        newest = (self._next - 1) % capacity
+        elapsed = self._times[newest] - self._times[oldest]
+        return {
+            "count": count,
+            "mean": self._sum / count,
+            "min": self._values[self._min[0] % capacity],
+            "max": self._values[self._max[0] % capacity],
+            "rate_per_hour": (
+                (self._values[newest] - self._values[oldest]) * 3600 / elapsed if elapsed > 0 else None
+            ),
+        }
+
+    def readings(self) -> tuple[list, list]:
+        """Return the (timestamps, values) in the window, oldest first."""
+        slots = [seq % self.capacity for seq in range(self._start, self._next)]
+        return [self._times[slot] for slot in slots], [self._values[slot] for slot in slots]
+
+
+class RollingStatistics:
+    """Rolling window statistics per device and reading, fed from each refresh.
+
+    The same measurement is returned by every poll until the device takes a
+    new one, so a reading is only added when its timestamp is newer than the
+    last one added for that device and reading.
+    """
+
+    def __init__(self, readings: tuple = ROLLING_READINGS, windows: dict = ROLLING_WINDOWS):
+        self.readings = readings
+        self.windows = windows
+        self._series: dict[tuple[str, str], dict[str, RollingWindow]] = {}
+        self._last_timestamp: dict[tuple[str, str], float] = {}
+        self.version = 0
+
+    def add(self, device_serial: str, name: str, timestamp: float, value) -> bool:
+        """Add one reading; return False if it is not numeric or not newer than the last one."""
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        key = (device_serial, name)
+        if timestamp <= self._last_timestamp.get(key, float("-inf")):
+            return False
+        windows = self._series.get(key)
+        if windows is None:
+            windows = self._series[key] = {
+                label: RollingWindow(duration) for label, duration in self.windows.items()
+            }
+        for window in windows.values():
+            window.add(timestamp, value)
+        self._last_timestamp[key] = timestamp
+        self.version += 1
+        return True
+
+    def observe(self, devices: dict) -> None:
+        """Add the latest readings of every device ({serial: PoolMeasurements})."""
+        for device_serial, measurements in devices.items():
+            for name in self.readings:
+                measurement = measurements.get(name)
+                if measurement is not None and measurement.timestamp is not None:
+                    self.add(device_serial, name, measurement.timestamp.timestamp(), measurement.value)
+
+    def summary(self, device_serial: str, name: str, window: str) -> dict | None:
+        """Return the statistics of one reading over one window, if it has readings."""
+        windows = self._series.get((device_serial, name))
+        if windows is None:
+            return None
+        return windows[window].summary()
+
+    def as_dict(self) -> dict:
+        """Return the readings of the longest window per series in a JSON-serialisable form."""
+        longest = max(self.windows, key=self.windows.get)
+        return {
+            f"{device_serial}/{name}": windows[longest].readings()
+            for (device_serial, name), windows in self._series.items()
+        }
+
+    def restore(self, data: dict | None) -> None:
+        """Replay readings previously returned by `as_dict()`."""
+        for key, (timestamps, values) in (data or {}).items():
+            device_serial, _, name = key.rpartition("/")
+            for timestamp, value in zip(timestamps, values):
+                self.add(device_serial, name, timestamp, value)
+
+    def stats(self) -> dict:
+        """Return the number of series and buffered readings for diagnostics."""
+        return {
+            "series": len(self._series),
+            "readings": sum(
+                len(window) for windows in self._series.values() for window in windows.values()
+            ),
+        }
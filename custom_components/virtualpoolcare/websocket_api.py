@@ -0,0 +1,190 @@
+"""Websocket API for the VirtualPoolCare frontend card.
+
+`virtualpoolcare/readings` returns every reading of one device with its
+thresholds, trend and rolling statistics in one payload.
+`virtualpoolcare/subscribe_readings` sends the same payload as its first
+event and afterwards, on each coordinator update, only what changed. When
+the device's config entry is unloaded it sends `{"unloaded": true}` and
+ends, so the client can subscribe again to the reloaded entry.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SIGNAL_ENTRY_UNLOADED
+from .coordinator import VirtualPoolCareDataUpdateCoordinator
+from .measurements import THRESHOLD_FIELDS, format_timestamp
+from .virtualpoolcare_core import ROLLING_READINGS, ROLLING_WINDOWS, VirtualPoolCareSensorData
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_readings)
+    websocket_api.async_register_command(hass, websocket_subscribe_readings)
+
+
+def readings_payload(coordinator: VirtualPoolCareDataUpdateCoordinator, device_serial: str) -> dict[str, Any]:
+    """
+    Return the readings of one device in one compact payload.
+
+    Fields that are not set are left out rather than sent as null.
+
+    Returns:
+        dict: {"device_serial", "fetched_at", "restored",
+            "readings": {name: {"value", "timestamp", "expired", "trend", "unit",
+            gauge and threshold fields, "stats": {window: summary}}}}
+    """
+    readings = {}
+    device_data = (coordinator.data or {}).get(device_serial)
+    if device_data is not None:
+        for name, measurement in device_data.measurements.items():
+            reading = {
+                "value": measurement.value,
+                "timestamp": format_timestamp(measurement.timestamp),
+                "expired": measurement.expired,
+                "trend": measurement.trend,
+                "unit": VirtualPoolCareSensorData.get_unit_of_measurement(name),
+            }
+            for field in THRESHOLD_FIELDS:
+                reading[field] = getattr(measurement, field)
+            if name in ROLLING_READINGS:
+                stats = {}
+                for window in ROLLING_WINDOWS:
+                    summary = coordinator.rolling.summary(device_serial, name, window)
+                    if summary is not None:
+                        stats[window] = summary
+                reading["stats"] = stats or None
+            readings[name] = {key: value for key, value in reading.items() if value is not None}
+
+    fetched_at = coordinator.data_fetched_at
+    return {
+        "device_serial": device_serial,
+        "fetched_at": dt_util.utc_from_timestamp(fetched_at).isoformat() if fetched_at is not None else None,
+        "restored": coordinator.data_restored,
+        "readings": readings,
+    }
+
+
+def readings_diff(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return what changed from payload `old` to payload `new`.
+
+    Returns:
+        dict: Changed top-level fields, plus "readings" with only the changed
+            fields of changed readings (None for a field that was dropped) and
+            "removed" with the names of readings that went away. Empty if
+            nothing changed.
+    """
+    diff = {
+        key: value for key, value in new.items()
+        if key != "readings" and old.get(key) != value
+    }
+    old_readings = old["readings"]
+    changed = {}
+    for name, reading in new["readings"].items():
+        previous = old_readings.get(name)
+        if previous is None:
+            changed[name] = reading
+        elif previous != reading:
+            fields = {key: value for key, value in reading.items() if previous.get(key) != value}
+            fields.update({key: None for key in previous.keys() - reading.keys()})
+            changed[name] = fields
+    if changed:
+        diff["readings"] = changed
+    removed = [name for name in old_readings if name not in new["readings"]]
+    if removed:
+        diff["removed"] = removed
+    return diff
+
+
+def _find_device(
+    hass: HomeAssistant, device_serial: str | None
+) -> tuple[VirtualPoolCareDataUpdateCoordinator, str] | None:
+    """Return the coordinator of a device and its serial; the first device if none is given."""
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        data = coordinator.data or {}
+        if device_serial is None:
+            if data:
+                return coordinator, next(iter(data))
+        elif device_serial in data:
+            return coordinator, device_serial
+        else:
+            # Entity IDs, which the card may have been configured from, are lowercase
+            for serial in data:
+                if serial.lower() == device_serial.lower():
+                    return coordinator, serial
+    return None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/readings",
+        vol.Optional("device_serial"): str,
+    }
+)
+@callback
+def websocket_readings(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the readings of a device."""
+    found = _find_device(hass, msg.get("device_serial"))
+    if found is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "VirtualPoolCare device not found")
+        return
+    connection.send_result(msg["id"], readings_payload(*found))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_readings",
+        vol.Optional("device_serial"): str,
+    }
+)
+@callback
+def websocket_subscribe_readings(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send the readings of a device, then what changed after each coordinator update."""
+    found = _find_device(hass, msg.get("device_serial"))
+    if found is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "VirtualPoolCare device not found")
+        return
+    coordinator, device_serial = found
+    last_sent = readings_payload(coordinator, device_serial)
+
+    @callback
+    def async_send_changes() -> None:
+        nonlocal last_sent
+        payload = readings_payload(coordinator, device_serial)
+        diff = readings_diff(last_sent, payload)
+        if diff:
+            last_sent = payload
+            connection.send_message(websocket_api.event_message(msg["id"], diff))
+
+    @callback
+    def async_unsubscribe() -> None:
+        # Called on unload and again when the client unsubscribes
+        while unsubscribers:
+            unsubscribers.pop()()
+
+    @callback
+    def async_entry_unloaded(entry_id: str) -> None:
+        if entry_id == coordinator.entry_id:
+            async_unsubscribe()
+            connection.send_message(websocket_api.event_message(msg["id"], {"unloaded": True}))
+
+    unsubscribers = [
+        coordinator.async_add_listener(async_send_changes),
+        async_dispatcher_connect(hass, SIGNAL_ENTRY_UNLOADED, async_entry_unloaded),
+    ]
+    connection.subscriptions[msg["id"]] = async_unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], {**last_sent, "full": True}))
@@ -0,0 +1,693 @@
+// Bundled with lit into custom_components/virtualpoolcare/frontend by
+// scripts/build_frontend.py, so the card loads from Home Assistant only
+import { LitElement, html, css } from "lit";
+
+const READINGS = ["temperature", "ph", "orp", "salinity"];
+// Reading sensors only, not e.g. sensor.virtualpoolcare_<serial>_ph_mean_24h
+const READING_ENTITY_PATTERN = /^sensor\.virtualpoolcare_([^_]+)_(temperature|ph|orp|salinity)$/;
+// After the integration is reloaded, subscribe again once it had time to set up
+const RESUBSCRIBE_DELAY_MS = 5000;
+
+class PoolReadingsBarCard extends LitElement {
+  static get properties() {
+    return {
+      hass: {},
+      config: {},
+      _readings: {},
+    };
+  }
+
+  static get styles() {
+    return css`
+      :host {
+        display: block;
+        padding: 20px;
+        background: var(--ha-card-background, var(--card-background-color, white));
+        border-radius: var(--ha-card-border-radius, 12px);
+        box-shadow: var(--ha-card-box-shadow, var(--paper-card-box-shadow, 0 2px 2px 0 rgba(0, 0, 0, 0.14)));
+        border: var(--ha-card-border-width, 1px) solid var(--ha-card-border-color, var(--divider-color, #e0e0e0));
+      }
+
+      .card-header {
+        display: flex;
+        align-items: center;
+        margin-bottom: 20px;
+      }
+
+      .header-icon {
+        width: 24px;
+        height: 24px;
+        margin-right: 12px;
+        color: var(--primary-text-color);
+      }
+
+      .header-text {
+        flex: 1;
+      }
+
+      .header-title {
+        font-size: 1.1em;
+        font-weight: 600;
+        color: var(--primary-text-color);
+        margin: 0;
+      }
+
+      .header-subtitle {
+        font-size: 0.9em;
+        color: var(--secondary-text-color);
+        margin: 2px 0 0 0;
+      }
+
+      .reading-row {
+        display: flex;
+        align-items: center;
+        margin-bottom: 36px;
+        min-height: 40px;
+      }
+
+      .reading-row:last-child {
+        margin-bottom: 0;
+      }
+
+      .reading-label {
+        width: 90px;
+        font-weight: 500;
+        color: var(--primary-text-color);
+        font-size: 0.95em;
+        flex-shrink: 0;
+      }
+
+      .bar-container {
+        flex: 1;
+        position: relative;
+        height: 20px;
+        margin: 0 16px;
+        padding-top: 18px;
+      }
+
+      .bar-track {
+        width: 100%;
+        height: 20px;
+        border-radius: 10px;
+        overflow: hidden;
+        position: relative;
+        display: flex;
+      }
+
+      .bar-segment {
+        height: 100%;
+        flex: none;
+      }
+
+      .value-bubble {
+        position: absolute;
+        top: -12px;
+        transform: translateX(-50%);
+        background: var(--primary-color);
+        color: white;
+        padding: 4px 10px; /* Reduced from 6px to 4px for shorter height */
+        border-radius: 12px;
+        font-size: 0.75em; /* Reduced from 0.8em to 0.75em */
+        font-weight: 600;
+        white-space: nowrap;
+        z-index: 10;
+        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);
+        min-width: 40px;
+        text-align: center;
+      }
+
+      .value-bubble::after {
+        content: '';
+        position: absolute;
+        top: 100%;
+        left: 50%;
+        transform: translateX(-50%);
+        width: 0;
+        height: 0;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 4px solid var(--primary-color);
+      }
+
+      .scale-labels {
+        display: flex;
+        justify-content: space-between;
+        margin-top: 6px;
+        font-size: 0.75em;
+        color: var(--secondary-text-color);
+        padding: 0 8px;
+      }
+
+      /* Bubble colors based on range position */
+      .red-bubble { background: #f44336; }
+      .red-bubble::after { border-top-color: #f44336; }
+
+      .orange-bubble { background: #ff9800; }
+      .orange-bubble::after { border-top-color: #ff9800; }
+
+      .blue-bubble { background: #2196f3; }
+      .blue-bubble::after { border-top-color: #2196f3; }
+
+      .default-bubble { background: var(--primary-color); }
+      .default-bubble::after { border-top-color: var(--primary-color); }
+
+      .no-data {
+        text-align: center;
+        color: var(--secondary-text-color);
+        font-style: italic;
+        padding: 20px;
+      }
+
+      .thermometer-icon {
+        fill: currentColor;
+      }
+    `;
+  }
+
+  setConfig(config) {
+    this.config = {
+      device_serial: config.device_serial || null, // Make optional
+      title: config.title || "Latest measurement",
+      show_timestamp: config.show_timestamp !== false,
+      ...config,
+    };
+    
+    // No error thrown if device_serial is missing - we'll auto-detect.
+    // Entity IDs are resolved and readings subscribed again for the new config.
+    this._entityIds = null;
+    this._resolvedWith = undefined;
+    this._unsubscribeReadings();
+    this._subscriptionFailed = false;
+  }
+
+  connectedCallback() {
+    super.connectedCallback();
+    if (this.hass && this.config) {
+      this._subscribeReadings();
+    }
+  }
+
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    this._unsubscribeReadings();
+  }
+
+  updated(changedProps) {
+    if (this.isConnected) {
+      this._subscribeReadings();
+    }
+  }
+
+  _subscribeReadings() {
+    // The integration's websocket API sends all readings of the device with
+    // their thresholds in one payload, then only what changed. Until it has
+    // (or if it fails, e.g. for YAML setups) the card reads hass.states.
+    if (this._subscription || this._subscriptionFailed || !this.hass || !this.hass.connection) {
+      return;
+    }
+    const message = { type: "virtualpoolcare/subscribe_readings" };
+    if (this.config.device_serial) {
+      message.device_serial = this.config.device_serial;
+    }
+    const subscription = this.hass.connection.subscribeMessage(event => this._applyReadings(event), message);
+    this._subscription = subscription;
+    subscription.catch(() => {
+      if (this._subscription === subscription) {
+        this._subscription = null;
+        this._subscriptionFailed = true;
+        this._readings = null;
+      }
+    });
+  }
+
+  _unsubscribeReadings() {
+    clearTimeout(this._resubscribeTimer);
+    this._resubscribeTimer = null;
+    if (this._subscription) {
+      this._subscription.then(unsubscribe => unsubscribe()).catch(() => {});
+      this._subscription = null;
+    }
+    this._readings = null;
+  }
+
+  _applyReadings(event) {
+    if (event.unloaded) {
+      // The config entry was unloaded or is reloading: show hass.states until
+      // the subscription to the new entry succeeds (or fails for good)
+      this._unsubscribeReadings();
+      this._resubscribeTimer = setTimeout(() => {
+        this._resubscribeTimer = null;
+        if (this.isConnected) {
+          this._subscribeReadings();
+        }
+      }, RESUBSCRIBE_DELAY_MS);
+      return;
+    }
+    // The first event holds every reading; later ones only the changed fields
+    // (null for dropped ones) and the names of removed readings
+    const readings = event.full || !this._readings ? {} : { ...this._readings };
+    for (const [name, fields] of Object.entries(event.readings || {})) {
+      const reading = { ...readings[name] };
+      for (const [field, value] of Object.entries(fields)) {
+        if (value === null) {
+          delete reading[field];
+        } else {
+          reading[field] = value;
+        }
+      }
+      readings[name] = reading;
+    }
+    for (const name of event.removed || []) {
+      delete readings[name];
+    }
+    this._readings = readings;
+  }
+
+  shouldUpdate(changedProps) {
+    if (changedProps.has("config") || changedProps.has("_readings") || !this.hass) {
+      return true;
+    }
+    const oldHass = changedProps.get("hass");
+    if (!oldHass || oldHass.locale !== this.hass.locale) {
+      return true;
+    }
+    if (this._readings) {
+      // Readings arrive over the subscription; only the relative time can change
+      return this.config.show_timestamp && this.formatTimestamp(this.getLatestTimestamp()) !== this._timestampText;
+    }
+    // hass changes with every state change in the installation; only render
+    // when the entity IDs we show, or their state objects, actually changed
+    const oldIds = this._entityIds;
+    const entityIds = this.resolveEntityIds();
+    if (entityIds !== oldIds) {
+      return true;
+    }
+    if (Object.values(entityIds.ids).some(id => oldHass.states[id] !== this.hass.states[id])) {
+      return true;
+    }
+    // Keep the relative "minutes ago" header current
+    return this.config.show_timestamp && this.formatTimestamp(this.getLatestTimestamp()) !== this._timestampText;
+  }
+
+  resolveEntityIds() {
+    // Entity IDs are looked up once per config. If a reading is missing, the
+    // lookup is repeated only when the entity registry changes (or, before
+    // hass.entities existed, when the number of entities changes).
+    if (this._entityIds && this._entityIds.complete) {
+      return this._entityIds;
+    }
+    const registry = this.hass.entities || Object.keys(this.hass.states).length;
+    if (this._entityIds && this._resolvedWith === registry) {
+      return this._entityIds;
+    }
+    this._resolvedWith = registry;
+
+    const found = {};
+    let serial = this.config.device_serial;
+    if (serial) {
+      // Try the expected pattern first, then with a lowercase serial
+      for (const reading of READINGS) {
+        for (const candidate of [serial, serial.toLowerCase()]) {
+          const entityId = `sensor.virtualpoolcare_${candidate}_${reading}`;
+          if (this.hass.states[entityId]) {
+            found[reading] = entityId;
+            break;
+          }
+        }
+      }
+    }
+
+    if (Object.keys(found).length < READINGS.length) {
+      // Fallback: one pass over all entities for readings still missing,
+      // auto-detecting the device serial from the first match if not configured
+      for (const entityId of Object.keys(this.hass.states)) {
+        const match = READING_ENTITY_PATTERN.exec(entityId);
+        if (!match || found[match[2]]) {
+          continue;
+        }
+        if (!serial) {
+          serial = match[1];
+        }
+        if (match[1].toLowerCase() === serial.toLowerCase()) {
+          found[match[2]] = entityId;
+        }
+      }
+    }
+
+    const complete = Object.keys(found).length === READINGS.length;
+    const previous = this._entityIds;
+    if (
+      previous &&
+      Object.keys(previous.ids).length === Object.keys(found).length &&
+      READINGS.every(reading => previous.ids[reading] === found[reading])
+    ) {
+      previous.complete = complete;
+      return previous;
+    }
+    this._entityIds = { ids: found, complete };
+    return this._entityIds;
+  }
+
+  getEntity(readingName) {
+    const entityId = this.resolveEntityIds().ids[readingName];
+    return entityId ? this.hass.states[entityId] : undefined;
+  }
+
+  getSensorValue(readingName) {
+    if (this._readings) {
+      const reading = this._readings[readingName];
+      return reading && reading.value !== undefined ? parseFloat(reading.value) : null;
+    }
+    const entity = this.getEntity(readingName);
+    return entity ? parseFloat(entity.state) : null;
+  }
+
+  getSensorAttributes(readingName) {
+    // Readings from the subscription carry the same field names as the attributes
+    if (this._readings) {
+      return this._readings[readingName] || {};
+    }
+    const entity = this.getEntity(readingName);
+    return entity ? entity.attributes : {};
+  }
+
+  hasReadings() {
+    if (this._readings) {
+      return Object.keys(this._readings).length > 0;
+    }
+    return Object.keys(this.resolveEntityIds().ids).length > 0;
+  }
+
+  getReadingConfig(readingName) {
+    const attributes = this.getSensorAttributes(readingName);
+    
+    return {
+      gauge_min: attributes.gauge_min,
+      gauge_max: attributes.gauge_max,
+      ok_min: attributes.ok_min,
+      ok_max: attributes.ok_max,
+      warning_low: attributes.warning_low,
+      warning_high: attributes.warning_high,
+      expired: attributes.expired || false,
+      timestamp: attributes.timestamp,
+      last_measurement: attributes.last_measurement,
+      data_freshness: attributes.data_freshness
+    };
+  }
+
+  createSegments(config) {
+    if (config.gauge_min === undefined || config.gauge_max === undefined) {
+      return [];
+    }
+
+    const { gauge_min, gauge_max, ok_min, ok_max, warning_low, warning_high } = config;
+    const totalRange = gauge_max - gauge_min;
+    const segments = [];
+
+    // Red zone (below warning_low)
+    if (warning_low > gauge_min) {
+      segments.push({
+        start: gauge_min,
+        end: warning_low,
+        color: "#f44336",
+        width: ((warning_low - gauge_min) / totalRange) * 100
+      });
+    }
+
+    // Orange zone (warning_low to ok_min)
+    if (ok_min > warning_low) {
+      segments.push({
+        start: warning_low,
+        end: ok_min,
+        color: "#ff9800",
+        width: ((ok_min - warning_low) / totalRange) * 100
+      });
+    }
+
+    // Blue zone (ok_min to ok_max) - matching the official design
+    segments.push({
+      start: ok_min,
+      end: ok_max,
+      color: "#2196f3",
+      width: ((ok_max - ok_min) / totalRange) * 100
+    });
+
+    // Orange zone (ok_max to warning_high)
+    if (warning_high > ok_max) {
+      segments.push({
+        start: ok_max,
+        end: warning_high,
+        color: "#ff9800",
+        width: ((warning_high - ok_max) / totalRange) * 100
+      });
+    }
+
+    // Red zone (above warning_high)
+    if (gauge_max > warning_high) {
+      segments.push({
+        start: warning_high,
+        end: gauge_max,
+        color: "#f44336",
+        width: ((gauge_max - warning_high) / totalRange) * 100
+      });
+    }
+
+    return segments;
+  }
+
+  getValuePosition(value, config) {
+    if (value === null || value === undefined || config.gauge_min === undefined || config.gauge_max === undefined) {
+      return null;
+    }
+    const range = config.gauge_max - config.gauge_min;
+    const position = ((value - config.gauge_min) / range) * 100;
+    return Math.max(0, Math.min(100, position));
+  }
+
+  getBubbleClass(readingName, value, config) {
+    // Match bubble colors to the official design
+    // Check if value is out of range first
+    if (value !== null && config.gauge_min !== undefined && config.gauge_max !== undefined) {
+      if (value < config.gauge_min || value > config.gauge_max) {
+        return 'red-bubble';
+      }
+    }
+
+    if (value === null || config.ok_min === undefined) {
+      return 'default-bubble';
+    }
+
+    // Return color based on which range the value falls into
+    if (value < config.warning_low) {
+      return 'red-bubble';
+    } else if (value < config.ok_min) {
+      return 'orange-bubble';
+    } else if (value <= config.ok_max) {
+      return 'blue-bubble';
+    } else if (value <= config.warning_high) {
+      return 'orange-bubble';
+    } else {
+      return 'red-bubble';
+    }
+  }
+
+  getUnitOfMeasurement(readingName) {
+    const unitMapping = {
+      "temperature": "°C",
+      "ph": "",
+      "orp": "mV", 
+      "salinity": "g/l"
+    };
+    return unitMapping[readingName] || "";
+  }
+
+  getReadingLabel(readingName) {
+    const labelMapping = {
+      "temperature": "Temperature",
+      "ph": "pH",
+      "orp": "ORP",
+      "salinity": "Salinity"
+    };
+    return labelMapping[readingName] || readingName;
+  }
+
+  formatTimestamp(timestamp) {
+    if (!timestamp) return '';
+    
+    try {
+      const date = new Date(timestamp);
+      const now = new Date();
+      const diffMs = now - date;
+      const diffHours = Math.floor(diffMs / (1000 * 60 * 60));
+      const diffMins = Math.floor(diffMs / (1000 * 60));
+      
+      const locale = this.hass?.locale?.language || navigator.language || 'en-US';
+      
+      if (diffMins < 60) {
+        return `${diffMins} minutes ago`;
+      } else if (diffHours < 24) {
+        return `${diffHours} hours ago`;
+      } else {
+        return date.toLocaleDateString(locale, { 
+          weekday: 'long', 
+          year: 'numeric', 
+          month: 'long', 
+          day: 'numeric',
+          hour: 'numeric',
+          minute: '2-digit'
+        });
+      }
+    } catch (e) {
+      return timestamp;
+    }
+  }
+
+  formatNumberForDisplay(value) {
+    const num = parseFloat(value);
+    if (isNaN(num)) {
+      return ''; // Return empty string if not a valid number
+    }
+    // Round to 2 decimal places
+    return Math.round(num * 100) / 100;
+  }
+
+  renderReading(readingName) {
+    const value = this.getSensorValue(readingName);
+    const config = this.getReadingConfig(readingName);
+    
+    if (!config || config.gauge_min === undefined || config.gauge_max === undefined) {
+      return html`
+        <div class="reading-row">
+          <div class="reading-label">${this.getReadingLabel(readingName)}</div>
+          <div class="bar-container">
+            <div style="color: var(--secondary-text-color); font-size: 0.9em;">No data available</div>
+          </div>
+        </div>
+      `;
+    }
+
+    const segments = this.createSegments(config);
+    const position = this.getValuePosition(value, config);
+    const unit = this.getUnitOfMeasurement(readingName);
+    const bubbleClass = this.getBubbleClass(readingName, value, config);
+
+    // Calculate positions for threshold labels
+    // TODO: consider options if labels may overlap - either stagger or suppress some
+    const totalRange = config.gauge_max - config.gauge_min;
+    const warningLowPos = ((config.warning_low - config.gauge_min) / totalRange) * 100;
+    const okMinPos = ((config.ok_min - config.gauge_min) / totalRange) * 100;
+    const okMaxPos = ((config.ok_max - config.gauge_min) / totalRange) * 100;
+    const warningHighPos = ((config.warning_high - config.gauge_min) / totalRange) * 100;
+
+    return html`
+      <div class="reading-row">
+        <div class="reading-label">${this.getReadingLabel(readingName)}</div>
+        
+        <div class="bar-container">
+          <div class="bar-track">
+            ${segments.map(segment => html`
+              <div
+                class="bar-segment"
+                style="width: ${segment.width}%; background-color: ${segment.color};"
+              ></div>
+            `)}
+          </div>
+          
+          ${position !== null && value !== null ? html`
+            <div
+              class="value-bubble ${bubbleClass}"
+              style="left: ${position}%;"
+            >
+              ${this.formatNumberForDisplay(value)}${unit}
+            </div>
+          ` : ''}
+          
+          <div class="scale-labels">
+            <span style="position: absolute; left: ${warningLowPos}%; transform: translateX(-50%);">${this.formatNumberForDisplay(config.warning_low)}</span>
+            <span style="position: absolute; left: ${okMinPos}%; transform: translateX(-50%);">${this.formatNumberForDisplay(config.ok_min)}</span>
+            <span style="position: absolute; left: ${okMaxPos}%; transform: translateX(-50%);">${this.formatNumberForDisplay(config.ok_max)}</span>
+            <span style="position: absolute; left: ${warningHighPos}%; transform: translateX(-50%);">${this.formatNumberForDisplay(config.warning_high)}</span>
+          </div>
+        </div>
+      </div>
+    `;
+  }
+
+  getLatestTimestamp() {
+    let latestTimestamp = null;
+    
+    for (const reading of READINGS) {
+      const attributes = this.getSensorAttributes(reading);
+      const timestamp = attributes.timestamp || attributes.last_measurement;
+      if (timestamp && (!latestTimestamp || new Date(timestamp) > new Date(latestTimestamp))) {
+        latestTimestamp = timestamp;
+      }
+    }
+    
+    return latestTimestamp;
+  }
+
+  render() {
+    if (!this.hass || !this.config) {
+      return html`<div>Loading...</div>`;
+    }
+
+    if (!this.hasReadings()) {
+      return html`
+        <div class="card-header">
+          <div class="header-text">
+            <div class="header-title">${this.config.title}</div>
+          </div>
+        </div>
+        <div class="no-data">
+          No VirtualPoolCare sensor entities found. Make sure your VirtualPoolCare integration is set up and working.
+        </div>
+      `;
+    }
+
+    const latestTimestamp = this.getLatestTimestamp();
+    this._timestampText = this.formatTimestamp(latestTimestamp);
+
+    return html`
+      <div class="card-header">
+        <svg class="header-icon thermometer-icon" viewBox="0 0 24 24">
+          <path d="M15 13V5a3 3 0 0 0-6 0v8a5 5 0 1 0 6 0zm-3 4a2 2 0 1 1 0-4 2 2 0 0 1 0 4z"/>
+        </svg>
+        <div class="header-text">
+          <div class="header-title">${this.config.title}</div>
+          ${this.config.show_timestamp && latestTimestamp ? html`
+            <div class="header-subtitle">
+              ${this._timestampText}
+            </div>
+          ` : ''}
+        </div>
+      </div>
+      
+      ${READINGS.map(reading => this.renderReading(reading))}
+    `;
+  }
+
+  getCardSize() {
+    return 3;
+  }
+}
+
+// The card can be loaded twice, e.g. also from the old URL added as a resource by hand
+if (!customElements.get("pool-readings-bar-card")) {
+  customElements.define("pool-readings-bar-card", PoolReadingsBarCard);
+
+  console.info(
+    `%c  POOL-READINGS-BAR-CARD  %c  Loaded automatically with integration  `,
+    "color: orange; font-weight: bold; background: black",
+    "color: white; font-weight: bold; background: dimgray"
+  );
+
+  // Register with Home Assistant's card registry
+  window.customCards = window.customCards || [];
+  window.customCards.push({
+    type: "pool-readings-bar-card",
+    name: "Pool Readings Bar Card",
+    description: "VirtualPoolCare pool water quality display (auto-loaded)",
+    preview: true,
+  });
+}
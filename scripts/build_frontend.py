@@ -0,0 +1,48 @@
+"""Bundle the pool readings bar card with lit into one minified file.
+
+The card's source is frontend/src/pool-readings-bar-card.js and lit comes
+from npm, pinned in frontend/deno.json. The bundle is served by Home
+Assistant, so the card loads without fetching anything from another origin.
+Run this after changing either, then commit the bundle:
+
+    pip install deno
+    python scripts/build_frontend.py
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FRONTEND_SOURCE_DIR = os.path.join(ROOT_DIR, "frontend")
+CARD_SOURCE = os.path.join(FRONTEND_SOURCE_DIR, "src", "pool-readings-bar-card.js")
+CARD_BUNDLE = os.path.join(
+    ROOT_DIR, "custom_components", "virtualpoolcare", "frontend", "pool-readings-bar-card.js"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deno", default=shutil.which("deno"), help="Path to the deno executable")
+    args = parser.parse_args()
+    if not args.deno:
+        sys.exit("deno not found; install it with `pip install deno`")
+
+    subprocess.run(
+        [
+            args.deno, "bundle",
+            "--config", os.path.join(FRONTEND_SOURCE_DIR, "deno.json"),
+            "--platform", "browser",
+            "--format", "esm",
+            "--minify",
+            "--output", CARD_BUNDLE,
+            CARD_SOURCE,
+        ],
+        check=True,
+    )
+    print(f"Saved {CARD_BUNDLE} ({os.path.getsize(CARD_BUNDLE)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Micro-benchmarks of the core parse, classification and entity paths, with a saved baseline.
+
+Times each case on synthetic lastMeasurements payloads of 4 to 10,000
+readings and on many devices:
+
+- parse_measurements_data / parse_measurements: response to legacy dict / records
+- parse_body: raw response bytes to records, as a refresh does (fingerprint cache missed)
+- get_sensor_keys: reading names that become sensors
+- sensor_update: a sensor's per-update cache refresh plus the state and
+  attributes one state write reads (needs Home Assistant)
+- entity_index: creating every entity for all devices (needs Home Assistant)
+
+Save a baseline, change the code, then compare; cases slower than the
+threshold are listed and the exit status is 1:
+
+    python tests/benchmarks/bench_core.py --save
+    python tests/benchmarks/bench_core.py --compare [--threshold 1.5]
+
+Usage (from project root):
+    python tests/benchmarks/bench_core.py [--sizes 4 100 1000 10000] [--devices 100]
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import sys
+import timeit
+from types import SimpleNamespace
+
+# Add project root to path so we can import the integration and test helpers
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, parent_dir)
+
+import tests.conftest  # noqa: F401,E402 - mocks Home Assistant if it is not installed
+from tests.benchmarks.bench_measurements import make_payload  # noqa: E402
+from tests.fake_server import make_measurements, make_pool  # noqa: E402
+
+from custom_components.virtualpoolcare.measurements import PoolMeasurements  # noqa: E402
+from custom_components.virtualpoolcare.virtualpoolcare_core import (  # noqa: E402
+    RollingStatistics,
+    VirtualPoolCareAPI,
+    VirtualPoolCareSensorData,
+)
+
+# Machine-specific, so kept out of git (see .gitignore)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_core.json")
+
+
+def time_us(func, repeat: int) -> float:
+    """Return the best per-call time of `func()` in microseconds.
+
+    Each of `repeat` runs calls `func` enough times to take at least 0.2 s.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def core_cases(sizes: list[int]) -> dict:
+    """Return {case name: callable} for the Home Assistant-free paths."""
+    api = VirtualPoolCareAPI("bench@example.com", "password")
+    cases = {}
+    for size in sizes:
+        payload = make_payload(size)
+        body = json.dumps(payload).encode()
+        parsed = PoolMeasurements.from_response(payload)
+        legacy = parsed.as_dict()
+        cases[f"parse_measurements_data[{size}]"] = lambda payload=payload: api.parse_measurements_data(payload)
+        cases[f"parse_measurements[{size}]"] = lambda payload=payload: api.parse_measurements(payload)
+        cases[f"parse_body[{size}]"] = lambda body=body: api.parse_measurements(json.loads(body))
+        cases[f"get_sensor_keys[{size}]"] = lambda parsed=parsed: VirtualPoolCareSensorData.get_sensor_keys(parsed)
+        cases[f"get_sensor_keys_legacy[{size}]"] = (
+            lambda legacy=legacy: VirtualPoolCareSensorData.get_sensor_keys(legacy)
+        )
+    return cases
+
+
+def entity_cases(devices: int) -> dict:
+    """Return {case name: callable} for the sensor entity paths (needs Home Assistant)."""
+    from custom_components.virtualpoolcare.sensor import EntityIndex, VirtualPoolCareSensor
+
+    data = {}
+    for index in range(devices):
+        measurements = PoolMeasurements.from_response(make_measurements(make_pool(index)))
+        data[measurements.device_serial] = measurements
+    rolling = RollingStatistics()
+    rolling.observe(data)
+    coordinator = SimpleNamespace(
+        data=data, rolling=rolling, data_restored=False, data_fetched_at=None, suppressed_writes=0
+    )
+    serial = next(iter(data))
+    sensor = VirtualPoolCareSensor(coordinator, serial, "ph")
+
+    def sensor_update():
+        sensor._update_from_coordinator_data()
+        sensor.state  # noqa: B018
+        sensor.extra_state_attributes  # noqa: B018
+
+    def entity_index():
+        EntityIndex(coordinator, lambda entities, update_before_add=False: None).async_sync()
+
+    return {"sensor_update": sensor_update, f"entity_index[{devices} devices]": entity_index}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print each case against the baseline and return the names of regressed cases."""
+    regressed = []
+    print(f"{'case':<36} {'baseline':>12} {'now':>12} {'ratio':>7}")
+    for name, now in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<36} {'-':>12} {now:9.2f} µs")
+            continue
+        ratio = now / before
+        flag = "  REGRESSED" if ratio > threshold else ""
+        print(f"{name:<36} {before:9.2f} µs {now:9.2f} µs {ratio:6.2f}x{flag}")
+        if flag:
+            regressed.append(name)
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 100, 1000, 10000], help="Readings per payload")
+    parser.add_argument("--devices", type=int, default=100, help="Devices for the entity benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline file")
+    parser.add_argument("--save", action="store_true", help="Save the results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare the results with the baseline")
+    parser.add_argument("--threshold", type=float, default=1.5, help="Slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    cases = core_cases(args.sizes)
+    if importlib.util.find_spec("homeassistant") is not None:
+        cases.update(entity_cases(args.devices))
+    else:
+        print("Home Assistant is not installed; skipping the sensor and entity cases")
+
+    results = {name: time_us(func, args.repeat) for name, func in cases.items()}
+
+    if args.compare:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print(f"Baseline from Python {baseline['python']} on {baseline['machine']}")
+        regressed = compare(results, baseline["results"], args.threshold)
+        if regressed:
+            print(f"{len(regressed)} case(s) slower than {args.threshold:.2f}x the baseline")
+            sys.exit(1)
+    else:
+        for name, now in results.items():
+            print(f"{name:<36} {now:9.2f} µs")
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(
+                {"python": platform.python_version(), "machine": platform.machine(), "results": results},
+                file, indent=2,
+            )
+        print(f"Saved baseline to {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Load test: many coordinators refreshing against the local stand-in server.
+
+Creates one coordinator per account in a test Home Assistant instance, all
+sharing Home Assistant's HTTP session, and refreshes them concurrently.
+Reports refresh latency percentiles for the first refresh (login and pools
+list) and later refreshes (measurements only), throughput, and the
+requests the server answered. Use --latency and --error-rate to see how
+latency and retries behave under a slow or flaky API. Needs the Home
+Assistant test harness:
+
+    pip install pytest-homeassistant-custom-component
+
+Usage (from project root):
+    python tests/benchmarks/bench_load.py [--accounts 50] [--pools 2] [--refreshes 10]
+        [--latency 0.05] [--error-rate 0.0]
+"""
+import argparse
+import asyncio
+import importlib.util
+import logging
+import os
+import statistics
+import sys
+import time
+from datetime import timedelta
+
+# Add project root to path so we can import the integration and test helpers
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, parent_dir)
+
+from tests.fake_server import FakeVirtualPoolCareServer  # noqa: E402
+
+DOMAIN = "virtualpoolcare"
+
+
+async def drive(coordinator, refreshes: int) -> tuple[list, int]:
+    """Refresh `coordinator` back to back; return the latencies (ms) and the failure count."""
+    latencies = []
+    failures = 0
+    for _ in range(refreshes):
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if not coordinator.last_update_success:
+            failures += 1
+    return latencies, failures
+
+
+async def run(base_url: str, accounts: int, refreshes: int) -> dict:
+    """Refresh `accounts` coordinators `refreshes` times each, concurrently."""
+    from homeassistant.helpers.aiohttp_client import async_get_clientsession
+    from pytest_homeassistant_custom_component.common import async_test_home_assistant
+
+    from custom_components.virtualpoolcare.coordinator import VirtualPoolCareDataUpdateCoordinator
+    from custom_components.virtualpoolcare.virtualpoolcare_async import AsyncVirtualPoolCareAPI
+
+    async with async_test_home_assistant() as hass:
+        session = async_get_clientsession(hass)
+        coordinators = []
+        for index in range(accounts):
+            email = f"load-{index}@example.com"
+            api = AsyncVirtualPoolCareAPI(email, "password", session=session, base_url=base_url)
+            coordinators.append(VirtualPoolCareDataUpdateCoordinator(
+                hass, DOMAIN, timedelta(hours=6), email, "password", entry_id=f"load-{index}", api=api
+            ))
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(drive(coordinator, refreshes) for coordinator in coordinators))
+        elapsed = time.perf_counter() - start
+        await hass.async_stop(force=True)
+
+    return {
+        "elapsed": elapsed,
+        "first": [latencies[0] for latencies, _ in results],
+        "later": [latency for latencies, _ in results for latency in latencies[1:]],
+        "failures": sum(failures for _, failures in results),
+    }
+
+
+def report(label: str, values: list) -> None:
+    """Print a latency percentile line."""
+    if len(values) < 2:
+        return
+    percentiles = statistics.quantiles(values, n=100, method="inclusive")
+    print(
+        f"{label:<16} p50 {percentiles[49]:8.1f} ms  p90 {percentiles[89]:8.1f} ms  "
+        f"p99 {percentiles[98]:8.1f} ms  max {max(values):8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=50, help="Coordinators, one account each")
+    parser.add_argument("--pools", type=int, default=2, help="Pools per account")
+    parser.add_argument("--refreshes", type=int, default=10, help="Refreshes per coordinator")
+    parser.add_argument(
+        "--latency", type=float, default=0.05,
+        help="Seconds the stand-in server waits before answering each signed request",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("pytest_homeassistant_custom_component") is None:
+        sys.exit("This benchmark needs pytest-homeassistant-custom-component (and Home Assistant)")
+
+    # Failed refreshes are counted below rather than logged one by one
+    logging.getLogger("custom_components.virtualpoolcare").setLevel(logging.CRITICAL)
+    logging.getLogger("homeassistant").setLevel(logging.CRITICAL)
+
+    with FakeVirtualPoolCareServer(
+        pool_count=args.pools, latency=args.latency, error_rate=args.error_rate
+    ) as server:
+        result = asyncio.run(run(server.base_url, args.accounts, args.refreshes))
+        requests = sum(server.request_counts.values())
+        request_counts = dict(server.request_counts)
+        injected_errors = server.injected_errors
+
+    refreshes = args.accounts * args.refreshes
+    print(
+        f"{args.accounts} accounts x {args.refreshes} refreshes, {args.pools} pools each, "
+        f"latency {args.latency * 1000:.0f} ms, error rate {args.error_rate:.0%}"
+    )
+    report("first refresh", result["first"])
+    report("later refreshes", result["later"])
+    print(
+        f"throughput       {refreshes / result['elapsed']:8.1f} refreshes/s  "
+        f"{requests / result['elapsed']:8.1f} requests/s  ({result['elapsed']:.2f} s)"
+    )
+    print(f"failed refreshes {result['failures']:8d} of {refreshes}  (injected errors: {injected_errors})")
+    print(f"requests         {request_counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark parse time and memory of Measurement records vs the legacy flat dict.
+
+Builds a synthetic lastMeasurements payload with many readings and compares
+the previous flat f-string-keyed dict parser with PoolMeasurements.
+
+Usage (from project root):
+    python tests/benchmarks/bench_measurements.py [--readings 10000] [--repeat 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Add project root to path so we can import the integration and test helpers
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, parent_dir)
+
+import tests.conftest  # noqa: F401,E402 - mocks Home Assistant if it is not installed
+from tests.fake_server import READINGS, make_pool  # noqa: E402
+from tests.test_measurements import legacy_parse  # noqa: E402
+
+from custom_components.virtualpoolcare.measurements import PoolMeasurements  # noqa: E402
+from custom_components.virtualpoolcare.virtualpoolcare_core import VirtualPoolCareSensorData  # noqa: E402
+
+
+def make_payload(readings: int) -> dict:
+    """Return a lastMeasurements payload with `readings` distinct readings."""
+    pool = make_pool(0)
+    data = []
+    for i in range(readings):
+        name, value, gmin, gmax, okmin, okmax, wlow, whigh = READINGS[i % len(READINGS)]
+        data.append({
+            "name": f"{name}_{i}",
+            "priority": i + 1,
+            "timestamp": "2024-01-01T12:00:00.000Z",
+            "expired": False,
+            "value": value,
+            "trend": "stable",
+            "gauge_min": gmin,
+            "gauge_max": gmax,
+            "ok_min": okmin,
+            "ok_max": okmax,
+            "warning_low": wlow,
+            "warning_high": whigh,
+        })
+    return {
+        "status": "OK",
+        "blue_device_serial": pool["blue_device_serial"],
+        "last_blue_measure_timestamp": "2024-01-01T12:00:00.000Z",
+        "data": data,
+    }
+
+
+def time_ms(func, repeat: int) -> float:
+    """Return the median wall-clock time of `func()` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def retained_bytes(func) -> int:
+    """Return the bytes still allocated by the object `func()` returns."""
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readings", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = make_payload(args.readings)
+    legacy = legacy_parse(payload)
+    parsed = PoolMeasurements.from_response(payload)
+
+    rows = (
+        ("parse", lambda: legacy_parse(payload), lambda: PoolMeasurements.from_response(payload)),
+        (
+            "get_sensor_keys",
+            lambda: VirtualPoolCareSensorData.get_sensor_keys(legacy),
+            lambda: VirtualPoolCareSensorData.get_sensor_keys(parsed),
+        ),
+    )
+
+    print(f"{args.readings} readings, median of {args.repeat} runs")
+    print(f"{'':<16} {'legacy dict':>12} {'records':>12}")
+    for label, legacy_func, model_func in rows:
+        print(f"{label:<16} {time_ms(legacy_func, args.repeat):9.2f} ms {time_ms(model_func, args.repeat):9.2f} ms")
+    print(f"{'as_dict':<16} {'':>12} {time_ms(parsed.as_dict, args.repeat):9.2f} ms")
+
+    legacy_kib = retained_bytes(lambda: legacy_parse(payload)) / 1024
+    model_kib = retained_bytes(lambda: PoolMeasurements.from_response(payload)) / 1024
+    print(f"{'memory':<16} {legacy_kib:8.0f} KiB {model_kib:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
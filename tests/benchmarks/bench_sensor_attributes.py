@@ -0,0 +1,123 @@
+"""Benchmark the per-state-write cost of VirtualPoolCareSensor.
+
+Home Assistant reads `state` and `extra_state_attributes` on every state
+write. This compares the previous per-access computation (rebuilding
+f-string keys and parsing the timestamp on every read) with the values
+the sensor now caches once per coordinator update. Needs Home Assistant:
+
+    pip install pytest-homeassistant-custom-component
+
+Usage (from project root):
+    python tests/benchmarks/bench_sensor_attributes.py [--writes 100000]
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+# Add project root to path so we can import the integration and test helpers
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, parent_dir)
+
+from tests.fake_server import make_measurements, make_pool  # noqa: E402
+
+
+def per_access_sensor_class():
+    """Return a sensor class with the previous per-access properties."""
+    from homeassistant.util import dt as dt_util
+
+    from custom_components.virtualpoolcare.sensor import VirtualPoolCareSensor
+
+    class PerAccessSensor(VirtualPoolCareSensor):
+        """Computes state and attributes from the legacy flat dict on every read."""
+
+        @property
+        def _legacy_data(self):
+            return self.coordinator.legacy_data.get(self._device_serial)
+
+        @property
+        def extra_state_attributes(self):
+            attributes = {}
+            data = self._legacy_data
+            timestamp_key = f"{self._key}_timestamp"
+            if data and timestamp_key in data:
+                attributes["timestamp"] = data[timestamp_key]
+                dt = dt_util.parse_datetime(data[timestamp_key])
+                if dt:
+                    attributes["last_measurement"] = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+            for attr in ("expired", "trend", "gauge_min", "gauge_max", "ok_min",
+                         "ok_max", "warning_low", "warning_high", "priority"):
+                attr_key = f"{self._key}_{attr}"
+                if data and attr_key in data:
+                    attributes[attr] = data[attr_key]
+            attributes["device_serial"] = self._device_serial
+            measurement_time = self.last_updated
+            if measurement_time:
+                age_hours = (dt_util.utcnow() - measurement_time).total_seconds() / 3600
+                attributes["data_age_hours"] = round(age_hours, 1)
+                attributes["data_freshness"] = "fresh" if age_hours <= 12 else "old" if age_hours <= 24 else "stale"
+            return attributes
+
+        @property
+        def state(self):
+            data = self._legacy_data
+            return data.get(self._key) if data else None
+
+        @property
+        def last_updated(self):
+            data = self._legacy_data
+            timestamp_key = f"{self._key}_timestamp"
+            if data and timestamp_key in data:
+                return dt_util.parse_datetime(data[timestamp_key])
+            return None
+
+    return PerAccessSensor
+
+
+def time_writes(sensor, writes: int) -> float:
+    """Return the mean cost (µs) of reading what one state write reads."""
+    start = time.perf_counter()
+    for _ in range(writes):
+        sensor.state  # noqa: B018
+        sensor.extra_state_attributes  # noqa: B018
+    return (time.perf_counter() - start) / writes * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writes", type=int, default=100000)
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("homeassistant") is None:
+        sys.exit("This benchmark needs Home Assistant (pip install pytest-homeassistant-custom-component)")
+
+    from custom_components.virtualpoolcare.measurements import PoolMeasurements
+    from custom_components.virtualpoolcare.sensor import VirtualPoolCareSensor
+
+    pool = make_pool(0)
+    measurements = PoolMeasurements.from_response(make_measurements(pool))
+    serial = measurements.device_serial
+    coordinator = SimpleNamespace(
+        data={serial: measurements},
+        legacy_data={serial: measurements.as_dict()},
+    )
+
+    cached = VirtualPoolCareSensor(coordinator, serial, "ph")
+    per_access = per_access_sensor_class()(coordinator, serial, "ph")
+    assert cached.extra_state_attributes == per_access.extra_state_attributes
+
+    update_start = time.perf_counter()
+    for _ in range(args.writes):
+        cached._update_from_coordinator_data()
+    update_us = (time.perf_counter() - update_start) / args.writes * 1e6
+
+    print(f"Per state write over {args.writes} writes")
+    print(f"per-access      {time_writes(per_access, args.writes):7.2f} µs")
+    print(f"cached          {time_writes(cached, args.writes):7.2f} µs")
+    print(f"(once per coordinator update: {update_us:.2f} µs)")
+
+
+if __name__ == "__main__":
+    main()
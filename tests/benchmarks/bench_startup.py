@@ -0,0 +1,109 @@
+"""Benchmark integration startup: async_setup + async_setup_entry.
+
+Sets up the integration in a test Home Assistant instance against the local
+stand-in server and reports the wall-clock time of each phase. Needs the
+Home Assistant test harness:
+
+    pip install pytest-homeassistant-custom-component
+
+Usage (from project root):
+    python tests/benchmarks/bench_startup.py [--runs 10] [--pools 1] [--latency 0.0]
+"""
+import argparse
+import asyncio
+import functools
+import importlib.util
+import logging
+import os
+import statistics
+import sys
+import time
+from unittest.mock import patch
+
+# Add project root to path so we can import the integration and test helpers
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, parent_dir)
+
+from tests.fake_server import FakeVirtualPoolCareServer  # noqa: E402
+
+DOMAIN = "virtualpoolcare"
+
+
+async def run_once(base_url: str) -> dict:
+    """Set up the integration once and return per-phase timings (ms)."""
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+    from homeassistant import loader
+    from homeassistant.config_entries import ConfigEntryState
+
+    import custom_components.virtualpoolcare as integration
+    from custom_components.virtualpoolcare.virtualpoolcare_async import AsyncVirtualPoolCareAPI
+
+    api_class = functools.partial(AsyncVirtualPoolCareAPI, base_url=base_url)
+    timings = {}
+    async with async_test_home_assistant() as hass:
+        # Same as the enable_custom_integrations fixture
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={"email": "bench@example.com", "password": "password"},
+        )
+        entry.add_to_hass(hass)
+        with patch("custom_components.virtualpoolcare.coordinator.AsyncVirtualPoolCareAPI", api_class):
+            start = time.perf_counter()
+            await integration.async_setup(hass, {})
+            timings["async_setup"] = (time.perf_counter() - start) * 1000
+
+            entry.mock_state(hass, ConfigEntryState.SETUP_IN_PROGRESS)
+            start = time.perf_counter()
+            await integration.async_setup_entry(hass, entry)
+            await hass.async_block_till_done()
+            timings["async_setup_entry"] = (time.perf_counter() - start) * 1000
+
+            await integration.async_unload_entry(hass, entry)
+        await hass.async_stop(force=True)
+    return timings
+
+
+def report(label: str, values: list) -> None:
+    """Print a timing summary line."""
+    print(
+        f"{label:<18} mean {statistics.mean(values):8.2f} ms  "
+        f"p50 {statistics.median(values):8.2f} ms  max {max(values):8.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--pools", type=int, default=1)
+    parser.add_argument(
+        "--latency", type=float, default=0.0,
+        help="Seconds the stand-in server waits before answering each signed request",
+    )
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("pytest_homeassistant_custom_component") is None:
+        sys.exit("This benchmark needs pytest-homeassistant-custom-component (and Home Assistant)")
+
+    # The test instance has no HTTP server, so registering the card only logs an error
+    logging.getLogger("custom_components.virtualpoolcare").setLevel(logging.CRITICAL)
+    logging.getLogger("homeassistant").setLevel(logging.ERROR)
+
+    results = {"async_setup": [], "async_setup_entry": []}
+    with FakeVirtualPoolCareServer(pool_count=args.pools, latency=args.latency) as server:
+        for _ in range(args.runs):
+            timings = asyncio.run(run_once(server.base_url))
+            for phase, elapsed in timings.items():
+                results[phase].append(elapsed)
+
+    print(f"Integration startup over {args.runs} runs ({args.pools} pools, "
+          f"latency {args.latency * 1000:.0f} ms)")
+    for phase, values in results.items():
+        report(phase, values)
+
+
+if __name__ == "__main__":
+    main()
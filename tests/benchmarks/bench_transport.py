@@ -0,0 +1,98 @@
+"""Benchmark per-refresh latency of the one-shot vs pooled HTTP transport.
+
+Runs VirtualPoolCareAPI.fetch_data() against the local stand-in server.
+The "one-shot" client reproduces the previous transport: module-level
+requests calls and a new boto3.Session for every signed request.
+
+Usage (from project root):
+    python tests/benchmarks/bench_transport.py [--refreshes 50] [--connect-latency 0.02]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add project root to path so we can import the integration and test helpers
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, parent_dir)
+
+import tests.conftest  # noqa: F401,E402 - mocks Home Assistant if it is not installed
+from tests.fake_server import FakeVirtualPoolCareServer  # noqa: E402
+
+from custom_components.virtualpoolcare.virtualpoolcare_core import (  # noqa: E402
+    REQUEST_TIMEOUT_SECONDS,
+    VirtualPoolCareAPI,
+)
+
+
+class OneShotTransportAPI(VirtualPoolCareAPI):
+    """API client using the previous per-request transport."""
+
+    def _sign_request(self, url, method, credentials, payload=""):
+        import boto3
+        from botocore.auth import SigV4Auth
+        from botocore.awsrequest import AWSRequest
+
+        session = boto3.Session(
+            aws_access_key_id=credentials["access_key"],
+            aws_secret_access_key=credentials["secret_key"],
+            aws_session_token=credentials["session_token"],
+            region_name=credentials["region"],
+        )
+        request = AWSRequest(method=method, url=url, data=payload)
+        request.headers["Content-Type"] = "application/json"
+        SigV4Auth(session.get_credentials(), "execute-api", credentials["region"]).add_auth(request)
+        return dict(request.headers)
+
+    def _io_send(self, method, url, kwargs):
+        import requests
+
+        response = requests.request(method, url, timeout=REQUEST_TIMEOUT_SECONDS, **kwargs)
+        response.raise_for_status()
+        return response.content
+
+
+def run(api_class, base_url: str, refreshes: int) -> list:
+    """Return per-refresh latencies (ms) for `refreshes` fetch_data() calls."""
+    api = api_class("bench@example.com", "password", base_url=base_url)
+    api.fetch_data()  # warm-up: imports, login
+    latencies = []
+    for _ in range(refreshes):
+        start = time.perf_counter()
+        api.fetch_data()
+        latencies.append((time.perf_counter() - start) * 1000)
+    api.close()
+    return latencies
+
+
+def report(label: str, latencies: list, connections: int) -> None:
+    """Print a latency summary line."""
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:<10} mean {statistics.mean(latencies):7.2f} ms  "
+        f"p50 {statistics.median(latencies):7.2f} ms  p95 {p95:7.2f} ms  "
+        f"connections {connections}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--refreshes", type=int, default=50)
+    parser.add_argument(
+        "--connect-latency", type=float, default=0.02,
+        help="Seconds added per new connection to imitate a TCP+TLS handshake",
+    )
+    args = parser.parse_args()
+
+    print(f"Per-refresh latency over {args.refreshes} refreshes "
+          f"(connect latency {args.connect_latency * 1000:.0f} ms)")
+    for label, api_class in (("one-shot", OneShotTransportAPI), ("pooled", VirtualPoolCareAPI)):
+        with FakeVirtualPoolCareServer(connect_latency=args.connect_latency) as server:
+            latencies = run(api_class, server.base_url, args.refreshes)
+            report(label, latencies, server.connections)
+
+
+if __name__ == "__main__":
+    main()
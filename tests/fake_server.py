@@ -0,0 +1,335 @@
+"""Local stand-in for the VirtualPoolCare cloud API.
+
+Serves the endpoints used by VirtualPoolCareAPI so tests and benchmarks can
+run without real credentials:
+
+    POST /prod/user/login
+    GET  /prod/pools?page=<n>&results=<page size>
+    GET  /prod/swimming_pool/<pool_id>/blue/<blue_key>/lastMeasurements
+
+Signatures are not verified; the server only checks that signed requests
+carry an Authorization header. Faults can be injected with `fail_next`
+(answer the next requests with `fail_status`, or drop the connection when
+it is None), `error_rate` (fail that fraction of requests the same way, at
+random) and `reject_next` (answer signed requests with 403).
+
+Run it on its own to point a development Home Assistant instance at it
+(see VIRTUALPOOLCARE_BASE_URL in tests/README.md):
+
+    python -m tests.fake_server --port 8765 --pools 20 --latency 0.2 --error-rate 0.01
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import socket
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/prod"
+MEASUREMENTS_PATH = re.compile(
+    r"^/swimming_pool/(?P<pool_id>[^/]+)/blue/(?P<blue_key>[^/]+)/lastMeasurements$"
+)
+
+# name, value, gauge_min, gauge_max, ok_min, ok_max, warning_low, warning_high
+READINGS = (
+    ("temperature", 26.4, 5, 50, 22, 33, 15, 40),
+    ("ph", 7.42, 6.6, 8.4, 7.2, 7.6, 6.8, 8.0),
+    ("orp", 712, 400, 900, 650, 800, 550, 850),
+    ("salinity", 3.3, 1.4, 5.7, 2.8, 3.8, 2.2, 4.5),
+)
+
+
+def make_pool(index: int) -> dict:
+    """Return a pools-list entry for the pool at `index`."""
+    return {
+        "pool_id": f"pool-{index:04d}",
+        "blue_key": f"blue-{index:04d}",
+        "blue_device_serial": f"{0x0A2B3C4D + index:08X}",
+    }
+
+
+def make_measurements(pool: dict, timestamp: str | None = None) -> dict:
+    """Return a lastMeasurements payload for `pool`."""
+    timestamp = timestamp or "2024-01-01T12:00:00.000Z"
+    data = []
+    for priority, (name, value, gmin, gmax, okmin, okmax, wlow, whigh) in enumerate(READINGS, start=1):
+        data.append({
+            "name": name,
+            "priority": priority,
+            "timestamp": timestamp,
+            "expired": False,
+            "value": value,
+            "trend": "stable",
+            "gauge_min": gmin,
+            "gauge_max": gmax,
+            "ok_min": okmin,
+            "ok_max": okmax,
+            "warning_low": wlow,
+            "warning_high": whigh,
+        })
+    return {
+        "status": "OK",
+        "blue_device_serial": pool["blue_device_serial"],
+        "last_blue_measure_timestamp": timestamp,
+        "data": data,
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler; state lives on the owning FakeVirtualPoolCareServer."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    owner = None  # set per server instance
+
+    def setup(self):
+        super().setup()
+        self.owner.on_connect(self.connection)
+
+    def finish(self):
+        super().finish()
+        self.owner.on_disconnect(self.connection)
+
+    def log_message(self, format, *args):  # noqa: A002 - signature from base class
+        """Keep benchmark output quiet."""
+
+    def _send_json(self, status: int, body: dict) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _inject_failure(self) -> bool:
+        """Answer with an injected fault, if one is pending; return True if so."""
+        failure = self.owner.take_failure()
+        if failure is False:
+            return False
+        if failure is None:
+            # Drop the connection without answering (network failure)
+            self.close_connection = True
+        else:
+            self._send_json(failure, {"message": "Injected failure"})
+        return True
+
+    def do_POST(self):
+        self._read_body()
+        path = urlparse(self.path).path
+        self.owner.record(path)
+        if self._inject_failure():
+            return
+        if path == f"{API_PREFIX}/user/login":
+            self._send_json(200, self.owner.login_response())
+        else:
+            self._send_json(404, {"message": "Not Found"})
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path
+        self.owner.record(path)
+        if self.owner.latency:
+            time.sleep(self.owner.latency)
+        if self._inject_failure():
+            return
+        if "Authorization" not in self.headers or self.owner.take_rejection():
+            self._send_json(403, {"message": "Missing Authentication Token"})
+            return
+        if not path.startswith(API_PREFIX):
+            self._send_json(404, {"message": "Not Found"})
+            return
+        path = path[len(API_PREFIX):]
+        if path == "/pools":
+            query = parse_qs(parsed.query)
+            page = int(query.get("page", ["1"])[0])
+            results = int(query.get("results", ["15"])[0])
+            start = (page - 1) * results
+            self._send_json(200, {"data": self.owner.pools[start:start + results]})
+            return
+        match = MEASUREMENTS_PATH.match(path)
+        if match:
+            pool = self.owner.find_pool(match["pool_id"], match["blue_key"])
+            if pool is None:
+                self._send_json(404, {"message": "Pool not found"})
+            else:
+                measurements = make_measurements(pool, self.owner.measurement_timestamp)
+                measurements["status"] = self.owner.measurement_status
+                self._send_json(200, measurements)
+            return
+        self._send_json(404, {"message": "Not Found"})
+
+
+class FakeVirtualPoolCareServer:
+    """Threaded HTTP server imitating the VirtualPoolCare API.
+
+    Args:
+        pool_count: Number of pools returned by /pools
+        latency: Seconds to sleep before answering each signed request
+        connect_latency: Seconds to sleep on each new TCP connection,
+            imitating the TCP+TLS handshake of the real HTTPS endpoint
+        error_rate: Fraction of requests failed with fail_status, at random
+        seed: Seed of the random failures, so runs are repeatable
+    """
+
+    def __init__(
+        self,
+        pool_count: int = 1,
+        latency: float = 0.0,
+        connect_latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.pools = [make_pool(i) for i in range(pool_count)]
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self.injected_errors = 0
+        self.request_counts = Counter()
+        # Number of upcoming signed requests to answer with 403 (expired credentials)
+        self.reject_next = 0
+        # Number of upcoming requests to fail with fail_status (None drops the connection)
+        self.fail_next = 0
+        self.fail_status = 503
+        # Timestamp of the measurements served (None for the fixed default)
+        self.measurement_timestamp = None
+        # Status of the measurements served; anything but "OK" has no readings
+        self.measurement_status = "OK"
+        self.connections = 0
+        self._open_connections = set()
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to VirtualPoolCareAPI."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self, port: int = 0) -> str:
+        """Start serving on `port` (a free local port by default) and return the base URL."""
+        handler = type("Handler", (_Handler,), {"owner": self})
+        server_class = type("Server", (ThreadingHTTPServer,), {"request_queue_size": 128})
+        self._httpd = server_class(("127.0.0.1", port), handler)
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        """Shut the server down, closing kept-alive connections and joining their threads."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            with self._lock:
+                open_connections = list(self._open_connections)
+            for connection in open_connections:
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def on_connect(self, connection) -> None:
+        """Count a new client connection and apply the handshake delay."""
+        with self._lock:
+            self.connections += 1
+            self._open_connections.add(connection)
+        if self.connect_latency:
+            time.sleep(self.connect_latency)
+
+    def on_disconnect(self, connection) -> None:
+        """Forget a closed client connection."""
+        with self._lock:
+            self._open_connections.discard(connection)
+
+    def record(self, path: str) -> None:
+        """Count a request by endpoint."""
+        if path.endswith("/lastMeasurements"):
+            endpoint = "lastMeasurements"
+        else:
+            endpoint = path.rsplit("/", 1)[-1]
+        with self._lock:
+            self.request_counts[endpoint] += 1
+
+    def take_rejection(self) -> bool:
+        """Return True if this request should be rejected as unauthorised."""
+        with self._lock:
+            if self.reject_next > 0:
+                self.reject_next -= 1
+                return True
+            return False
+
+    def take_failure(self) -> int | None | bool:
+        """Return the status to fail this request with (None to drop it), or False."""
+        with self._lock:
+            if self.fail_next > 0:
+                self.fail_next -= 1
+                return self.fail_status
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.injected_errors += 1
+                return self.fail_status
+            return False
+
+    def find_pool(self, pool_id: str, blue_key: str) -> dict | None:
+        """Return the pool matching `pool_id` and `blue_key`, if any."""
+        for pool in self.pools:
+            if pool["pool_id"] == pool_id and pool["blue_key"] == blue_key:
+                return pool
+        return None
+
+    def login_response(self) -> dict:
+        """Return a login response with one-hour credentials."""
+        expiration = datetime.now(timezone.utc) + timedelta(hours=1)
+        return {
+            "identity_id": "eu-west-1:00000000-0000-0000-0000-000000000000",
+            "credentials": {
+                "access_key": "ASIAFAKEACCESSKEY",
+                "secret_key": "fake-secret-key",
+                "session_token": "fake-session-token",
+                "expiration": expiration.isoformat().replace("+00:00", "Z"),
+            },
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the VirtualPoolCare stand-in server until interrupted")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pools", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before answering each signed request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    args = parser.parse_args()
+
+    server = FakeVirtualPoolCareServer(pool_count=args.pools, latency=args.latency, error_rate=args.error_rate)
+    print(f"Serving {args.pools} pools at {server.start(args.port)}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"Requests: {dict(server.request_counts)}, injected errors: {server.injected_errors}")
+
+
+if __name__ == "__main__":
+    main()
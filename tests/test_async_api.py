@@ -0,0 +1,61 @@
+"""Test the asyncio VirtualPoolCare API client."""
+import asyncio
+import unittest
+
+import aiohttp
+
+from tests.fake_server import FakeVirtualPoolCareServer, make_pool
+
+from custom_components.virtualpoolcare.virtualpoolcare_async import AsyncVirtualPoolCareAPI
+from custom_components.virtualpoolcare.virtualpoolcare_core import VirtualPoolCareAPI
+
+
+class TestAsyncVirtualPoolCareAPI(unittest.IsolatedAsyncioTestCase):
+    """Test AsyncVirtualPoolCareAPI against the local stand-in server."""
+
+    async def asyncSetUp(self):
+        """Start the stand-in server and an aiohttp session."""
+        self.server = FakeVirtualPoolCareServer()
+        base_url = self.server.start()
+        self.addCleanup(self.server.stop)
+        self.session = aiohttp.ClientSession()
+        self.api = AsyncVirtualPoolCareAPI(
+            "test@example.com", "password", session=self.session, base_url=base_url
+        )
+
+    async def asyncTearDown(self):
+        await self.session.close()
+
+    async def test_fetch_matches_sync_client(self):
+        """The async client returns the same data as the sync client."""
+        data = await self.api.async_fetch_data()
+        sync_api = VirtualPoolCareAPI("test@example.com", "password", base_url=self.server.base_url)
+        self.addCleanup(sync_api.close)
+        sync_data = await asyncio.get_running_loop().run_in_executor(None, sync_api.fetch_data)
+        self.assertEqual(data, sync_data)
+
+    async def test_steady_state_is_one_request(self):
+        """After the first refresh only lastMeasurements is requested."""
+        await self.api.async_fetch_data()
+        await self.api.async_fetch_data()
+        self.assertEqual(self.server.request_counts["login"], 1)
+        self.assertEqual(self.server.request_counts["pools"], 1)
+        self.assertEqual(self.server.request_counts["lastMeasurements"], 2)
+
+    async def test_not_found_invalidates_index(self):
+        """A 404 from lastMeasurements re-fetches the pools list once."""
+        await self.api.async_fetch_data()
+        self.server.pools = [make_pool(3)]
+        data = await self.api.async_fetch_data()
+        self.assertEqual(data["blue_device_serial"], make_pool(3)["blue_device_serial"])
+
+    async def test_relogin_on_auth_failure(self):
+        """Rejected credentials trigger one new login."""
+        await self.api.async_fetch_data()
+        self.server.reject_next = 1
+        await self.api.async_fetch_data()
+        self.assertEqual(self.server.request_counts["login"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
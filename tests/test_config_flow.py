@@ -0,0 +1,116 @@
+"""Test config flow validation and handing its API client to the new entry.
+
+These tests need Home Assistant's test harness
+(pytest-homeassistant-custom-component) and are skipped otherwise.
+"""
+import unittest
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+from tests.conftest import HomeAssistantTestCase
+from tests.fake_server import make_pool
+
+USER_INPUT = {"email": "test@example.com", "password": "password"}
+
+
+class TestValidateInput(HomeAssistantTestCase):
+    """Validate credentials against the stand-in server."""
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        patcher = self.patch_api("config_flow")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def without_pool_serials(self):
+        """Serve pools lists without blue_device_serial, which the real API may not send."""
+        from custom_components.virtualpoolcare.virtualpoolcare_core import VirtualPoolCareAPI
+
+        parse = VirtualPoolCareAPI._parse_pools_response
+
+        def parse_without_serials(json_data):
+            return [
+                {key: value for key, value in pool.items() if key != "blue_device_serial"}
+                for pool in parse(json_data)
+            ]
+
+        return patch.object(VirtualPoolCareAPI, "_parse_pools_response", side_effect=parse_without_serials)
+
+    async def test_validation_only_logs_in_and_lists_pools(self):
+        """The device serial comes from the pools list, without fetching measurements."""
+        from custom_components.virtualpoolcare.config_flow import validate_input
+
+        info = await validate_input(self.hass, USER_INPUT)
+        self.assertEqual(info["device_serial"], make_pool(0)["blue_device_serial"])
+        self.assertEqual(self.server.request_counts["login"], 1)
+        self.assertEqual(self.server.request_counts["pools"], 1)
+        self.assertEqual(self.server.request_counts["lastMeasurements"], 0)
+
+    async def test_serial_from_measurements_when_pools_lack_it(self):
+        """Without serials in the pools list, only the first pool's measurements are read."""
+        from custom_components.virtualpoolcare.config_flow import validate_input
+
+        with self.without_pool_serials():
+            info = await validate_input(self.hass, USER_INPUT)
+        self.assertEqual(info["device_serial"], make_pool(0)["blue_device_serial"])
+        self.assertEqual(self.server.request_counts["lastMeasurements"], 1)
+        # One of two pools is not the account's data
+        self.assertEqual(info["data"], {})
+
+    async def test_rejected_login_is_invalid_auth(self):
+        """A 401 from login is reported as invalid credentials."""
+        from custom_components.virtualpoolcare.config_flow import InvalidAuth, validate_input
+
+        self.server.fail_status = 401
+        self.server.fail_next = 1
+        with self.assertRaises(InvalidAuth):
+            await validate_input(self.hass, USER_INPUT)
+
+    async def test_coordinator_reuses_validated_api(self):
+        """Adding an entry makes one login and one pools request in total."""
+        from custom_components.virtualpoolcare.config_flow import validate_input
+        from custom_components.virtualpoolcare.coordinator import VirtualPoolCareDataUpdateCoordinator
+
+        info = await validate_input(self.hass, USER_INPUT)
+        coordinator = VirtualPoolCareDataUpdateCoordinator(
+            self.hass, "virtualpoolcare", timedelta(hours=6), **USER_INPUT, entry_id="test", api=info["api"]
+        )
+        await coordinator.async_refresh()
+        self.assertEqual(len(coordinator.data), 2)
+        self.assertEqual(self.server.request_counts["login"], 1)
+        self.assertEqual(self.server.request_counts["pools"], 1)
+        self.assertEqual(self.server.request_counts["lastMeasurements"], 2)
+
+    async def test_setup_reuses_validation_measurements(self):
+        """Without serials in the pools list, adding a one-pool entry reads its measurements once."""
+        from homeassistant.config_entries import ConfigEntryState
+        from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+        import custom_components.virtualpoolcare as integration
+        from custom_components.virtualpoolcare.config_flow import validate_input
+        from custom_components.virtualpoolcare.const import DOMAIN, VALIDATION_RESULTS
+
+        self.server.pools = self.server.pools[:1]
+        with self.without_pool_serials():
+            info = await validate_input(self.hass, USER_INPUT)
+            self.hass.data[VALIDATION_RESULTS] = {
+                info["device_serial"]: {"api": info["api"], "data": info["data"]}
+            }
+
+            entry = MockConfigEntry(domain=DOMAIN, data=USER_INPUT, unique_id=info["device_serial"])
+            entry.add_to_hass(self.hass)
+            entry.mock_state(self.hass, ConfigEntryState.SETUP_IN_PROGRESS)
+            with patch.object(self.hass.config_entries, "async_forward_entry_setups", AsyncMock()):
+                await integration.async_setup_entry(self.hass, entry)
+            await self.hass.async_block_till_done()
+
+        coordinator = self.hass.data[DOMAIN][entry.entry_id]
+        self.assertEqual(list(coordinator.data), [make_pool(0)["blue_device_serial"]])
+        self.assertTrue(coordinator.last_update_success)
+        self.assertEqual(self.server.request_counts["login"], 1)
+        self.assertEqual(self.server.request_counts["pools"], 1)
+        self.assertEqual(self.server.request_counts["lastMeasurements"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
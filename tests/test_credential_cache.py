@@ -0,0 +1,118 @@
+"""Test credential caching in the VirtualPoolCare core API."""
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from custom_components.virtualpoolcare.virtualpoolcare_core import (
+    CredentialCache,
+    VirtualPoolCareAPI,
+)
+
+
+def make_credentials(expiration=None):
+    """Return a credential bundle like login_to_virtualpoolcare does."""
+    return {
+        "access_key": "AKIDEXAMPLE",
+        "secret_key": "secret",
+        "session_token": "token",
+        "region": "eu-west-1",
+        "expiration": expiration,
+    }
+
+
+class HTTPError(Exception):
+    """Minimal stand-in for requests.HTTPError."""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = Mock(status_code=status_code)
+
+
+class TestCredentialCache(unittest.TestCase):
+    """Test the CredentialCache helper."""
+
+    def test_empty_cache_is_a_miss(self):
+        """An empty cache returns None and counts a miss."""
+        cache = CredentialCache()
+        self.assertIsNone(cache.get())
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 0)
+
+    def test_stored_credentials_are_a_hit(self):
+        """Stored credentials are returned until they expire."""
+        cache = CredentialCache()
+        credentials = make_credentials()
+        cache.store(credentials)
+        self.assertIs(cache.get(), credentials)
+        self.assertEqual(cache.hits, 1)
+        self.assertFalse(cache.needs_refresh())
+
+    def test_expiration_from_login_response(self):
+        """An ISO expiration close to now marks the bundle for refresh."""
+        cache = CredentialCache(refresh_margin=300)
+        expiration = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 60))
+        cache.store(make_credentials(expiration))
+        self.assertIsNotNone(cache.get())
+        self.assertTrue(cache.needs_refresh())
+
+    def test_expired_credentials_are_a_miss(self):
+        """Credentials past their expiry are not returned."""
+        cache = CredentialCache()
+        cache.store(make_credentials(time.time() - 10))
+        self.assertIsNone(cache.get())
+
+    def test_invalidate(self):
+        """Invalidation drops the cached bundle."""
+        cache = CredentialCache()
+        cache.store(make_credentials())
+        cache.invalidate()
+        self.assertIsNone(cache.get())
+        self.assertEqual(cache.stats()["invalidations"], 1)
+
+
+class TestVirtualPoolCareAPICredentials(unittest.TestCase):
+    """Test that the API reuses credentials across refreshes."""
+
+    def setUp(self):
+        """Set up an API whose network calls are mocked."""
+        self.api = VirtualPoolCareAPI("test@example.com", "test_password")
+        self.login = patch.object(
+            self.api, "login_to_virtualpoolcare", side_effect=lambda: make_credentials()
+        ).start()
+        self.addCleanup(patch.stopall)
+
+    def test_login_only_once(self):
+        """Repeated calls reuse the cached credentials."""
+        first = self.api.get_credentials()
+        second = self.api.get_credentials()
+        self.assertIs(first, second)
+        self.assertEqual(self.login.call_count, 1)
+        self.assertEqual(self.api.credential_cache.hits, 1)
+        self.assertEqual(self.api.credential_cache.misses, 1)
+
+    def test_background_refresh_near_expiry(self):
+        """Credentials close to expiry are refreshed on a background thread."""
+        self.api.credential_cache.store(make_credentials(time.time() + 60))
+        self.api.get_credentials()
+        self.api._refresh_thread.join(timeout=5)
+        self.assertEqual(self.login.call_count, 1)
+        self.assertEqual(self.api.credential_cache.refreshes, 1)
+        self.assertFalse(self.api.credential_cache.needs_refresh())
+
+    def test_relogin_on_auth_failure(self):
+        """A 403 invalidates the cache and retries once with fresh credentials."""
+        func = Mock(side_effect=[HTTPError(403), {"status": "OK"}])
+        result = self.api._call_with_credentials(func)
+        self.assertEqual(result, {"status": "OK"})
+        self.assertEqual(self.login.call_count, 2)
+
+    def test_other_errors_are_raised(self):
+        """Non-auth errors propagate without a new login."""
+        func = Mock(side_effect=HTTPError(500))
+        with self.assertRaises(HTTPError):
+            self.api._call_with_credentials(func)
+        self.assertEqual(self.login.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
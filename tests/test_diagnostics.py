@@ -0,0 +1,90 @@
+"""Test coordinator deduplication and the diagnostics platform.
+
+These tests need Home Assistant's test harness
+(pytest-homeassistant-custom-component) and are skipped otherwise.
+"""
+import unittest
+from unittest.mock import Mock
+
+from tests.conftest import HomeAssistantTestCase
+
+EMAIL = "secret@example.com"
+PASSWORD = "hunter2"
+
+
+class TestCoordinatorDiagnostics(HomeAssistantTestCase):
+    """Run the coordinator against the stand-in server in a test HA instance."""
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.coordinator = self.make_coordinator(email=EMAIL, password=PASSWORD)
+
+    async def test_unchanged_refresh_does_not_notify_listeners(self):
+        """Listeners only run when a refresh returns new data."""
+        listener = Mock()
+        unsubscribe = self.coordinator.async_add_listener(listener)
+        self.addCleanup(unsubscribe)
+
+        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh()
+        self.assertEqual(listener.call_count, 1)
+
+        self.server.measurement_timestamp = "2024-01-01T12:20:00.000Z"
+        await self.coordinator.async_refresh()
+        self.assertEqual(listener.call_count, 2)
+
+    async def test_config_entry_diagnostics(self):
+        """Diagnostics report the dedup hit rate and redact credentials."""
+        from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+        from custom_components.virtualpoolcare.const import DOMAIN
+        from custom_components.virtualpoolcare.diagnostics import async_get_config_entry_diagnostics
+
+        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh()
+
+        entry = MockConfigEntry(domain=DOMAIN, data={"email": EMAIL, "password": PASSWORD})
+        entry.add_to_hass(self.hass)
+        self.hass.data.setdefault(DOMAIN, {})[entry.entry_id] = self.coordinator
+        diagnostics = await async_get_config_entry_diagnostics(self.hass, entry)
+
+        self.assertEqual(diagnostics["coordinator"]["response_fingerprints"]["hit_rate"], 0.5)
+        self.assertEqual(len(diagnostics["coordinator"]["devices"]), 2)
+        self.assertNotIn(EMAIL, str(diagnostics))
+        self.assertNotIn(PASSWORD, str(diagnostics))
+
+        # Two refreshes of two pools, one login and one pools list
+        refresh_stats = diagnostics["coordinator"]["refresh_stats"]
+        counts = {stage: summary["count"] for stage, summary in refresh_stats["stages"].items()}
+        self.assertEqual(counts, {"refresh": 2, "login": 1, "pools": 1, "measurements": 4, "parse": 4})
+        self.assertEqual(refresh_stats["requests"], sum(self.server.request_counts.values()))
+        self.assertIsNotNone(refresh_stats["last_success"])
+
+    async def test_refresh_sensors(self):
+        """The diagnostic sensors report the last refresh and are disabled by default."""
+        from custom_components.virtualpoolcare.sensor import REFRESH_SENSORS, _refresh_entities
+
+        await self.coordinator.async_refresh()
+        sensors = {sensor.unique_id: sensor for sensor in _refresh_entities(self.coordinator)}
+        self.assertEqual(
+            set(sensors), {f"virtualpoolcare_test_{key}" for key in REFRESH_SENSORS}
+        )
+        self.assertFalse(any(sensor.entity_registry_enabled_default for sensor in sensors.values()))
+
+        duration = sensors["virtualpoolcare_test_refresh_duration"]
+        self.assertGreater(duration.native_value, 0)
+        self.assertEqual(set(duration.extra_state_attributes), {"login_ms", "pools_ms", "measurements_ms", "parse_ms"})
+
+        requests = sensors["virtualpoolcare_test_api_requests"]
+        self.assertEqual(requests.native_value, 4)
+        await self.coordinator.async_refresh()
+        await requests.async_update()
+        self.assertEqual(requests.native_value, 6)
+        self.assertEqual(requests.extra_state_attributes["request_errors"], {})
+
+        last_success = sensors["virtualpoolcare_test_last_successful_refresh"]
+        self.assertIsNotNone(last_success.native_value.tzinfo)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Test discovering and removing sensor entities as readings and pools come and go.
+
+These tests need Home Assistant's test harness
+(pytest-homeassistant-custom-component) and are skipped otherwise.
+"""
+import unittest
+
+from tests.conftest import HomeAssistantTestCase
+
+from custom_components.virtualpoolcare.measurements import PoolMeasurements
+
+
+class TestEntityIndex(HomeAssistantTestCase):
+    """Sync a sensor platform with coordinator data fetched from the stand-in server."""
+
+    async def asyncSetUp(self):
+        from pytest_homeassistant_custom_component.common import MockEntityPlatform
+
+        from custom_components.virtualpoolcare.sensor import EntityIndex
+
+        await super().asyncSetUp()
+        self.coordinator = self.make_coordinator()
+        await self.coordinator.async_refresh()
+
+        platform = MockEntityPlatform(self.hass, domain="sensor", platform_name="virtualpoolcare")
+        self.added = []
+
+        def add_entities(entities, update_before_add=False):
+            self.added.extend(entities)
+            self.hass.async_create_task(platform.async_add_entities(entities, update_before_add))
+
+        self.index = EntityIndex(self.coordinator, add_entities)
+        self.addCleanup(self.coordinator.async_add_listener(self.index.async_sync))
+        self.index.async_sync()
+        await self.hass.async_block_till_done()
+
+    def sensor_ids(self) -> set:
+        """Sensors with a state; removed entities keep their registry entry and show as unavailable."""
+        return {
+            state.entity_id for state in self.hass.states.async_all("sensor")
+            if state.state != "unavailable"
+        }
+
+    def set_data(self, data: dict) -> None:
+        self.coordinator.async_set_updated_data(data)
+
+    def without(self, device_serial: str, name: str) -> PoolMeasurements:
+        """A copy of a device's measurements without the reading `name`."""
+        response = self.coordinator.data[device_serial].as_response()
+        response["data"] = [entry for entry in response["data"] if entry["name"] != name]
+        return PoolMeasurements.from_response(response)
+
+    async def test_initial_sync_adds_every_reading(self):
+        """Each reading gets a sensor, rolling readings also get their statistics sensors."""
+        per_device = len(self.added) // 2
+        # 4 readings (all rolling) plus 2 windows each
+        self.assertEqual(per_device, 4 * 3)
+        self.assertEqual(len(self.sensor_ids()), len(self.added))
+
+    async def test_unchanged_data_adds_nothing(self):
+        """Refreshes returning the same data do not create entities."""
+        await self.coordinator.async_refresh()
+        self.index.async_sync()
+        await self.hass.async_block_till_done()
+        self.assertEqual(len(self.added), 2 * 12)
+
+    async def test_vanished_reading_is_removed_and_rediscovered(self):
+        """A reading that stops being reported loses its entities, and regains them when it returns."""
+        serial = next(iter(self.coordinator.data))
+        original = self.coordinator.data[serial]
+        before = self.sensor_ids()
+
+        self.set_data({**self.coordinator.data, serial: self.without(serial, "ph")})
+        await self.hass.async_block_till_done()
+        removed = before - self.sensor_ids()
+        self.assertEqual(len(removed), 3)
+        self.assertNotIn((serial, "ph"), self.index.entities)
+
+        self.set_data({**self.coordinator.data, serial: original})
+        await self.hass.async_block_till_done()
+        self.assertEqual(self.sensor_ids(), before)
+        self.assertEqual(len(self.added), 2 * 12 + 3)
+
+    async def test_vanished_pool_is_removed(self):
+        """Every entity of a pool that is no longer returned is removed."""
+        serial, remaining = list(self.coordinator.data)
+        self.set_data({remaining: self.coordinator.data[remaining]})
+        await self.hass.async_block_till_done()
+        self.assertEqual(len(self.sensor_ids()), 12)
+        self.assertFalse([key for key in self.index.entities if key[0] == serial])
+
+    async def test_non_ok_response_keeps_registry_entries(self):
+        """A transient non-OK response removes the entities but keeps their registry entries."""
+        from homeassistant.helpers import entity_registry as er
+
+        registry = er.async_get(self.hass)
+        before = self.sensor_ids()
+        entity_id = sorted(before)[0]
+        registry.async_update_entity(entity_id, name="Pool pH")
+
+        self.server.measurement_status = "KO"
+        await self.coordinator.async_refresh()
+        await self.hass.async_block_till_done()
+        self.assertEqual(self.sensor_ids(), set())
+        self.assertEqual(registry.async_get(entity_id).name, "Pool pH")
+
+        self.server.measurement_status = "OK"
+        await self.coordinator.async_refresh()
+        await self.hass.async_block_till_done()
+        self.assertEqual(self.sensor_ids(), before)
+        self.assertEqual(registry.async_get(entity_id).name, "Pool pH")
+
+
+if __name__ == "__main__":
+    unittest.main()
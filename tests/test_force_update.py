@@ -0,0 +1,116 @@
+"""Test the force_update service.
+
+These tests need Home Assistant's test harness
+(pytest-homeassistant-custom-component) and are skipped otherwise.
+"""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from tests.conftest import HomeAssistantTestCase
+from tests.fake_server import make_pool
+
+DOMAIN = "virtualpoolcare"
+
+
+class TestForceUpdateService(HomeAssistantTestCase):
+    """Call force_update against two config entries served by stand-in servers."""
+
+    pool_count = 0
+
+    async def asyncSetUp(self):
+        import custom_components.virtualpoolcare as integration
+
+        await super().asyncSetUp()
+        self.servers = {}
+        self.coordinators = {}
+        for entry_id, pool_count in (("entry_a", 2), ("entry_b", 1)):
+            server = self.start_server(pool_count=pool_count, latency=0.05)
+            coordinator = self.make_coordinator(server, entry_id=entry_id)
+            await coordinator.async_refresh()
+            self.servers[entry_id] = server
+            self.coordinators[entry_id] = coordinator
+        self.hass.data[DOMAIN] = self.coordinators
+
+        with patch.object(integration, "_async_register_frontend_card"):
+            await integration.async_setup(self.hass, {})
+
+    async def force_update(self, **data) -> dict:
+        return await self.hass.services.async_call(
+            DOMAIN, "force_update", data, blocking=True, return_response=True
+        )
+
+    def measurement_requests(self, entry_id: str) -> int:
+        return self.servers[entry_id].request_counts["lastMeasurements"]
+
+    async def test_refreshes_all_entries_concurrently(self):
+        """Every entry is refreshed, in about the time of the slowest one."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        response = await self.force_update()
+        elapsed = loop.time() - start
+
+        refreshes = {refresh["entry_id"]: refresh for refresh in response["refreshes"]}
+        self.assertEqual(set(refreshes), {"entry_a", "entry_b"})
+        self.assertTrue(all(refresh["success"] for refresh in refreshes.values()))
+        self.assertEqual(len(refreshes["entry_a"]["pools"]), 2)
+        self.assertLess(elapsed, 0.05 * 3)
+        self.assertEqual(self.measurement_requests("entry_a"), 4)
+
+    async def test_duplicate_calls_share_one_refresh(self):
+        """Calls made while a forced refresh runs (or just after) are merged."""
+        first, second = await asyncio.gather(self.force_update(), self.force_update())
+        third = await self.force_update()
+        self.assertEqual(self.measurement_requests("entry_b"), 2)
+        coalesced = [
+            refresh["coalesced"]
+            for response in (first, second, third)
+            for refresh in response["refreshes"]
+        ]
+        self.assertEqual(coalesced.count(False), 2)
+
+    async def test_target_by_entry_id(self):
+        """entry_id limits the refresh to that entry."""
+        response = await self.force_update(entry_id="entry_b")
+        self.assertEqual([refresh["entry_id"] for refresh in response["refreshes"]], ["entry_b"])
+        self.assertEqual(self.measurement_requests("entry_a"), 2)
+
+    async def test_target_by_device_serial(self):
+        """device_serial refreshes only that device's pool."""
+        serial = make_pool(1)["blue_device_serial"]
+        response = await self.force_update(device_serial=serial)
+        (refresh,) = response["refreshes"]
+        self.assertEqual(refresh["entry_id"], "entry_a")
+        self.assertEqual(list(refresh["pools"]), [serial])
+        self.assertEqual(self.measurement_requests("entry_a"), 3)
+        self.assertEqual(self.measurement_requests("entry_b"), 1)
+
+    async def test_unknown_target_is_rejected(self):
+        """An entry_id or device_serial that matches nothing raises instead of refreshing nothing."""
+        from homeassistant.exceptions import ServiceValidationError
+
+        other_entry_serial = make_pool(1)["blue_device_serial"]
+        for data in (
+            {"entry_id": "missing"},
+            {"device_serial": "missing"},
+            {"entry_id": "entry_b", "device_serial": other_entry_serial},
+        ):
+            with self.subTest(data=data), self.assertRaises(ServiceValidationError):
+                await self.force_update(**data)
+        self.assertEqual(self.measurement_requests("entry_a"), 2)
+        self.assertEqual(self.measurement_requests("entry_b"), 1)
+
+    async def test_refresh_pools_refreshes_entries_concurrently(self):
+        """refresh_pools refetches every entry's pools list, in about the time of the slowest entry."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await self.hass.services.async_call(DOMAIN, "refresh_pools", {}, blocking=True)
+        elapsed = loop.time() - start
+
+        self.assertEqual(self.servers["entry_a"].request_counts["pools"], 2)
+        self.assertEqual(self.servers["entry_b"].request_counts["pools"], 2)
+        self.assertLess(elapsed, 0.05 * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Test serving the frontend card under a content-hashed, cacheable URL."""
+import importlib.util
+import re
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tests.conftest import HA_TEST_HARNESS_INSTALLED, HomeAssistantTestCase
+
+from custom_components.virtualpoolcare import CARD_FILE, _frontend_url
+
+FRONTEND_DIR = Path(__file__).parent.parent / "custom_components" / "virtualpoolcare" / "frontend"
+
+
+def static_path_config_available() -> bool:
+    """StaticPathConfig was added in Home Assistant 2024.7."""
+    if importlib.util.find_spec("homeassistant") is None:
+        return False
+    from homeassistant.components import http
+
+    return hasattr(http, "StaticPathConfig")
+
+
+class TestFrontendUrl(unittest.TestCase):
+    """Test the content-hashed URL of the card bundle."""
+
+    def test_url_follows_content(self):
+        """The URL is stable for the same content and changes with it."""
+        with tempfile.TemporaryDirectory() as directory:
+            frontend_dir = Path(directory)
+            (frontend_dir / CARD_FILE).write_text("// card")
+            first = _frontend_url(frontend_dir)
+            self.assertEqual(_frontend_url(frontend_dir), first)
+            self.assertRegex(first, r"^/virtualpoolcare/frontend-[0-9a-f]{12}$")
+            (frontend_dir / CARD_FILE).write_text("// card changed")
+            self.assertNotEqual(_frontend_url(frontend_dir), first)
+
+    def test_missing_file(self):
+        """Without the bundle nothing is served."""
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(_frontend_url(Path(directory)))
+
+    def test_bundle_is_self_contained(self):
+        """The bundle includes lit, imports nothing and fetches nothing from another origin."""
+        content = (FRONTEND_DIR / CARD_FILE).read_text()
+        self.assertIsNone(re.search(r"(^|[;}])\s*import\b|\bimport\s*\(", content, re.MULTILINE))
+        self.assertNotIn("://", content)
+        self.assertIn("pool-readings-bar-card", content)
+        # Minified: a few long lines, not the readable source
+        self.assertLess(content.count("\n"), 500)
+
+
+@unittest.skipUnless(
+    HA_TEST_HARNESS_INSTALLED and static_path_config_available(),
+    "needs pytest-homeassistant-custom-component and Home Assistant 2024.7+",
+)
+class TestServeCard(HomeAssistantTestCase):
+    """Register the card with a test HA instance and fetch it over HTTP."""
+
+    pool_count = 0
+
+    async def asyncSetUp(self):
+        from aiohttp.test_utils import TestClient, TestServer
+        from homeassistant.setup import async_setup_component
+
+        from custom_components.virtualpoolcare import _async_register_frontend_card
+
+        await super().asyncSetUp()
+
+        await async_setup_component(self.hass, "http", {"http": {}})
+        with patch("homeassistant.components.frontend.add_extra_js_url") as add_extra_js_url:
+            await _async_register_frontend_card(self.hass)
+        self.add_extra_js_url = add_extra_js_url
+
+        # Routes must be registered before the server starts
+        self.client = TestClient(TestServer(self.hass.http.app))
+        await self.client.start_server()
+        self.addAsyncCleanup(self.client.close)
+
+    async def test_serves_hashed_card_with_cache_headers(self):
+        """The card is served under the hashed URL with long-lived cache headers."""
+        card_url = self.add_extra_js_url.call_args.args[1]
+        self.assertEqual(card_url, f"{_frontend_url(FRONTEND_DIR)}/{CARD_FILE}")
+
+        response = await self.client.get(card_url)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(await response.read(), (FRONTEND_DIR / CARD_FILE).read_bytes())
+        self.assertIn("max-age=", response.headers["Cache-Control"])
+        self.assertIn("javascript", response.headers["Content-Type"])
+
+    async def test_serves_previous_url_uncached(self):
+        """The previous URL, which dashboards may list as a resource, still serves the card."""
+        response = await self.client.get(f"/virtualpoolcare/{CARD_FILE}")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(await response.read(), (FRONTEND_DIR / CARD_FILE).read_bytes())
+        self.assertNotIn("max-age=", response.headers.get("Cache-Control", ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
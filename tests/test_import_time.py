@@ -0,0 +1,91 @@
+"""Import-time budget for the VirtualPoolCare integration package."""
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Wall-clock budget for importing the integration's own modules
+IMPORT_BUDGET_MS = 100
+RUNS = 3
+
+# Modules that must not be imported while Home Assistant loads the integration
+HEAVY_MODULES = ("requests", "urllib3", "boto3", "botocore")
+
+# Already imported by Home Assistant before any integration loads
+PRELOADED_MODULES = (
+    "asyncio",
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.const",
+    "homeassistant.data_entry_flow",
+    "homeassistant.exceptions",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.components.sensor",
+)
+
+INTEGRATION_MODULES = (
+    "custom_components.virtualpoolcare",
+    "custom_components.virtualpoolcare.config_flow",
+    "custom_components.virtualpoolcare.sensor",
+)
+
+SCRIPT = """
+import importlib, json, sys, time
+import tests.conftest
+for name in {preloaded!r}:
+    importlib.import_module(name)
+before = set(sys.modules)
+start = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module(name)
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"elapsed_ms": elapsed_ms, "new_modules": sorted(set(sys.modules) - before)}}))
+"""
+
+
+def measure_import() -> dict:
+    """Import the integration in a fresh interpreter and report time and new modules."""
+    script = SCRIPT.format(preloaded=PRELOADED_MODULES, modules=INTEGRATION_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+    """Keep loading the integration cheap during HA bootstrap."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runs = [measure_import() for _ in range(RUNS)]
+
+    def test_import_within_budget(self):
+        """Importing the integration stays within the budget (best of several runs)."""
+        best = min(run["elapsed_ms"] for run in self.runs)
+        self.assertLess(
+            best, IMPORT_BUDGET_MS,
+            f"Importing the integration took {best:.1f} ms (budget {IMPORT_BUDGET_MS} ms); "
+            "run `python -X importtime` to find the slow import",
+        )
+
+    def test_no_heavy_imports(self):
+        """HTTP and AWS SDK libraries are only imported when first needed."""
+        new_modules = self.runs[0]["new_modules"]
+        heavy = [
+            name for name in new_modules
+            if name.split(".")[0] in HEAVY_MODULES
+        ]
+        self.assertEqual(heavy, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Test the parsed Measurement model."""
+import unittest
+from datetime import datetime, timezone
+
+from tests.fake_server import make_measurements, make_pool
+
+from custom_components.virtualpoolcare.measurements import (
+    Measurement,
+    PoolMeasurements,
+    format_timestamp,
+    parse_timestamp,
+)
+from custom_components.virtualpoolcare.virtualpoolcare_core import VirtualPoolCareSensorData
+
+TIMESTAMP = "2024-01-01T12:00:00.000Z"
+
+
+def legacy_parse(measurements_response: dict) -> dict:
+    """The flat dict parser Measurement records replaced, for comparison."""
+    sensor_data = {
+        "blue_device_serial": measurements_response.get("blue_device_serial"),
+        "last_measurement_timestamp": measurements_response.get("last_blue_measure_timestamp"),
+    }
+    for measurement in measurements_response.get("data", []):
+        name = measurement.get("name")
+        value = measurement.get("value")
+        if name and value is not None:
+            sensor_data[name] = value
+            sensor_data[f"{name}_timestamp"] = measurement.get("timestamp")
+            sensor_data[f"{name}_expired"] = measurement.get("expired", False)
+            for field in ("gauge_min", "gauge_max", "ok_min", "ok_max", "warning_low", "warning_high", "priority"):
+                sensor_data[f"{name}_{field}"] = measurement.get(field)
+            trend = measurement.get("trend")
+            if trend and trend != "undefined":
+                sensor_data[f"{name}_trend"] = trend
+    return sensor_data
+
+
+class TestPoolMeasurements(unittest.TestCase):
+    """Test parsing lastMeasurements responses."""
+
+    def setUp(self):
+        self.response = make_measurements(make_pool(0), TIMESTAMP)
+
+    def test_parses_records_keyed_by_name(self):
+        """Readings are keyed by name with parsed timestamps."""
+        parsed = PoolMeasurements.from_response(self.response)
+        self.assertEqual(parsed.device_serial, make_pool(0)["blue_device_serial"])
+        self.assertEqual(set(parsed.measurements), {"temperature", "ph", "orp", "salinity"})
+        ph = parsed.get("ph")
+        self.assertEqual(ph.value, 7.42)
+        self.assertEqual(ph.timestamp, datetime(2024, 1, 1, 12, tzinfo=timezone.utc))
+        self.assertEqual(ph.ok_min, 7.2)
+        self.assertEqual(ph.priority, 2)
+        self.assertEqual(ph.trend, "stable")
+
+    def test_records_have_no_instance_dict(self):
+        """Records use __slots__."""
+        parsed = PoolMeasurements.from_response(self.response)
+        self.assertFalse(hasattr(parsed, "__dict__"))
+        self.assertFalse(hasattr(parsed.get("ph"), "__dict__"))
+
+    def test_coerces_numbers_once(self):
+        """Numeric strings are converted at parse time."""
+        self.response["data"][1].update(value="7.1", ok_min="7.2", priority="2")
+        ph = PoolMeasurements.from_response(self.response).get("ph")
+        self.assertEqual((ph.value, ph.ok_min, ph.priority), (7.1, 7.2, 2))
+
+    def test_skips_incomplete_readings_and_undefined_trend(self):
+        """Readings without a value are dropped; an undefined trend is None."""
+        self.response["data"][0]["value"] = None
+        self.response["data"][1]["trend"] = "undefined"
+        parsed = PoolMeasurements.from_response(self.response)
+        self.assertIsNone(parsed.get("temperature"))
+        self.assertIsNone(parsed.get("ph").trend)
+
+    def test_status_not_ok(self):
+        """A response with a non-OK status parses to None."""
+        self.response["status"] = "KO"
+        with self.assertLogs("custom_components.virtualpoolcare.measurements", "WARNING"):
+            self.assertIsNone(PoolMeasurements.from_response(self.response))
+
+    def test_as_dict_matches_legacy_format(self):
+        """The model converts back to the previous flat dict."""
+        self.response["data"][2]["trend"] = "undefined"
+        parsed = PoolMeasurements.from_response(self.response)
+        self.assertEqual(parsed.as_dict(), legacy_parse(self.response))
+
+    def test_as_response_round_trip(self):
+        """A model converted to the API format parses back to an equal model."""
+        self.response["data"][2]["trend"] = "undefined"
+        parsed = PoolMeasurements.from_response(self.response)
+        self.assertEqual(PoolMeasurements.from_response(parsed.as_response()), parsed)
+
+    def test_sensor_keys_match_legacy_dict(self):
+        """Sensor keys are the same for the model and the legacy dict."""
+        parsed = PoolMeasurements.from_response(self.response)
+        self.assertEqual(
+            VirtualPoolCareSensorData.get_sensor_keys(parsed),
+            VirtualPoolCareSensorData.get_sensor_keys(parsed.as_dict()),
+        )
+
+
+class TestTimestamps(unittest.TestCase):
+    """Test timestamp parsing and formatting."""
+
+    def test_round_trip(self):
+        """API timestamps format back to the same string."""
+        self.assertEqual(format_timestamp(parse_timestamp(TIMESTAMP)), TIMESTAMP)
+
+    def test_naive_and_invalid(self):
+        """Naive timestamps are UTC; unparseable ones are None."""
+        self.assertEqual(
+            parse_timestamp("2024-01-01T12:00:00"),
+            datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+        )
+        self.assertIsNone(parse_timestamp("yesterday"))
+        self.assertIsNone(parse_timestamp(None))
+
+    def test_measurement_equality(self):
+        """Records compare by value."""
+        self.assertEqual(Measurement("ph", 7.2), Measurement("ph", 7.2))
+        self.assertNotEqual(Measurement("ph", 7.2), Measurement("ph", 7.3))
+
+
+if __name__ == "__main__":
+    unittest.main()
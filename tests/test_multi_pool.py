@@ -0,0 +1,87 @@
+"""Test multi-pool fetching in the VirtualPoolCare API clients."""
+import time
+import unittest
+
+import aiohttp
+
+from tests.fake_server import FakeVirtualPoolCareServer, make_pool
+
+from custom_components.virtualpoolcare.virtualpoolcare_async import AsyncVirtualPoolCareAPI
+from custom_components.virtualpoolcare.virtualpoolcare_core import (
+    POOLS_PAGE_SIZE,
+    VirtualPoolCareAPI,
+)
+
+POOL_COUNT = 2 * POOLS_PAGE_SIZE + 3
+LATENCY = 0.1
+
+
+class TestMultiPool(unittest.TestCase):
+    """Test VirtualPoolCareAPI.fetch_all_data() with many pools."""
+
+    def setUp(self):
+        """Start a stand-in server with several pages of pools."""
+        self.server = FakeVirtualPoolCareServer(pool_count=POOL_COUNT)
+        self.api = VirtualPoolCareAPI(
+            "test@example.com", "password",
+            base_url=self.server.start(), max_concurrent_requests=POOL_COUNT
+        )
+        self.addCleanup(self.server.stop)
+        self.addCleanup(self.api.close)
+
+    def test_walks_every_page(self):
+        """Every page of the pools list is fetched once."""
+        pools = self.api.get_pools_list(self.api.get_credentials())
+        self.assertEqual(len(pools), POOL_COUNT)
+        self.assertEqual(self.server.request_counts["pools"], 3)
+
+    def test_keyed_by_device_serial(self):
+        """Data is returned per blue_device_serial."""
+        devices = self.api.fetch_all_data()
+        expected = {make_pool(i)["blue_device_serial"] for i in range(POOL_COUNT)}
+        self.assertEqual(set(devices), expected)
+        for device_serial, data in devices.items():
+            self.assertEqual(data.device_serial, device_serial)
+
+    def test_refresh_time_scales_with_slowest_pool(self):
+        """Concurrent fetching takes far less than the sum of all pools."""
+        self.api.fetch_all_data()
+        self.server.latency = LATENCY
+        start = time.perf_counter()
+        self.api.fetch_all_data()
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, POOL_COUNT * LATENCY / 4)
+
+
+class TestAsyncMultiPool(unittest.IsolatedAsyncioTestCase):
+    """Test AsyncVirtualPoolCareAPI.async_fetch_all_data() with many pools."""
+
+    async def asyncSetUp(self):
+        """Start a stand-in server and an aiohttp session."""
+        self.server = FakeVirtualPoolCareServer(pool_count=POOL_COUNT)
+        base_url = self.server.start()
+        self.addCleanup(self.server.stop)
+        self.session = aiohttp.ClientSession()
+        self.api = AsyncVirtualPoolCareAPI(
+            "test@example.com", "password", session=self.session,
+            base_url=base_url, max_concurrent_requests=4
+        )
+
+    async def asyncTearDown(self):
+        await self.session.close()
+
+    async def test_concurrency_limit(self):
+        """Pools are fetched in batches of at most max_concurrent_requests."""
+        await self.api.async_fetch_all_data()
+        self.server.latency = LATENCY
+        start = time.perf_counter()
+        devices = await self.api.async_fetch_all_data()
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(devices), POOL_COUNT)
+        batches = -(-POOL_COUNT // 4)
+        self.assertGreaterEqual(elapsed, batches * LATENCY * 0.9)
+        self.assertLess(elapsed, POOL_COUNT * LATENCY / 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
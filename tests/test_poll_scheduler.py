@@ -0,0 +1,82 @@
+"""Test the adaptive PollScheduler in the VirtualPoolCare core API."""
+import unittest
+from datetime import datetime, timezone
+
+from custom_components.virtualpoolcare.measurements import Measurement, PoolMeasurements
+from custom_components.virtualpoolcare.virtualpoolcare_core import PollScheduler
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+CADENCE = 20 * 60
+MAX_INTERVAL = 6 * 3600
+
+
+def device(timestamp: float, expired: bool = False) -> PoolMeasurements:
+    """Return one device's measurements taken at `timestamp` (epoch seconds)."""
+    taken = datetime.fromtimestamp(timestamp, timezone.utc)
+    return PoolMeasurements("SERIAL", taken, {"ph": Measurement("ph", 7.4, taken, expired=expired)})
+
+
+class TestPollScheduler(unittest.TestCase):
+    """Test cadence learning and interval selection."""
+
+    def setUp(self):
+        self.scheduler = PollScheduler(MAX_INTERVAL, min_interval=300, delay=60)
+
+    def observe_measurements(self, count: int) -> float:
+        """Observe `count` measurements CADENCE apart; return the last timestamp."""
+        for i in range(count):
+            timestamp = START + i * CADENCE
+            self.scheduler.observe({"SERIAL": device(timestamp)})
+        return timestamp
+
+    def test_unknown_cadence_uses_configured_interval(self):
+        """With a single measurement seen, the configured interval is used."""
+        self.observe_measurements(1)
+        self.assertIsNone(self.scheduler.cadence("SERIAL"))
+        self.assertEqual(self.scheduler.next_interval(START + 10), MAX_INTERVAL)
+
+    def test_polls_just_after_next_measurement(self):
+        """The next poll is due one cadence after the last measurement, plus the delay."""
+        last = self.observe_measurements(4)
+        self.assertEqual(self.scheduler.cadence("SERIAL"), CADENCE)
+        self.assertEqual(self.scheduler.next_interval(last + 100), CADENCE + 60 - 100)
+
+    def test_cadence_ignores_a_missed_measurement(self):
+        """The median gap is robust to an occasional missing measurement."""
+        for offset in (0, 1, 2, 4, 5):
+            self.scheduler.observe({"SERIAL": device(START + offset * CADENCE)})
+        self.assertEqual(self.scheduler.cadence("SERIAL"), CADENCE)
+
+    def test_backs_off_while_unchanged(self):
+        """Once a measurement is overdue, unchanged polls double the delay."""
+        last = self.observe_measurements(3)
+        now = last + 2 * CADENCE
+        intervals = []
+        for _ in range(3):
+            self.scheduler.observe({"SERIAL": device(last)})
+            intervals.append(self.scheduler.next_interval(now))
+        self.assertEqual(intervals, [600, 1200, 2400])
+        self.assertEqual(self.scheduler.unchanged_polls, 3)
+
+    def test_configured_interval_is_upper_bound(self):
+        """A slow device or long back-off never exceeds the configured interval."""
+        scheduler = PollScheduler(3600, min_interval=300, delay=60)
+        for i in range(3):
+            scheduler.observe({"SERIAL": device(START + i * 4 * 3600)})
+        self.assertEqual(scheduler.next_interval(START + 2 * 4 * 3600), 3600)
+
+    def test_expired_device_is_not_chased(self):
+        """A device whose readings are all expired falls back to the configured interval."""
+        last = self.observe_measurements(3)
+        self.scheduler.observe({"SERIAL": device(last + CADENCE, expired=True)})
+        self.assertEqual(self.scheduler.next_interval(last + CADENCE + 10), MAX_INTERVAL)
+
+    def test_removed_device_is_forgotten(self):
+        """Devices missing from a refresh no longer affect scheduling."""
+        self.observe_measurements(3)
+        self.scheduler.observe({})
+        self.assertEqual(self.scheduler.stats()["cadence_seconds"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Test the cached pool index in the VirtualPoolCare core API."""
+import time
+import unittest
+
+from tests.fake_server import FakeVirtualPoolCareServer, make_pool
+
+from custom_components.virtualpoolcare.virtualpoolcare_core import (
+    PoolIndex,
+    VirtualPoolCareAPI,
+)
+
+
+class TestPoolIndex(unittest.TestCase):
+    """Test the PoolIndex helper."""
+
+    def test_ttl_expiry(self):
+        """Pools older than the TTL are treated as a miss."""
+        index = PoolIndex(ttl=60)
+        index.store([{"pool_id": "p", "blue_key": "b"}], fetched_at=time.time() - 120)
+        self.assertIsNone(index.get())
+        self.assertEqual(index.misses, 1)
+
+    def test_round_trip(self):
+        """An exported index restores to the same pools."""
+        index = PoolIndex()
+        pools = [{"pool_id": "p", "blue_key": "b"}]
+        index.store(pools)
+        restored = PoolIndex()
+        restored.restore(index.as_dict())
+        self.assertEqual(restored.get(), pools)
+
+    def test_restore_ignores_empty_data(self):
+        """Restoring nothing leaves the index empty."""
+        index = PoolIndex()
+        index.restore(None)
+        index.restore({"pools": None, "fetched_at": None})
+        self.assertIsNone(index.get())
+
+
+class TestFetchDataPoolCache(unittest.TestCase):
+    """Test fetch_data against the local stand-in server."""
+
+    def setUp(self):
+        """Start the stand-in server."""
+        self.server = FakeVirtualPoolCareServer()
+        self.api = VirtualPoolCareAPI("test@example.com", "password", base_url=self.server.start())
+        self.addCleanup(self.server.stop)
+        self.addCleanup(self.api.close)
+
+    def test_steady_state_skips_pools_list(self):
+        """Only the first refresh fetches the pools list."""
+        for _ in range(3):
+            self.api.fetch_data()
+        self.assertEqual(self.server.request_counts["pools"], 1)
+        self.assertEqual(self.server.request_counts["lastMeasurements"], 3)
+        self.assertEqual(self.server.request_counts["login"], 1)
+
+    def test_not_found_invalidates_index(self):
+        """A 404 from lastMeasurements re-fetches the pools list once."""
+        self.api.fetch_data()
+        self.server.pools = [make_pool(7)]
+        data = self.api.fetch_data()
+        self.assertEqual(data["blue_device_serial"], make_pool(7)["blue_device_serial"])
+        self.assertEqual(self.server.request_counts["pools"], 2)
+
+    def test_removed_pool_is_dropped(self):
+        """A 404 for a removed pool keeps the other pools' data without a retry."""
+        self.server.pools.append(make_pool(1))
+        self.api.fetch_all_data()
+        self.server.pools = self.server.pools[1:]
+        devices = self.api.fetch_all_data()
+        self.assertEqual(set(devices), {make_pool(1)["blue_device_serial"]})
+        self.assertEqual(self.server.request_counts["pools"], 2)
+        self.assertEqual(self.server.request_counts["lastMeasurements"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Test the per-stage refresh timing and request counters of the VirtualPoolCare API clients."""
+import unittest
+
+import aiohttp
+
+from tests.fake_server import FakeVirtualPoolCareServer
+
+from custom_components.virtualpoolcare.virtualpoolcare_async import AsyncVirtualPoolCareAPI
+from custom_components.virtualpoolcare.virtualpoolcare_core import (
+    RefreshStats,
+    VirtualPoolCareAPI,
+    VirtualPoolCareAuthError,
+    VirtualPoolCareTransientError,
+)
+
+
+class TestRefreshStats(unittest.TestCase):
+    """Test the RefreshStats histograms and counters."""
+
+    def test_histogram_buckets(self):
+        """Durations land in the first bucket whose bound they do not exceed."""
+        refresh_stats = RefreshStats(buckets_ms=(10, 100))
+        for seconds in (0.006, 0.010, 0.050, 0.5):
+            refresh_stats.observe("parse", seconds)
+        parse = refresh_stats.stats()["stages"]["parse"]
+        self.assertEqual(parse["histogram_ms"], {"<=10": 2, "<=100": 1, ">100": 1})
+        self.assertEqual(parse["count"], 4)
+        self.assertEqual(parse["max_ms"], 500.0)
+        self.assertEqual(parse["last_ms"], 500.0)
+        self.assertEqual(parse["mean_ms"], 141.5)
+        self.assertEqual(refresh_stats.stats()["stages"]["login"]["mean_ms"], None)
+
+    def test_timer_records_failures(self):
+        refresh_stats = RefreshStats()
+        with self.assertRaises(ValueError):
+            with refresh_stats.timer("pools"):
+                raise ValueError("No pools")
+        self.assertEqual(refresh_stats.stats()["stages"]["pools"]["count"], 1)
+
+    def test_request_and_error_counters(self):
+        refresh_stats = RefreshStats()
+        refresh_stats.record_request(100)
+        refresh_stats.record_request_error(VirtualPoolCareTransientError("down", 503))
+        refresh_stats.record_request_error(VirtualPoolCareTransientError("down", 503))
+        refresh_stats.record_refresh_error(VirtualPoolCareAuthError("rejected", 401))
+        stats = refresh_stats.stats()
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["bytes_received"], 100)
+        self.assertEqual(stats["request_errors"], {"VirtualPoolCareTransientError": 2})
+        self.assertEqual(stats["refresh_errors"], {"VirtualPoolCareAuthError": 1})
+        self.assertIsNotNone(stats["last_failure"])
+        self.assertIsNone(stats["last_success"])
+
+
+class TestClientRefreshStats(unittest.TestCase):
+    """Refresh the requests-based client against the stand-in server."""
+
+    def setUp(self):
+        self.server = FakeVirtualPoolCareServer(pool_count=2)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.api = VirtualPoolCareAPI("test@example.com", "password", base_url=self.server.base_url)
+        self.api.retry_backoff_base = 0
+        self.addCleanup(self.api.close)
+
+    def test_stages_and_requests(self):
+        """Login and pools are timed once, measurements and parse once per pool and refresh."""
+        self.api.fetch_all_data()
+        self.server.fail_next = 1
+        self.api.fetch_all_data()
+
+        stats = self.api.refresh_stats.stats()
+        counts = {stage: summary["count"] for stage, summary in stats["stages"].items()}
+        self.assertEqual(counts, {"refresh": 2, "login": 1, "pools": 1, "measurements": 4, "parse": 4})
+        self.assertEqual(stats["requests"], sum(self.server.request_counts.values()))
+        self.assertGreater(stats["bytes_received"], 0)
+        self.assertEqual(stats["request_errors"], {"VirtualPoolCareTransientError": 1})
+        self.assertIsNotNone(stats["last_success"])
+        self.assertEqual(self.api.refresh_stats.last_ms("refresh"), stats["stages"]["refresh"]["last_ms"])
+
+
+class TestAsyncClientRefreshStats(unittest.IsolatedAsyncioTestCase):
+    """Refresh the asyncio client against the stand-in server."""
+
+    async def asyncSetUp(self):
+        self.server = FakeVirtualPoolCareServer(pool_count=2)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.session = aiohttp.ClientSession()
+        self.addAsyncCleanup(self.session.close)
+        self.api = AsyncVirtualPoolCareAPI(
+            "test@example.com", "password", session=self.session, base_url=self.server.base_url
+        )
+        self.api.retry_backoff_base = 0
+
+    async def test_failed_refresh(self):
+        """A refresh that fails after its retries is counted by error type."""
+        await self.api.async_fetch_all_data()
+        self.api.pool_index.invalidate()
+        self.server.fail_next = 100
+        with self.assertRaises(VirtualPoolCareTransientError):
+            await self.api.async_fetch_all_data()
+
+        stats = self.api.refresh_stats.stats()
+        self.assertEqual(stats["stages"]["refresh"]["count"], 2)
+        self.assertEqual(stats["stages"]["pools"]["count"], 2)
+        self.assertEqual(stats["request_errors"], {"VirtualPoolCareTransientError": self.api.request_retries + 1})
+        self.assertEqual(stats["refresh_errors"], {"VirtualPoolCareTransientError": 1})
+        self.assertLess(stats["last_success"], stats["last_failure"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Test response fingerprinting in the VirtualPoolCare API clients."""
+import unittest
+
+import aiohttp
+
+from tests.fake_server import FakeVirtualPoolCareServer
+
+from custom_components.virtualpoolcare.virtualpoolcare_async import AsyncVirtualPoolCareAPI
+from custom_components.virtualpoolcare.virtualpoolcare_core import (
+    ResponseFingerprints,
+    VirtualPoolCareAPI,
+)
+
+
+class TestResponseFingerprints(unittest.TestCase):
+    """Test the ResponseFingerprints helper."""
+
+    def test_hit_requires_matching_fingerprint(self):
+        """Only the same fingerprint for the same key is a hit."""
+        fingerprints = ResponseFingerprints()
+        parsed = object()
+        fingerprints.store("pool", b"a", parsed)
+        self.assertIs(fingerprints.get("pool", b"a"), parsed)
+        self.assertIsNone(fingerprints.get("pool", b"b"))
+        self.assertIsNone(fingerprints.get("other", b"a"))
+        self.assertEqual(fingerprints.stats(), {"hits": 1, "misses": 2, "hit_rate": 0.333})
+
+
+class TestFetchDedup(unittest.TestCase):
+    """Test that unchanged responses reuse the previous parsed data."""
+
+    def setUp(self):
+        self.server = FakeVirtualPoolCareServer(pool_count=2)
+        base_url = self.server.start()
+        self.addCleanup(self.server.stop)
+        self.api = VirtualPoolCareAPI("test@example.com", "password", base_url=base_url)
+        self.addCleanup(self.api.close)
+
+    def test_unchanged_response_returns_previous_object(self):
+        """The same payload yields the very same PoolMeasurements objects."""
+        first = self.api.fetch_all_data()
+        second = self.api.fetch_all_data()
+        self.assertEqual(first, second)
+        for serial, measurements in second.items():
+            self.assertIs(measurements, first[serial])
+        self.assertEqual(self.api.response_fingerprints.hits, 2)
+
+    def test_changed_response_is_parsed(self):
+        """A new measurement timestamp produces new parsed data."""
+        first = self.api.fetch_all_data()
+        self.server.measurement_timestamp = "2024-01-01T12:20:00.000Z"
+        second = self.api.fetch_all_data()
+        for serial, measurements in second.items():
+            self.assertIsNot(measurements, first[serial])
+            self.assertEqual(measurements.last_measurement.minute, 20)
+        self.assertEqual(self.api.response_fingerprints.hits, 0)
+
+
+class TestAsyncFetchDedup(unittest.IsolatedAsyncioTestCase):
+    """Test fingerprinting in the asyncio client."""
+
+    async def test_unchanged_response_returns_previous_object(self):
+        """The async client reuses the previous parsed data too."""
+        with FakeVirtualPoolCareServer() as server:
+            async with aiohttp.ClientSession() as session:
+                api = AsyncVirtualPoolCareAPI(
+                    "test@example.com", "password", session=session, base_url=server.base_url
+                )
+                first = await api.async_fetch_all_data()
+                second = await api.async_fetch_all_data()
+        self.assertIs(next(iter(second.values())), next(iter(first.values())))
+        self.assertEqual(api.response_fingerprints.stats()["hit_rate"], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+"""Test retries, typed errors and the circuit breaker of the VirtualPoolCare API clients."""
+import unittest
+from unittest.mock import patch
+
+import aiohttp
+
+from tests.fake_server import FakeVirtualPoolCareServer, make_pool
+
+from custom_components.virtualpoolcare.virtualpoolcare_async import AsyncVirtualPoolCareAPI
+from custom_components.virtualpoolcare.virtualpoolcare_core import (
+    CircuitBreaker,
+    VirtualPoolCareAPI,
+    VirtualPoolCareAuthError,
+    VirtualPoolCareCircuitOpenError,
+    VirtualPoolCareError,
+    VirtualPoolCareTransientError,
+)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test the CircuitBreaker state machine."""
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = patch(
+            "custom_components.virtualpoolcare.virtualpoolcare_core.time.monotonic",
+            side_effect=lambda: self.now,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    def fail(self, times: int) -> None:
+        for _ in range(times):
+            self.breaker.before_request()
+            self.breaker.record_failure()
+
+    def test_opens_after_consecutive_failures(self):
+        """The threshold-th consecutive failure opens the circuit."""
+        self.fail(2)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.fail(1)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(VirtualPoolCareCircuitOpenError) as ctx:
+            self.breaker.before_request()
+        self.assertEqual(ctx.exception.retry_in, 60)
+        self.assertEqual(self.breaker.stats()["rejected_requests"], 1)
+
+    def test_success_resets_failure_count(self):
+        """Failures must be consecutive to open the circuit."""
+        self.fail(2)
+        self.breaker.record_success()
+        self.fail(2)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_half_open_trial_closes_on_success(self):
+        """After the cool-down one trial request is allowed; success closes the circuit."""
+        self.fail(3)
+        self.now += 60
+        self.breaker.before_request()
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(VirtualPoolCareCircuitOpenError):
+            self.breaker.before_request()
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.breaker.before_request()
+
+    def test_half_open_trial_reopens_on_failure(self):
+        """A failed trial request opens the circuit for another cool-down."""
+        self.fail(3)
+        self.now += 60
+        self.fail(1)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(self.breaker.stats()["times_opened"], 2)
+        self.now += 59
+        with self.assertRaises(VirtualPoolCareCircuitOpenError):
+            self.breaker.before_request()
+
+
+class TestRetries(unittest.TestCase):
+    """Test the blocking client against a stand-in server that injects faults."""
+
+    def setUp(self):
+        self.server = FakeVirtualPoolCareServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.api = VirtualPoolCareAPI("test@example.com", "password", base_url=self.server.base_url)
+        self.addCleanup(self.api.close)
+        self.api.retry_backoff_base = 0
+        self.api.fetch_all_data()
+
+    def fetch(self) -> dict:
+        return self.api.fetch_all_data()
+
+    def test_backoff_is_bounded_with_jitter(self):
+        """Retry delays are random, below base * 2**attempt and never above the maximum."""
+        self.api.retry_backoff_base = 0.5
+        self.api.retry_backoff_max = 8
+        for attempt, cap in ((0, 0.5), (2, 2.0), (10, 8)):
+            delays = {self.api._retry_delay(attempt) for _ in range(50)}
+            self.assertTrue(all(0 <= delay <= cap for delay in delays))
+            self.assertGreater(len(delays), 1)
+
+    def test_server_errors_are_retried(self):
+        """A couple of 5xx answers are retried and the refresh succeeds."""
+        self.server.fail_next = 2
+        self.assertEqual(len(self.fetch()), 1)
+        self.assertEqual(self.server.request_counts["lastMeasurements"], 4)
+        self.assertEqual(self.api.retried_requests, 2)
+
+    def test_dropped_connection_is_retried(self):
+        """A network failure is retried like a server error."""
+        self.server.fail_status = None
+        self.server.fail_next = 1
+        self.assertEqual(len(self.fetch()), 1)
+
+    def test_retries_are_bounded(self):
+        """Once the retries are used up a typed transient error is raised."""
+        self.server.fail_next = 10
+        with self.assertRaises(VirtualPoolCareTransientError) as ctx:
+            self.fetch()
+        self.assertEqual(ctx.exception.status, 503)
+        self.assertEqual(self.server.request_counts["lastMeasurements"], 1 + self.api.request_retries + 1)
+
+    def test_client_errors_are_not_retried(self):
+        """A 400 is raised at once as a (non-transient) VirtualPoolCareError."""
+        self.server.fail_status = 400
+        self.server.fail_next = 1
+        with self.assertRaises(VirtualPoolCareError) as ctx:
+            self.fetch()
+        self.assertNotIsInstance(ctx.exception, VirtualPoolCareTransientError)
+        self.assertEqual(self.server.request_counts["lastMeasurements"], 2)
+
+    def test_rejected_login_is_an_auth_error(self):
+        """A 401 from login raises VirtualPoolCareAuthError without retrying."""
+        self.api.credential_cache.invalidate()
+        self.server.fail_status = 401
+        self.server.fail_next = 1
+        with self.assertRaises(VirtualPoolCareAuthError):
+            self.fetch()
+        self.assertEqual(self.server.request_counts["login"], 2)
+
+    def test_circuit_opens_during_outage(self):
+        """After repeated failures requests fail fast without reaching the server."""
+        self.api.circuit_breaker.failure_threshold = 2
+        self.server.fail_next = 100
+        for _ in range(2):
+            with self.assertRaises(VirtualPoolCareTransientError):
+                self.fetch()
+        requests_before = sum(self.server.request_counts.values())
+        with self.assertRaises(VirtualPoolCareCircuitOpenError):
+            self.fetch()
+        self.assertEqual(sum(self.server.request_counts.values()), requests_before)
+
+        # Once the cool-down is over, a successful trial closes the circuit
+        self.server.fail_next = 0
+        self.api.circuit_breaker.reset_timeout = 0
+        self.assertEqual(len(self.fetch()), 1)
+        self.assertEqual(self.api.circuit_breaker.state, CircuitBreaker.CLOSED)
+
+
+class TestAsyncRetries(unittest.IsolatedAsyncioTestCase):
+    """Test the asyncio client against a stand-in server that injects faults."""
+
+    async def asyncSetUp(self):
+        self.server = FakeVirtualPoolCareServer(pool_count=4)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.session = aiohttp.ClientSession()
+        self.api = AsyncVirtualPoolCareAPI(
+            "test@example.com", "password", session=self.session, base_url=self.server.base_url
+        )
+        self.api.retry_backoff_base = 0
+        await self.api.async_fetch_all_data()
+
+    async def asyncTearDown(self):
+        await self.session.close()
+
+    async def test_server_errors_are_retried(self):
+        """5xx answers on concurrent pool fetches are retried."""
+        self.server.fail_next = 3
+        self.assertEqual(len(await self.api.async_fetch_all_data()), 4)
+        self.assertEqual(self.server.request_counts["lastMeasurements"], 4 + 4 + 3)
+
+    async def test_dropped_connection_is_retried(self):
+        """A network failure is retried like a server error."""
+        self.server.fail_status = None
+        self.server.fail_next = 1
+        self.assertEqual(len(await self.api.async_fetch_all_data()), 4)
+
+    async def test_random_errors_are_retried(self):
+        """Refreshes ride out a server failing a fraction of requests at random."""
+        self.server.error_rate = 0.1
+        for _ in range(10):
+            self.assertEqual(len(await self.api.async_fetch_all_data()), 4)
+        self.assertGreater(self.server.injected_errors, 0)
+        self.assertEqual(self.api.retried_requests, self.server.injected_errors)
+
+    async def test_rejected_credentials_refresh_once(self):
+        """Concurrent requests rejected with the same credentials share one new login."""
+        self.server.reject_next = 4
+        self.assertEqual(len(await self.api.async_fetch_all_data()), 4)
+        self.assertEqual(self.server.request_counts["login"], 2)
+        self.assertEqual(self.server.request_counts["pools"], 1)
+
+    async def test_circuit_opens_during_outage(self):
+        """After repeated failures requests fail fast without reaching the server."""
+        self.api.circuit_breaker.failure_threshold = 1
+        self.server.fail_next = 100
+        with self.assertRaises(VirtualPoolCareTransientError):
+            await self.api.async_fetch_all_data()
+        requests_before = sum(self.server.request_counts.values())
+        with self.assertRaises(VirtualPoolCareCircuitOpenError):
+            await self.api.async_fetch_all_data()
+        self.assertEqual(sum(self.server.request_counts.values()), requests_before)
+        self.assertEqual(self.api.circuit_breaker.stats()["state"], CircuitBreaker.OPEN)
+
+    async def test_missing_pool_is_typed(self):
+        """A 404 for a removed pool still refreshes the pools list."""
+        self.server.pools = self.server.pools[1:]
+        data = await self.api.async_fetch_all_data()
+        self.assertEqual(len(data), 3)
+        self.assertNotIn(make_pool(0)["blue_device_serial"], data)
+
+
+if __name__ == "__main__":
+    unittest.main()
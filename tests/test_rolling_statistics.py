@@ -0,0 +1,113 @@
+"""Test the rolling window statistics engine."""
+import random
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from tests.fake_server import make_measurements, make_pool
+
+from custom_components.virtualpoolcare.measurements import PoolMeasurements, format_timestamp
+from custom_components.virtualpoolcare.virtualpoolcare_core import RollingStatistics, RollingWindow
+
+HOUR = 3600
+
+
+def brute_force(readings: list, duration: float) -> dict:
+    """Statistics of the readings within `duration` of the newest one."""
+    newest = readings[-1][0]
+    window = [(t, v) for t, v in readings if t > newest - duration]
+    values = [v for _, v in window]
+    elapsed = window[-1][0] - window[0][0]
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values),
+        "min": min(values),
+        "max": max(values),
+        "rate_per_hour": (window[-1][1] - window[0][1]) * HOUR / elapsed if elapsed else None,
+    }
+
+
+class TestRollingWindow(unittest.TestCase):
+    """Test RollingWindow against a brute-force computation."""
+
+    def test_matches_brute_force(self):
+        """Every summary matches recomputing over the readings in the window."""
+        rng = random.Random(42)
+        window = RollingWindow(24 * HOUR, capacity=512)
+        readings = []
+        timestamp = 0.0
+        for _ in range(2000):
+            timestamp += rng.uniform(5, 60) * 60
+            value = round(rng.uniform(6.8, 8.0), 2)
+            readings.append((timestamp, value))
+            window.add(timestamp, value)
+            summary = window.summary()
+            expected = brute_force(readings, 24 * HOUR)
+            self.assertEqual(summary["count"], expected["count"])
+            self.assertEqual((summary["min"], summary["max"]), (expected["min"], expected["max"]))
+            self.assertAlmostEqual(summary["mean"], expected["mean"])
+
+    def test_capacity_drops_oldest(self):
+        """A full buffer drops its oldest reading, even inside the window."""
+        window = RollingWindow(24 * HOUR, capacity=3)
+        for i, value in enumerate((9.0, 1.0, 5.0, 6.0)):
+            window.add(i * 60, value)
+        summary = window.summary()
+        self.assertEqual((summary["count"], summary["min"], summary["max"]), (3, 1.0, 6.0))
+        self.assertEqual(window.readings(), ([60, 120, 180], [1.0, 5.0, 6.0]))
+
+    def test_rate_of_change(self):
+        """The rate is the change from the oldest to the newest reading per hour."""
+        window = RollingWindow(24 * HOUR)
+        window.add(0, 7.0)
+        self.assertIsNone(window.summary()["rate_per_hour"])
+        window.add(2 * HOUR, 7.5)
+        self.assertAlmostEqual(window.summary()["rate_per_hour"], 0.25)
+
+    def test_empty(self):
+        self.assertIsNone(RollingWindow(HOUR).summary())
+
+
+class TestRollingStatistics(unittest.TestCase):
+    """Test feeding RollingStatistics from refreshes."""
+
+    def setUp(self):
+        self.stats = RollingStatistics()
+        self.serial = make_pool(0)["blue_device_serial"]
+        self.start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def observe(self, hours: float, ph: float) -> None:
+        response = make_measurements(make_pool(0), format_timestamp(self.start + timedelta(hours=hours)))
+        response["data"][1]["value"] = ph
+        self.stats.observe({self.serial: PoolMeasurements.from_response(response)})
+
+    def test_repeated_measurement_is_counted_once(self):
+        """Polls returning the same measurement do not add readings."""
+        self.observe(0, 7.2)
+        self.observe(0, 7.2)
+        self.observe(1, 7.4)
+        self.assertEqual(self.stats.summary(self.serial, "ph", "24h")["count"], 2)
+        self.assertEqual(self.stats.version, 2 * 4)
+
+    def test_windows_differ(self):
+        """Readings older than a day only count in the 7-day window."""
+        self.observe(0, 7.0)
+        self.observe(30, 7.4)
+        self.assertEqual(self.stats.summary(self.serial, "ph", "24h")["min"], 7.4)
+        self.assertEqual(self.stats.summary(self.serial, "ph", "7d")["min"], 7.0)
+        self.assertIsNone(self.stats.summary(self.serial, "chlorine", "24h"))
+
+    def test_round_trip(self):
+        """Restored statistics match the saved ones."""
+        for hour in range(40):
+            self.observe(hour, 7.0 + hour / 100)
+        restored = RollingStatistics()
+        restored.restore(self.stats.as_dict())
+        for window in ("24h", "7d"):
+            self.assertEqual(
+                restored.summary(self.serial, "orp", window), self.stats.summary(self.serial, "orp", window)
+            )
+        self.assertEqual(restored.stats(), self.stats.stats())
+
+
+if __name__ == "__main__":
+    unittest.main()
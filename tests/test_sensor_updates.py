@@ -0,0 +1,153 @@
+"""Test how VirtualPoolCareSensor reacts to coordinator updates.
+
+These tests need the real Home Assistant entity classes and are skipped
+when Home Assistant is not installed.
+"""
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from tests.conftest import HA_INSTALLED
+from tests.fake_server import make_measurements, make_pool
+
+from custom_components.virtualpoolcare.measurements import PoolMeasurements
+from custom_components.virtualpoolcare.virtualpoolcare_core import RollingStatistics
+
+TIMESTAMP = "2024-01-01T12:00:00.000Z"
+
+
+def parse(**changes) -> PoolMeasurements:
+    """Parse a fresh stand-in response, with `changes` applied to the ph reading."""
+    response = make_measurements(make_pool(0), TIMESTAMP)
+    response["data"][1].update(changes)
+    return PoolMeasurements.from_response(response)
+
+
+@unittest.skipUnless(HA_INSTALLED, "needs Home Assistant")
+class TestSensorUpdates(unittest.TestCase):
+    """Test cached state and suppressed writes."""
+
+    def setUp(self):
+        from custom_components.virtualpoolcare.sensor import VirtualPoolCareSensor
+
+        measurements = parse()
+        self.serial = measurements.device_serial
+        self.coordinator = SimpleNamespace(
+            data={self.serial: measurements}, suppressed_writes=0, data_restored=False, data_fetched_at=None
+        )
+        self.sensor = VirtualPoolCareSensor(self.coordinator, self.serial, "ph")
+        patcher = patch.object(self.sensor, "async_write_ha_state")
+        self.write = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def update(self, **changes) -> None:
+        self.coordinator.data = {self.serial: parse(**changes)}
+        self.sensor._handle_coordinator_update()
+
+    def test_state_and_attributes_are_cached(self):
+        """State and attributes come from the data seen at the last update."""
+        self.assertEqual(self.sensor.state, 7.42)
+        self.assertEqual(self.sensor.extra_state_attributes["ok_min"], 7.2)
+        self.coordinator.data = {self.serial: parse(value=7.5)}
+        self.assertEqual(self.sensor.state, 7.42)
+
+    def test_unchanged_measurement_is_not_written(self):
+        """A refresh returning the same measurement skips the state write."""
+        self.update()
+        self.update()
+        self.write.assert_not_called()
+        self.assertEqual(self.coordinator.suppressed_writes, 2)
+
+    def test_changed_value_timestamp_or_threshold_is_written(self):
+        """Any change to value, timestamp or thresholds is written."""
+        self.update(value=7.5)
+        self.update(value=7.5, timestamp="2024-01-01T13:00:00.000Z")
+        self.update(value=7.5, timestamp="2024-01-01T13:00:00.000Z", ok_min=7.0)
+        self.assertEqual(self.write.call_count, 3)
+        self.assertEqual(self.coordinator.suppressed_writes, 0)
+        self.assertEqual(self.sensor.state, 7.5)
+        self.assertEqual(self.sensor.extra_state_attributes["ok_min"], 7.0)
+
+    def test_other_readings_do_not_cause_writes(self):
+        """A change to another reading of the same device does not write this sensor."""
+        measurements = parse()
+        measurements.get("orp").value = 650
+        self.coordinator.data = {self.serial: measurements}
+        self.sensor._handle_coordinator_update()
+        self.write.assert_not_called()
+
+    def test_restored_snapshot_is_flagged_until_live_data(self):
+        """Restored data carries cache attributes, dropped once live data arrives unchanged."""
+        self.coordinator.data_restored = True
+        self.coordinator.data_fetched_at = 1704110400
+        self.update()
+        self.assertTrue(self.sensor.extra_state_attributes["restored"])
+        self.assertEqual(self.sensor.extra_state_attributes["cached_at"], "2024-01-01T12:00:00+00:00")
+
+        self.coordinator.data_restored = False
+        self.update()
+        self.assertEqual(self.write.call_count, 2)
+        self.assertNotIn("restored", self.sensor.extra_state_attributes)
+
+    def test_freshness_is_written_only_when_it_changes(self):
+        """The sensor is not polled; the periodic check writes only fresh/old/stale changes."""
+        from datetime import datetime, timezone
+
+        self.assertFalse(self.sensor.should_poll)
+        self.assertEqual(self.sensor.extra_state_attributes["data_freshness"], "stale")
+        self.sensor._async_check_freshness()
+        self.write.assert_not_called()
+
+        with patch("custom_components.virtualpoolcare.sensor.dt_util.utcnow") as utcnow:
+            utcnow.return_value = datetime(2024, 1, 1, 13, 0, tzinfo=timezone.utc)
+            self.sensor._async_check_freshness()
+            self.assertEqual(self.write.call_count, 1)
+            self.assertEqual(self.sensor.extra_state_attributes["data_freshness"], "fresh")
+
+            utcnow.return_value = datetime(2024, 1, 1, 15, 0, tzinfo=timezone.utc)
+            self.sensor._async_check_freshness()
+            self.assertEqual(self.write.call_count, 1)
+            # No attribute changes with time between freshness changes
+            self.assertNotIn("data_age_hours", self.sensor.extra_state_attributes)
+            self.assertEqual(self.sensor.extra_state_attributes["timestamp"], "2024-01-01T12:00:00.000Z")
+
+
+@unittest.skipUnless(HA_INSTALLED, "needs Home Assistant")
+class TestStatisticSensor(unittest.TestCase):
+    """Test the rolling statistics sensors."""
+
+    def setUp(self):
+        from custom_components.virtualpoolcare.sensor import VirtualPoolCareStatisticSensor
+
+        self.serial = parse().device_serial
+        self.coordinator = SimpleNamespace(rolling=RollingStatistics(), suppressed_writes=0)
+        self.sensor = VirtualPoolCareStatisticSensor(self.coordinator, self.serial, "ph", "24h")
+        patcher = patch.object(self.sensor, "async_write_ha_state")
+        self.write = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def observe(self, timestamp: str, value: float) -> None:
+        self.coordinator.rolling.observe({self.serial: parse(value=value, timestamp=timestamp)})
+        self.sensor._handle_coordinator_update()
+
+    def test_state_is_rolling_mean(self):
+        """The state is the window mean; min, max and rate are attributes."""
+        self.assertIsNone(self.sensor.native_value)
+        self.observe("2024-01-01T12:00:00.000Z", 7.2)
+        self.observe("2024-01-01T14:00:00.000Z", 7.6)
+        self.assertEqual(self.sensor.native_value, 7.4)
+        attributes = self.sensor.extra_state_attributes
+        self.assertEqual((attributes["min"], attributes["max"], attributes["samples"]), (7.2, 7.6, 2))
+        self.assertEqual(attributes["rate_of_change_per_hour"], 0.2)
+        self.assertEqual(self.sensor.unique_id, f"virtualpoolcare_{self.serial}_ph_mean_24h")
+
+    def test_repeated_measurement_is_not_written(self):
+        """Polls returning the same measurement skip the state write."""
+        self.observe("2024-01-01T12:00:00.000Z", 7.2)
+        self.observe("2024-01-01T12:00:00.000Z", 7.2)
+        self.assertEqual(self.write.call_count, 1)
+        self.assertEqual(self.coordinator.suppressed_writes, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Test persisting and restoring the last-known data snapshot.
+
+These tests need Home Assistant's test harness
+(pytest-homeassistant-custom-component) and are skipped otherwise.
+"""
+import unittest
+from unittest.mock import Mock, patch
+
+from tests.conftest import HomeAssistantTestCase
+
+
+class TestSnapshot(HomeAssistantTestCase):
+    """Save a snapshot with one coordinator and restore it with another."""
+
+    async def test_restores_without_requests(self):
+        """A saved snapshot is restored as data without contacting the API."""
+        first = self.make_coordinator()
+        await first.async_refresh()
+        await first.store.async_save(first._data_to_save())
+        requests_before = sum(self.server.request_counts.values())
+
+        second = self.make_coordinator()
+        await second.async_load_cache()
+        self.assertEqual(second.data, first.data)
+        self.assertTrue(second.data_restored)
+        self.assertEqual(second.data_fetched_at, first.data_fetched_at)
+        self.assertEqual(sum(self.server.request_counts.values()), requests_before)
+
+    async def test_identical_live_data_notifies_listeners(self):
+        """Live data replacing an identical snapshot still wakes listeners, once."""
+        first = self.make_coordinator()
+        await first.async_refresh()
+        await first.store.async_save(first._data_to_save())
+
+        second = self.make_coordinator()
+        await second.async_load_cache()
+        listener = Mock()
+        self.addCleanup(second.async_add_listener(listener))
+        await second.async_refresh()
+        await second.async_refresh()
+        self.assertFalse(second.data_restored)
+        self.assertEqual(listener.call_count, 1)
+
+    async def test_unchanged_data_is_not_saved_again(self):
+        """Polls returning the same data schedule no save; replacing a restored snapshot does."""
+        first = self.make_coordinator()
+        await first.async_refresh()
+        await first.store.async_save(first._data_to_save())
+        with patch.object(first.store, "async_delay_save") as delay_save:
+            await first.async_refresh()
+        delay_save.assert_not_called()
+
+        second = self.make_coordinator()
+        await second.async_load_cache()
+        with patch.object(second.store, "async_delay_save") as delay_save:
+            await second.async_refresh()
+            await second.async_refresh()
+        self.assertEqual(delay_save.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
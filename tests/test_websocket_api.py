@@ -0,0 +1,118 @@
+"""Test the websocket API used by the frontend card."""
+import unittest
+from unittest.mock import Mock
+
+from tests.conftest import HomeAssistantTestCase
+
+from custom_components.virtualpoolcare.measurements import PoolMeasurements
+from custom_components.virtualpoolcare.websocket_api import readings_diff
+
+
+def payload(**readings) -> dict:
+    return {"device_serial": "SERIAL", "fetched_at": None, "restored": False, "readings": readings}
+
+
+class TestReadingsDiff(unittest.TestCase):
+    """Test diffing two readings payloads."""
+
+    def test_unchanged(self):
+        self.assertEqual(readings_diff(payload(ph={"value": 7.2}), payload(ph={"value": 7.2})), {})
+
+    def test_changed_fields_only(self):
+        """Only changed fields of changed readings are sent; dropped fields are None."""
+        old = payload(ph={"value": 7.2, "ok_min": 7.0, "trend": "up"}, orp={"value": 700})
+        new = payload(ph={"value": 7.4, "ok_min": 7.0}, orp={"value": 700})
+        self.assertEqual(readings_diff(old, new), {"readings": {"ph": {"value": 7.4, "trend": None}}})
+
+    def test_added_and_removed_readings(self):
+        """New readings are sent whole, removed ones by name, with changed top-level fields."""
+        old = {**payload(ph={"value": 7.2}), "restored": True}
+        new = payload(orp={"value": 700})
+        self.assertEqual(
+            readings_diff(old, new),
+            {"restored": False, "readings": {"orp": {"value": 700}}, "removed": ["ph"]},
+        )
+
+
+class TestWebsocketCommands(HomeAssistantTestCase):
+    """Call the command handlers with a coordinator fed by the stand-in server."""
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.coordinator = self.make_coordinator()
+        await self.coordinator.async_refresh()
+        self.hass.data["virtualpoolcare"] = {"test": self.coordinator}
+        self.serial = list(self.coordinator.data)[1]
+        self.connection = Mock(subscriptions={})
+
+    def events(self) -> list:
+        return [call.args[0]["event"] for call in self.connection.send_message.call_args_list]
+
+    async def test_readings(self):
+        """All readings of the device come with thresholds, trend and rolling statistics."""
+        from custom_components.virtualpoolcare.websocket_api import websocket_readings
+
+        websocket_readings(self.hass, self.connection, {"id": 1, "device_serial": self.serial.lower()})
+        result = self.connection.send_result.call_args.args[1]
+        self.assertEqual(result["device_serial"], self.serial)
+        self.assertEqual(set(result["readings"]), {"temperature", "ph", "orp", "salinity"})
+        ph = result["readings"]["ph"]
+        self.assertEqual(ph["value"], self.coordinator.data[self.serial].get("ph").value)
+        self.assertIn("warning_high", ph)
+        self.assertEqual(ph["stats"]["24h"]["count"], 1)
+        self.assertEqual(ph["trend"], "stable")
+
+    async def test_unknown_device(self):
+        from custom_components.virtualpoolcare.websocket_api import websocket_readings
+
+        websocket_readings(self.hass, self.connection, {"id": 1, "device_serial": "UNKNOWN"})
+        self.assertEqual(self.connection.send_error.call_args.args[1], "not_found")
+
+    async def test_subscription_sends_only_changes(self):
+        """The first event is the whole payload, later ones only what changed."""
+        from custom_components.virtualpoolcare.websocket_api import websocket_subscribe_readings
+
+        websocket_subscribe_readings(self.hass, self.connection, {"id": 5})
+        first = self.events()[0]
+        self.assertTrue(first["full"])
+        serial = first["device_serial"]
+
+        # An unchanged refresh sends nothing
+        await self.coordinator.async_refresh()
+        self.assertEqual(len(self.events()), 1)
+
+        response = self.coordinator.data[serial].as_response()
+        for entry in response["data"]:
+            if entry["name"] == "ph":
+                entry["value"] = 6.9
+        self.coordinator.async_set_updated_data({**self.coordinator.data, serial: PoolMeasurements.from_response(response)})
+        self.assertEqual(self.events()[1]["readings"], {"ph": {"value": 6.9}})
+        self.assertNotIn("removed", self.events()[1])
+
+        # Unsubscribing removes the coordinator listener
+        self.connection.subscriptions.pop(5)()
+        self.coordinator.async_set_updated_data({})
+        self.assertEqual(len(self.events()), 2)
+
+    async def test_subscription_ends_when_entry_unloads(self):
+        """Unloading the entry ends its subscriptions with an unloaded event."""
+        from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+        from custom_components.virtualpoolcare.const import SIGNAL_ENTRY_UNLOADED
+        from custom_components.virtualpoolcare.websocket_api import websocket_subscribe_readings
+
+        websocket_subscribe_readings(self.hass, self.connection, {"id": 5})
+        async_dispatcher_send(self.hass, SIGNAL_ENTRY_UNLOADED, "other")
+        self.assertEqual(len(self.events()), 1)
+
+        async_dispatcher_send(self.hass, SIGNAL_ENTRY_UNLOADED, "test")
+        self.assertEqual(self.events()[1], {"unloaded": True})
+        self.coordinator.async_set_updated_data({})
+        self.assertEqual(len(self.events()), 2)
+
+        # The client's later unsubscribe is harmless
+        self.connection.subscriptions.pop(5)()
+
+
+if __name__ == "__main__":
+    unittest.main()